@@ -0,0 +1,229 @@
+"""Benchmark of the authenticated request hot path.
+
+Compares the lock-free token read in `ClientBase` against the previous
+behaviour, where every authenticated request acquired `_auth_lock` and
+requests waiting for a login were released one at a time through the lock.
+
+Two measurements are made for N concurrent requests in three scenarios: a
+valid token is stored ("warm"), a valid token is stored while a background
+refresh holds the lock ("refreshing"), and no token is stored so a single
+login is needed ("cold"):
+
+- **auth stage**: N concurrent calls to `_current_token()`, the step every
+  authenticated request goes through before it is sent. Reports the median
+  and slowest completion time and the number of logins.
+- **end to end**: N concurrent `async_get_servers()` calls against a local
+  aiohttp server running on its own thread, over already open connections.
+  Reports wall time.
+
+Usage:
+    python benchmarks/auth_hot_path.py [--requests 500] [--rounds 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from typing import Dict, List
+
+import aiohttp
+from aiohttp import web
+
+from bsm_api_client import AuthError, BedrockServerManagerApi
+
+
+class LockedTokenClient(BedrockServerManagerApi):
+    """Emulates the previous hot path: every request takes the auth lock."""
+
+    async def _current_token(self, url: str, is_retry: bool = False) -> str:
+        async with self._auth_lock:
+            if not self._jwt_token and not is_retry:
+                await self.authenticate()
+        if not self._jwt_token:
+            raise AuthError("Authentication required but no token available.")
+        return self._jwt_token
+
+
+CLIENTS = (
+    ("locked (previous)", LockedTokenClient),
+    ("lock-free", BedrockServerManagerApi),
+)
+
+
+async def start_server(login_delay: float, state: Dict[str, int]) -> web.AppRunner:
+    async def login(request: web.Request) -> web.Response:
+        state["logins"] += 1
+        await asyncio.sleep(login_delay)
+        return web.json_response({"access_token": "token", "token_type": "bearer"})
+
+    async def servers(request: web.Request) -> web.Response:
+        return web.json_response({"status": "success", "servers": []})
+
+    app = web.Application()
+    app.router.add_post("/auth/token", login)
+    app.router.add_get("/api/servers", servers)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner
+
+
+class ServerThread(threading.Thread):
+    """Runs the fake manager on its own event loop so that it does not
+    compete with the client for loop time."""
+
+    def __init__(self, login_delay: float) -> None:
+        super().__init__(daemon=True)
+        self.login_delay = login_delay
+        self.state = {"logins": 0}
+        self.port = 0
+        self._ready = threading.Event()
+        self._loop = asyncio.new_event_loop()
+
+    def run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        runner = self._loop.run_until_complete(
+            start_server(self.login_delay, self.state)
+        )
+        self.port = runner.addresses[0][1]
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.run_until_complete(runner.cleanup())
+
+    def start_and_wait(self) -> None:
+        self.start()
+        self._ready.wait()
+
+    def stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self.join()
+
+
+SCENARIOS = ("warm", "refreshing", "cold")
+
+
+async def prepare(client: BedrockServerManagerApi, scenario: str) -> asyncio.Task:
+    """Puts `client` into the token state of `scenario`.
+
+    - warm: a valid token is stored.
+    - refreshing: a valid token is stored while a background refresh holds
+      the auth lock for the duration of a login.
+    - cold: no token is stored, so one login is needed.
+    """
+    await client.authenticate()
+    if scenario == "cold":
+        client._set_token(None)
+
+    async def refresh() -> None:
+        if scenario == "refreshing":
+            async with client._auth_lock:
+                await client._fetch_token()
+
+    task = asyncio.create_task(refresh())
+    await asyncio.sleep(0)
+    return task
+
+
+async def auth_stage(
+    client_cls: type, url: str, state: Dict[str, int], requests: int, scenario: str
+) -> Dict[str, float]:
+    async with aiohttp.ClientSession() as session:
+        client = client_cls(
+            url,
+            username="admin",
+            password="password",
+            session=session,
+            token_refresh=False,
+        )
+        refresh = await prepare(client, scenario)
+        logins_before = state["logins"]
+        started = time.perf_counter()
+        done: List[float] = []
+
+        async def one() -> None:
+            await client._current_token(url)
+            done.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(one() for _ in range(requests)))
+        await refresh
+    return {
+        "p50": statistics.median(done),
+        "max": max(done),
+        "logins": state["logins"] - logins_before,
+    }
+
+
+async def end_to_end(
+    client_cls: type, url: str, requests: int, scenario: str
+) -> Dict[str, float]:
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        client = client_cls(
+            url,
+            username="admin",
+            password="password",
+            session=session,
+            token_refresh=False,
+        )
+        await client.authenticate()
+        # Open the connections up front so connection setup is not timed.
+        await asyncio.gather(*(client.async_get_servers() for _ in range(requests)))
+        refresh = await prepare(client, scenario)
+        started = time.perf_counter()
+        await asyncio.gather(*(client.async_get_servers() for _ in range(requests)))
+        wall = time.perf_counter() - started
+        await refresh
+        return {"wall": wall}
+
+
+async def main(requests: int, rounds: int, login_delay: float) -> None:
+    server = ServerThread(login_delay)
+    server.start_and_wait()
+    url = f"http://127.0.0.1:{server.port}"
+    try:
+        print(
+            f"{requests} concurrent authenticated requests, best of {rounds} rounds, "
+            f"login takes {login_delay * 1000:.0f} ms"
+        )
+        print()
+        print(f"{'auth stage':<32}{'p50 ms':>10}{'max ms':>10}{'logins':>8}")
+        for scenario in SCENARIOS:
+            for label, cls in CLIENTS:
+                results = [
+                    await auth_stage(cls, url, server.state, requests, scenario)
+                    for _ in range(rounds)
+                ]
+                best = min(results, key=lambda r: r["max"])
+                name = f"{label}, {scenario}"
+                print(
+                    f"{name:<32}{best['p50'] * 1000:>10.2f}"
+                    f"{best['max'] * 1000:>10.2f}{best['logins']:>8}"
+                )
+        print()
+        print(f"{'end to end':<32}{'wall ms':>10}")
+        for scenario in SCENARIOS:
+            for label, cls in CLIENTS:
+                results = [
+                    await end_to_end(cls, url, requests, scenario)
+                    for _ in range(rounds)
+                ]
+                best = min(r["wall"] for r in results)
+                print(f"{f'{label}, {scenario}':<32}{best * 1000:>10.1f}")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--login-delay",
+        type=float,
+        default=0.05,
+        help="Seconds the fake server takes to issue a token.",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.rounds, args.login_delay))
@@ -13,9 +13,47 @@ from .exceptions import (
     InvalidInputError,
     OperationFailedError,
     APIServerSideError,
+    CircuitOpenError,
+    ResponseTooLargeError,
 )
 from .api_client import BedrockServerManagerApi
-from .websocket_client import WebSocketClient
+from .batching import BatchStats, ServerBatchConfig
+from .circuit_breaker import CircuitBreakerConfig, CircuitBreakerStats, CircuitState
+from .conditional import ConditionalStats
+from .connection_pool import ConnectionPoolConfig, PoolStats
+from .event_hub import (
+    EventHub,
+    EventHubConfig,
+    EventHubStats,
+    OverflowPolicy,
+    Subscription,
+)
+from .exporter import ExporterConfig, MetricsExporter
+from .fleet import FleetClient, HostResult
+from .fleet_state import (
+    FleetState,
+    FleetStateConfig,
+    FleetStateStats,
+    ServerChange,
+    ServerStateUpdate,
+    server_state_from_event,
+)
+from .metrics import EndpointMetrics, MetricsConfig, MetricsSnapshot
+from .overview import OVERVIEW_FIELDS, ServerOverview
+from .rate_limit import LimiterStats
+from .response_cache import CacheStats, ResponseCacheConfig
+from .retry import RetryPolicy, RetryStats
+from .single_flight import SingleFlightStats
+from .sync_client import SyncBedrockServerManagerApi
+from .timeouts import TimeoutConfig, TimeoutProfile
+from .token_refresh import TokenRefreshConfig
+from .upload import UploadProgress
+from .websocket_client import (
+    HeartbeatConfig,
+    ReconnectPolicy,
+    WebSocketClient,
+    WebSocketStats,
+)
 
 __all__ = [
     "BedrockServerManagerApi",
@@ -27,7 +65,51 @@ __all__ = [
     "InvalidInputError",
     "OperationFailedError",
     "APIServerSideError",
+    "CircuitOpenError",
+    "ResponseTooLargeError",
     "WebSocketClient",
+    "ConnectionPoolConfig",
+    "PoolStats",
+    "SingleFlightStats",
+    "ResponseCacheConfig",
+    "CacheStats",
+    "ConditionalStats",
+    "RetryPolicy",
+    "RetryStats",
+    "CircuitBreakerConfig",
+    "CircuitBreakerStats",
+    "CircuitState",
+    "LimiterStats",
+    "TokenRefreshConfig",
+    "TimeoutConfig",
+    "TimeoutProfile",
+    "UploadProgress",
+    "MetricsConfig",
+    "MetricsSnapshot",
+    "EndpointMetrics",
+    "MetricsExporter",
+    "ExporterConfig",
+    "FleetClient",
+    "HostResult",
+    "ServerOverview",
+    "OVERVIEW_FIELDS",
+    "ServerBatchConfig",
+    "BatchStats",
+    "SyncBedrockServerManagerApi",
+    "ReconnectPolicy",
+    "WebSocketStats",
+    "EventHub",
+    "EventHubConfig",
+    "EventHubStats",
+    "OverflowPolicy",
+    "Subscription",
+    "HeartbeatConfig",
+    "FleetState",
+    "FleetStateConfig",
+    "FleetStateStats",
+    "ServerChange",
+    "ServerStateUpdate",
+    "server_state_from_event",
     "__version__",
 ]
 
@@ -0,0 +1,144 @@
+# src/bsm_api_client/batching.py
+"""Dataloader-style batching of per-server lookups onto the server list.
+
+This module provides the `ServerBatchConfig` dataclass accepted by
+`ClientBase` and the `ServerListLoader` used when `batch_server_lookups` is
+enabled. Per-server lookups requested in the same event-loop tick (or
+within `window` seconds of the first one) are queued, served by a single
+`GET /servers` request, and each caller receives its own server's entry.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.batching")
+
+ServerEntry = Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class ServerBatchConfig:
+    """Configuration for batching per-server lookups.
+
+    Attributes:
+        window: Seconds to wait after the first queued lookup before fetching
+            the server list. `0` batches only the lookups made in the same
+            event-loop tick.
+    """
+
+    window: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.window < 0:
+            raise ValueError("window cannot be negative.")
+
+
+@dataclass(frozen=True)
+class BatchStats:
+    """Counters describing per-server lookup batching.
+
+    Attributes:
+        batches: Server list fetches made to serve queued lookups.
+        lookups: Lookups served from a batch.
+        misses: Lookups for servers missing from the list, which fall back
+            to the per-server request.
+    """
+
+    batches: int
+    lookups: int
+    misses: int
+
+
+class ServerListLoader:
+    """Serves concurrent per-server lookups from one server list fetch."""
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[List[ServerEntry]]],
+        config: Optional[ServerBatchConfig] = None,
+    ) -> None:
+        """Initializes the loader.
+
+        Args:
+            fetch: Returns the entries of the server list.
+            config: Batching configuration. Defaults to `ServerBatchConfig()`.
+        """
+        self.config = config or ServerBatchConfig()
+        self._fetch = fetch
+        self._queue: List["asyncio.Future[Optional[ServerEntry]]"] = []
+        self._names: List[str] = []
+        self._tasks: "set[asyncio.Task]" = set()
+        self._batches = 0
+        self._lookups = 0
+        self._misses = 0
+
+    async def load(self, name: str) -> Optional[ServerEntry]:
+        """Returns the server list entry for `name`.
+
+        Args:
+            name: The server name.
+
+        Returns:
+            The entry from the batched server list, or `None` if the list
+            has no server with that name.
+
+        Raises:
+            APIError: If fetching the server list failed.
+        """
+        loop = asyncio.get_running_loop()
+        if not self._queue:
+            if self.config.window > 0:
+                loop.call_later(self.config.window, self._dispatch)
+            else:
+                loop.call_soon(self._dispatch)
+        future: "asyncio.Future[Optional[ServerEntry]]" = loop.create_future()
+        self._queue.append(future)
+        self._names.append(name)
+        entry = await future
+        if entry is None:
+            self._misses += 1
+        else:
+            self._lookups += 1
+        return entry
+
+    def _dispatch(self) -> None:
+        queue, names = self._queue, self._names
+        self._queue, self._names = [], []
+        if all(future.done() for future in queue):
+            return
+        self._batches += 1
+        _LOGGER.debug("Serving %d server lookups from one server list.", len(queue))
+        # Run the fetch in its own task so cancelling one caller does not
+        # cancel it for the others.
+        task = asyncio.ensure_future(self._resolve(queue, names))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(
+        self,
+        queue: List["asyncio.Future[Optional[ServerEntry]]"],
+        names: List[str],
+    ) -> None:
+        try:
+            servers = await self._fetch()
+        except asyncio.CancelledError:
+            for future in queue:
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in queue:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        by_name = {s.get("name"): s for s in servers if isinstance(s, dict)}
+        for future, name in zip(queue, names):
+            if not future.done():
+                future.set_result(by_name.get(name))
+
+    def stats(self) -> BatchStats:
+        """Returns a snapshot of the batching counters."""
+        return BatchStats(
+            batches=self._batches, lookups=self._lookups, misses=self._misses
+        )
@@ -0,0 +1,207 @@
+# src/bsm_api_client/circuit_breaker.py
+"""Circuit breaker that fails fast when a manager host is down.
+
+This module provides the `CircuitBreakerConfig` dataclass accepted by
+`ClientBase` and the `CircuitBreaker` state machine:
+
+- **closed**: requests flow normally; consecutive host failures are counted.
+- **open**: after `failure_threshold` consecutive failures, requests fail
+  immediately with `CircuitOpenError` until `recovery_timeout` elapses.
+- **half-open**: after the cooldown, up to `half_open_max_calls` trial
+  requests are let through. A success closes the circuit, a failure opens
+  it again for another cooldown.
+
+Only failures that indicate the host itself is unhealthy are counted:
+connection errors, timeouts and the configured gateway status codes. Other
+API errors (e.g. 404) prove the host is reachable and count as successes.
+"""
+
+import enum
+import logging
+import time
+from dataclasses import dataclass
+from typing import FrozenSet, Optional
+
+from .exceptions import APIError, CannotConnectError, CircuitOpenError
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.circuit_breaker")
+
+
+class CircuitState(str, enum.Enum):
+    """The state of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """Configuration for the per-host circuit breaker.
+
+    Attributes:
+        failure_threshold: Consecutive host failures that open the circuit.
+        recovery_timeout: Seconds the circuit stays open before trial requests
+            are allowed.
+        half_open_max_calls: Concurrent trial requests allowed while half-open.
+        failure_statuses: HTTP status codes counted as host failures.
+    """
+
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    half_open_max_calls: int = 1
+    failure_statuses: FrozenSet[int] = frozenset({502, 503, 504})
+
+    def __post_init__(self) -> None:
+        if self.failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1.")
+        if self.half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1.")
+
+
+@dataclass(frozen=True)
+class CircuitBreakerStats:
+    """A snapshot of circuit breaker state and counters.
+
+    Attributes:
+        state: The current `CircuitState`.
+        consecutive_failures: Host failures since the last success.
+        times_opened: How often the circuit has opened.
+        rejected: Requests failed fast while the circuit was open.
+    """
+
+    state: CircuitState
+    consecutive_failures: int
+    times_opened: int
+    rejected: int
+
+
+class CircuitBreaker:
+    """Tracks host health and rejects requests while the host is down."""
+
+    def __init__(
+        self, name: str, config: Optional[CircuitBreakerConfig] = None
+    ) -> None:
+        """
+        Args:
+            name: A label for the protected host, used in errors and logs.
+            config: The breaker configuration. Defaults to `CircuitBreakerConfig()`.
+        """
+        self._name = name
+        self._config = config or CircuitBreakerConfig()
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._times_opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state, moving from open to half-open once cooled down."""
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self._config.recovery_timeout
+        ):
+            _LOGGER.info(
+                "Circuit for %s is half-open; allowing a trial request.", self._name
+            )
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_in_flight = 0
+        return self._state
+
+    def before_call(self) -> None:
+        """Admits a request or raises if the circuit is open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                trial slots in use.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+        if (
+            state is CircuitState.HALF_OPEN
+            and self._half_open_in_flight < self._config.half_open_max_calls
+        ):
+            self._half_open_in_flight += 1
+            return
+        self._rejected += 1
+        retry_after = max(
+            0.0, self._opened_at + self._config.recovery_timeout - time.monotonic()
+        )
+        raise CircuitOpenError(
+            f"Circuit breaker open for {self._name}: failing fast after "
+            f"{self._consecutive_failures} consecutive failures.",
+            retry_after=retry_after,
+        )
+
+    def is_host_failure(self, error: BaseException) -> bool:
+        """Returns whether `error` indicates the host is unhealthy."""
+        if isinstance(error, CircuitOpenError):
+            return False
+        if isinstance(error, CannotConnectError):
+            return True
+        if isinstance(error, APIError):
+            return error.status_code in self._config.failure_statuses
+        return False
+
+    def record_success(self) -> None:
+        """Records a request that reached the host."""
+        if self._state is not CircuitState.CLOSED:
+            _LOGGER.info("Circuit for %s closed; host is responding again.", self._name)
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._half_open_in_flight = 0
+
+    def record_failure(self) -> None:
+        """Records a host failure, opening the circuit if the threshold is hit."""
+        self._consecutive_failures += 1
+        if self._state is CircuitState.HALF_OPEN or (
+            self._state is CircuitState.CLOSED
+            and self._consecutive_failures >= self._config.failure_threshold
+        ):
+            self._open()
+
+    def record(self, error: Optional[BaseException]) -> None:
+        """Records the outcome of an admitted request.
+
+        Args:
+            error: The exception the request raised, or `None` on success.
+        """
+        if isinstance(error, CircuitOpenError):
+            return
+        if error is not None and self.is_host_failure(error):
+            self.record_failure()
+        elif error is None or isinstance(error, APIError):
+            self.record_success()
+        elif self._state is CircuitState.HALF_OPEN:
+            # Cancelled or unexpected error: free the trial slot.
+            self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._half_open_in_flight = 0
+        self._times_opened += 1
+        _LOGGER.warning(
+            "Circuit for %s opened after %d consecutive failures; failing fast for %.1fs.",
+            self._name,
+            self._consecutive_failures,
+            self._config.recovery_timeout,
+        )
+
+    def reset(self) -> None:
+        """Forces the circuit closed and clears the failure count."""
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._half_open_in_flight = 0
+
+    def stats(self) -> CircuitBreakerStats:
+        """Returns a snapshot of the breaker's state and counters."""
+        return CircuitBreakerStats(
+            state=self.state,
+            consecutive_failures=self._consecutive_failures,
+            times_opened=self._times_opened,
+            rejected=self._rejected,
+        )
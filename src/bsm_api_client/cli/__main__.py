@@ -24,6 +24,7 @@ from .system import system
 from .world import world
 from .account import account
 from .content import content
+from .exporter import exporter
 from .main_menus import main_menu
 from .decorators import AsyncGroup
 
@@ -70,6 +71,7 @@ cli.add_command(system)
 cli.add_command(world)
 cli.add_command(account)
 cli.add_command(content)
+cli.add_command(exporter)
 
 if __name__ == "__main__":
     cli()
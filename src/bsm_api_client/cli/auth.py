@@ -5,7 +5,7 @@ from bsm_api_client import BedrockServerManagerApi, AuthError
 
 def _validate_and_get_url(url: str) -> str:
     """Validates and returns a url with a scheme."""
-    if not url.startswith("http://") and not url.startswith("https://"):
+    if not url.startswith(("http://", "https://", "unix://")):
         return f"http://{url}"
     return url
 
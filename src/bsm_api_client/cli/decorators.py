@@ -3,6 +3,10 @@ import functools
 import time
 import click
 from bsm_api_client.exceptions import AuthError
+from bsm_api_client.websocket_client import ReconnectPolicy
+
+# Survive a manager restart while monitoring, then fall back to polling.
+_MONITOR_RECONNECT = ReconnectPolicy(max_attempts=5)
 
 
 class AsyncGroup(click.Group):
@@ -49,7 +53,7 @@ async def monitor_task(
 
     # Try WebSocket first
     try:
-        ws_client = await client.websocket_connect()
+        ws_client = await client.websocket_connect(reconnect=_MONITOR_RECONNECT)
         async with ws_client:
             # No subscription needed for task updates as per documentation
             async for msg in ws_client.listen():
@@ -0,0 +1,55 @@
+import asyncio
+import click
+from bsm_api_client.exporter import ExporterConfig, MetricsExporter
+
+
+@click.command()
+@click.option(
+    "--host", default="127.0.0.1", show_default=True, help="Address to listen on."
+)
+@click.option(
+    "--port", default=9464, show_default=True, type=int, help="Port to listen on."
+)
+@click.option(
+    "--interval",
+    default=30.0,
+    show_default=True,
+    type=float,
+    help="Seconds between fleet collections.",
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    show_default=True,
+    type=int,
+    help="Maximum concurrent requests to the manager during a collection.",
+)
+@click.option(
+    "--process-info/--no-process-info",
+    default=True,
+    show_default=True,
+    help="Collect CPU and memory usage of running servers.",
+)
+@click.pass_context
+async def exporter(ctx, host, port, interval, concurrency, process_info):
+    """Serves client and fleet metrics for Prometheus on /metrics."""
+    client = ctx.obj.get("client")
+    if not client:
+        click.secho("You are not logged in.", fg="red")
+        return
+
+    config = ExporterConfig(
+        interval=interval, max_concurrency=concurrency, process_info=process_info
+    )
+    try:
+        async with MetricsExporter(client, config, host=host, port=port) as server:
+            click.secho(
+                f"Serving metrics on http://{host}:{server.port}/metrics "
+                "(Press CTRL+C to exit)",
+                fg="green",
+            )
+            await asyncio.Event().wait()
+    except OSError as e:
+        click.secho(f"Could not start the exporter: {e}", fg="red")
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        click.secho("\nExporter stopped.", fg="green")
@@ -5,8 +5,39 @@ import click
 import questionary
 from .decorators import pass_async_context, monitor_task
 from bsm_api_client.exceptions import AuthError
+from bsm_api_client.fleet_state import DEFAULT_STATE_TOPICS, server_state_from_event
 from bsm_api_client.models import InstallServerPayload, CommandPayload
 
+_STATUS_COLORS = {
+    "RUNNING": "green",
+    "STOPPED": "red",
+    "STARTING": "yellow",
+    "STOPPING": "yellow",
+    "INSTALLING": "bright_cyan",
+    "UPDATING": "bright_cyan",
+    "INSTALLED": "bright_magenta",
+    "UPDATED": "bright_magenta",
+    "UNKNOWN": "bright_black",
+}
+
+# Events arriving within this many seconds are handled in one refresh.
+_REFRESH_WINDOW = 0.25
+
+
+def _format_server_row(server_data):
+    """Returns the styled table line for one server."""
+    name = server_data.get("name", "N/A")
+    status = server_data.get("status", "UNKNOWN").upper()
+    version = server_data.get("version", "UNKNOWN")
+
+    status_color = _STATUS_COLORS.get(status, "red")
+
+    status_styled = click.style(f"{status:<10}", fg=status_color)
+    name_styled = click.style(name, fg="cyan")
+    version_styled = click.style(version, fg="bright_white")
+
+    return f"  {name_styled:<38} {status_styled:<20} {version_styled}"
+
 
 def _print_server_table(servers):
     """Prints a formatted table of server information to the console."""
@@ -18,31 +49,145 @@ def _print_server_table(servers):
         click.echo("  No servers found.")
     else:
         for server_data in servers:
-            name = server_data.get("name", "N/A")
-            status = server_data.get("status", "UNKNOWN").upper()
-            version = server_data.get("version", "UNKNOWN")
-
-            color_map = {
-                "RUNNING": "green",
-                "STOPPED": "red",
-                "STARTING": "yellow",
-                "STOPPING": "yellow",
-                "INSTALLING": "bright_cyan",
-                "UPDATING": "bright_cyan",
-                "INSTALLED": "bright_magenta",
-                "UPDATED": "bright_magenta",
-                "UNKNOWN": "bright_black",
-            }
-            status_color = color_map.get(status, "red")
-
-            status_styled = click.style(f"{status:<10}", fg=status_color)
-            name_styled = click.style(name, fg="cyan")
-            version_styled = click.style(version, fg="bright_white")
-
-            click.echo(f"  {name_styled:<38} {status_styled:<20} {version_styled}")
+            click.echo(_format_server_row(server_data))
     click.echo("-" * 65)
 
 
+class _StatusBoard:
+    """The live server table of `server list --loop`.
+
+    Keeps the rows currently on screen and, on a terminal, rewrites only the
+    lines of servers whose row changed. The screen is cleared and redrawn
+    when servers are added, removed or reordered.
+    """
+
+    _TITLE = "--- Bedrock Servers Status (Press CTRL+C to exit) ---"
+    # Screen line of the first server: title, header and separator come first.
+    _FIRST_ROW_LINE = 4
+
+    def __init__(self, client, server_name=None):
+        self._client = client
+        self._server_name = server_name
+        self._rows = {}
+        self._shown = None
+
+    def _wanted(self, server_data):
+        return not self._server_name or server_data.get("name") == self._server_name
+
+    def replace(self, servers):
+        """Sets the full server list."""
+        self._rows = {s.get("name", "N/A"): s for s in servers if self._wanted(s)}
+
+    def merge(self, servers):
+        """Updates or adds the given servers' rows."""
+        for server_data in servers:
+            if self._wanted(server_data):
+                name = server_data["name"]
+                self._rows[name] = {**self._rows.get(name, {}), **server_data}
+
+    def remove(self, names):
+        """Drops the given servers' rows."""
+        for name in names:
+            self._rows.pop(name, None)
+
+    async def refresh(self):
+        """Fetches the server list and redraws what changed."""
+        response = await self._client.async_get_servers()
+        self.replace(response.servers)
+        self.render()
+
+    async def apply_events(self, messages):
+        """Applies a batch of events with at most one fetch, then redraws."""
+        updates = []
+        for message in messages:
+            update = server_state_from_event(message)
+            if update is None:
+                # A fetch returns the latest state, superseding the payloads.
+                await self.refresh()
+                return
+            if update.complete:
+                updates.clear()
+            updates.append(update)
+        for update in updates:
+            if update.complete:
+                self.replace(update.servers)
+            else:
+                self.merge(update.servers)
+            self.remove(update.removed)
+        self.render()
+
+    def invalidate(self):
+        """Forces a full redraw on the next render, e.g. after other output."""
+        self._shown = None
+
+    def render(self):
+        lines = {name: _format_server_row(row) for name, row in self._rows.items()}
+        if lines == self._shown:
+            return
+        interactive = click.get_text_stream("stdout").isatty()
+        if self._shown is None or not interactive or list(lines) != list(self._shown):
+            click.clear()
+            click.secho(self._TITLE, fg="magenta", bold=True)
+            _print_server_table(list(self._rows.values()))
+        else:
+            for index, (name, line) in enumerate(lines.items()):
+                if self._shown[name] != line:
+                    row = self._FIRST_ROW_LINE + index
+                    click.echo(f"\x1b[{row};1H\x1b[2K{line}", nl=False)
+            # Park the cursor below the closing separator.
+            below = self._FIRST_ROW_LINE + len(lines) + 1
+            click.echo(f"\x1b[{below};1H", nl=False)
+        self._shown = lines
+
+
+async def _watch_server_events(ws_client, board):
+    """Subscribes to status events and refreshes `board` until the stream ends.
+
+    Events are handled in batches: the first one opens a `_REFRESH_WINDOW`
+    and everything that arrives within it is applied in a single refresh.
+    """
+    for topic in DEFAULT_STATE_TOPICS:
+        await ws_client.subscribe(topic)
+
+    queue = asyncio.Queue()
+
+    async def read():
+        try:
+            async for message in ws_client.listen():
+                queue.put_nowait(message)
+        finally:
+            queue.put_nowait(None)
+
+    reader = asyncio.create_task(read())
+    loop = asyncio.get_running_loop()
+    try:
+        ended = False
+        while not ended:
+            message = await queue.get()
+            if message is None:
+                break
+            batch = [message]
+            deadline = loop.time() + _REFRESH_WINDOW
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    message = await asyncio.wait_for(queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if message is None:
+                    ended = True
+                    break
+                batch.append(message)
+            await board.apply_events(batch)
+        # Re-raise a listen() failure.
+        await reader
+    finally:
+        reader.cancel()
+        await asyncio.gather(reader, return_exceptions=True)
+
+
 @click.group()
 def server():
     """Manages servers."""
@@ -75,36 +220,16 @@ async def list_servers(ctx, loop, server_name):
 
     try:
         if loop:
+            board = _StatusBoard(client, server_name)
             # Initial display
-            click.clear()
-            click.secho(
-                "--- Bedrock Servers Status (Press CTRL+C to exit) ---",
-                fg="magenta",
-                bold=True,
-            )
-            await _display_status()
+            await board.refresh()
 
             # Try to use WebSocket for updates
             try:
                 ws_client = await client.websocket_connect()
 
                 async with ws_client:
-                    # Subscribe to multiple topics for comprehensive status updates
-                    await ws_client.subscribe("event:after_server_statuses_updated")
-                    await ws_client.subscribe("event:after_server_start")
-                    await ws_client.subscribe("event:after_server_stop")
-                    await ws_client.subscribe("event:after_server_updated")
-                    await ws_client.subscribe("event:after_delete_server_data")
-
-                    # Listen for updates
-                    async for _ in ws_client.listen():
-                        click.clear()
-                        click.secho(
-                            "--- Bedrock Servers Status (Press CTRL+C to exit) ---",
-                            fg="magenta",
-                            bold=True,
-                        )
-                        await _display_status()
+                    await _watch_server_events(ws_client, board)
 
             except (KeyboardInterrupt, click.Abort):
                 raise
@@ -118,30 +243,12 @@ async def list_servers(ctx, loop, server_name):
                     # Retry WebSocket once
                     ws_client = await client.websocket_connect()
                     async with ws_client:
-                        await ws_client.subscribe("event:after_server_statuses_updated")
-                        async for _ in ws_client.listen():
-                            click.clear()
-                            click.secho(
-                                "--- Bedrock Servers Status (Press CTRL+C to exit) ---",
-                                fg="magenta",
-                                bold=True,
-                            )
-                            await _display_status()
+                        await _watch_server_events(ws_client, board)
                 except Exception as e:
                     click.secho(
                         f"WebSocket retry failed ({e}), falling back to polling...",
                         fg="yellow",
                     )
-                    await asyncio.sleep(2)
-                    while True:
-                        click.clear()
-                        click.secho(
-                            "--- Bedrock Servers Status (Press CTRL+C to exit) ---",
-                            fg="magenta",
-                            bold=True,
-                        )
-                        await _display_status()
-                        await asyncio.sleep(5)
             except Exception as e:
                 # Fallback to polling if WebSocket fails
                 click.secho(
@@ -151,16 +258,12 @@ async def list_servers(ctx, loop, server_name):
 
             # If we are here, WebSocket failed or closed. Fallback to polling.
             await asyncio.sleep(2)
+            board.invalidate()
             while True:
-                click.clear()
-                click.secho(
-                    "--- Bedrock Servers Status (Press CTRL+C to exit) ---",
-                    fg="magenta",
-                    bold=True,
-                )
                 try:
-                    await _display_status()
+                    await board.refresh()
                 except Exception as e:
+                    board.invalidate()
                     click.secho(f"Error refreshing status: {e}", fg="red")
                 await asyncio.sleep(5)
         else:
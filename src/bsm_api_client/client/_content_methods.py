@@ -5,7 +5,7 @@ This module provides the `ContentMethodsMixin` class, which includes methods
 for managing server content such as backups, worlds, and addons.
 """
 import logging
-from typing import Any, Dict, Optional, List, TYPE_CHECKING
+from typing import Any, Dict, Optional, List, Type, TYPE_CHECKING
 from ..models import (
     RestoreTypePayload,
     BackupActionPayload,
@@ -15,9 +15,10 @@ from ..models import (
     ContentListResponse,
     ActionResponse,
 )
+from ..upload import DEFAULT_UPLOAD_CHUNK_SIZE, ProgressCallback
 
 if TYPE_CHECKING:
-    from ..client_base import ClientBase
+    from ..client_base import ClientBase, ModelT
 
 _LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.content")
 
@@ -43,6 +44,21 @@ class ContentMethodsMixin:
             is_retry: bool = False,
         ) -> Any: ...
 
+        def _validate_response(
+            self: "ClientBase", model_cls: Type[ModelT], data: Any
+        ) -> ModelT: ...
+
+        async def _upload(
+            self: "ClientBase",
+            path: str,
+            file_path: str,
+            field_name: str = "file",
+            content_type: str = "application/octet-stream",
+            chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+            progress: Optional[ProgressCallback] = None,
+            max_bytes_per_second: Optional[float] = None,
+        ) -> Any: ...
+
     async def async_list_server_backups(
         self, server_name: str, backup_type: str
     ) -> BackupRestoreResponse:
@@ -77,7 +93,7 @@ class ContentMethodsMixin:
             f"/server/{server_name}/backup/list/{bt_lower}",
             authenticated=True,
         )
-        return BackupRestoreResponse.model_validate(response)
+        return self._validate_response(BackupRestoreResponse, response)
 
     async def async_restore_select_backup_type(
         self, server_name: str, payload: RestoreTypePayload
@@ -112,7 +128,7 @@ class ContentMethodsMixin:
         """
         _LOGGER.debug("Fetching available world files from /content/worlds")
         response = await self._request("GET", "/content/worlds", authenticated=True)
-        return ContentListResponse.model_validate(response)
+        return self._validate_response(ContentListResponse, response)
 
     async def async_get_content_addons(self) -> ContentListResponse:
         """Lists available addon files (.mcpack, .mcaddon).
@@ -122,7 +138,7 @@ class ContentMethodsMixin:
         """
         _LOGGER.debug("Fetching available addon files from /content/addons")
         response = await self._request("GET", "/content/addons", authenticated=True)
-        return ContentListResponse.model_validate(response)
+        return self._validate_response(ContentListResponse, response)
 
     async def async_trigger_server_backup(
         self, server_name: str, payload: BackupActionPayload
@@ -169,46 +185,37 @@ class ContentMethodsMixin:
         )
         return ActionResponse.model_validate(response)
 
-    async def async_upload_content(self, file_path: str) -> Dict[str, Any]:
+    async def async_upload_content(
+        self,
+        file_path: str,
+        progress: Optional[ProgressCallback] = None,
+        max_bytes_per_second: Optional[float] = None,
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    ) -> Dict[str, Any]:
         """Uploads a content file (e.g., .mcworld, .mcaddon) to the server.
 
+        The file is streamed in chunks rather than read into memory, and the
+        file handle is always closed, even if the upload fails.
+
         Args:
             file_path: The local path to the file to upload.
+            progress: Optional callback (sync or async) called with an
+                `UploadProgress` (bytes sent, total, rate) after each chunk.
+            max_bytes_per_second: Optional bandwidth cap for the upload.
+            chunk_size: Size of the chunks read from the file.
 
         Returns:
             A dictionary containing the API response.
         """
-        import aiohttp
-        import os
-
         _LOGGER.info("Uploading content file: %s", file_path)
-        data = aiohttp.FormData()
-        data.add_field(
-            "file",
-            open(file_path, "rb"),
-            filename=os.path.basename(file_path),
-            content_type="application/octet-stream",
+        return await self._upload(
+            "/content/upload",
+            file_path,
+            chunk_size=chunk_size,
+            progress=progress,
+            max_bytes_per_second=max_bytes_per_second,
         )
 
-        # Note: aiohttp requires direct session usage for multipart/form-data
-        # We bypass the generic _request helper here.
-        url = f"{self._server_root_url}/api/content/upload"
-        headers = {}
-        if self._jwt_token:
-            headers["Authorization"] = f"Bearer {self._jwt_token}"
-
-        async with self._session.post(url, data=data, headers=headers) as response:
-            if response.status == 401 and not self._is_retrying:
-                _LOGGER.info("Token expired, attempting to refresh and retry.")
-                self._is_retrying = True
-                await self._authenticate()
-                # Clear the flag before retrying
-                self._is_retrying = False
-                return await self.async_upload_content(file_path)
-
-            await self._handle_api_error(response, "/api/content/upload")
-            return await response.json()
-
     async def async_reset_server_world(self, server_name: str) -> ActionResponse:
         """Resets the current world of a server.
 
@@ -7,9 +7,7 @@ These methods handle operations such as getting system information, managing
 players, and installing new servers.
 """
 import logging
-import aiohttp
-from typing import Any, Dict, Optional, TYPE_CHECKING
-from ..exceptions import APIError, CannotConnectError
+from typing import Any, Dict, Optional, Type, Union, TYPE_CHECKING
 from ..models import (
     AddPlayersPayload,
     SettingItem,
@@ -21,7 +19,7 @@ from ..models import (
 )
 
 if TYPE_CHECKING:
-    from ..client_base import ClientBase
+    from ..client_base import ClientBase, DownloadDestination, ModelT
 
 _LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.manager")
 
@@ -42,6 +40,20 @@ class ManagerMethodsMixin:
             is_retry: bool = False,
         ) -> Any: ...
 
+        def _validate_response(
+            self: "ClientBase", model_cls: Type[ModelT], data: Any
+        ) -> ModelT: ...
+
+        async def _download(
+            self: "ClientBase",
+            path: str,
+            destination: Optional["DownloadDestination"] = None,
+            max_bytes: Optional[int] = None,
+            chunk_size: int = ...,
+            accept: str = "*/*",
+            authenticated: bool = True,
+        ) -> Union[bytes, int]: ...
+
     async def async_get_info(self) -> GeneralApiResponse:
         """Gets system and application information from the manager.
 
@@ -50,7 +62,7 @@ class ManagerMethodsMixin:
         """
         _LOGGER.debug("Fetching manager system and application information from /info")
         response = await self._request(method="GET", path="/info", authenticated=False)
-        return GeneralApiResponse.model_validate(response)
+        return self._validate_response(GeneralApiResponse, response)
 
     async def async_scan_players(self) -> Dict[str, Any]:
         """Triggers a scan of player logs across all servers.
@@ -150,56 +162,38 @@ class ManagerMethodsMixin:
             method="POST", path="/settings/reload", authenticated=True
         )
 
-    async def async_get_panorama_image(self) -> bytes:
+    async def async_get_panorama_image(
+        self,
+        destination: Optional["DownloadDestination"] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Union[bytes, int]:
         """Retrieves the panorama background image.
 
+        The image is streamed from the server; pass `destination` to write it
+        to a file path or binary file object instead of returning it.
+
+        Args:
+            destination: Optional file path or binary file object to write the
+                image to.
+            max_bytes: Optional size limit; larger images raise
+                `ResponseTooLargeError`.
+
         Returns:
-            The raw bytes of the panorama image.
+            The raw bytes of the panorama image, or the number of bytes
+            written if `destination` is given.
 
         Raises:
             CannotConnectError: If a connection to the server cannot be established.
             APIError: For any other API-related errors.
         """
         _LOGGER.info("Fetching panorama image.")
-        # This request might return non-JSON data.
-        # The _request method expects JSON or handleable errors.
-        # We need to make a raw request or adapt _request.
-        # For now, let's assume _request can handle non-JSON if status is OK
-        # by returning the raw response object or its content.
-        # However, current _request tries to parse JSON.
-        # A direct session call is safer for binary data.
-
-        url = f"{self._server_root_url}/api/panorama"  # Assuming /api prefix is appropriate here
-        if "/api" not in self._api_base_segment:  # If base_path was not /api
-            url = f"{self._base_url}/panorama"
-
-        _LOGGER.debug("Request: GET %s for panorama image", url)
-        try:
-            async with self._session.get(
-                url,
-                headers={"Accept": "image/jpeg, */*"},  # Accept jpeg primarily
-                timeout=aiohttp.ClientTimeout(total=self._request_timeout),
-            ) as response:
-                _LOGGER.debug("Response Status for GET %s: %s", url, response.status)
-                if not response.ok:
-                    await self._handle_api_error(response, "/api/panorama")
-                    # Should be unreachable
-                    raise APIError(
-                        f"Panorama image request failed with status {response.status}"
-                    )
-                return await response.read()  # Returns bytes
-        except aiohttp.ClientError as e:
-            _LOGGER.error("AIOHTTP client error fetching panorama: %s", e)
-            raise CannotConnectError(
-                f"AIOHTTP Client Error fetching panorama: {e}", original_exception=e
-            ) from e
-        except APIError:  # Re-raise APIError from _handle_api_error
-            raise
-        except Exception as e:
-            _LOGGER.exception("Unexpected error fetching panorama: %s", e)
-            raise APIError(
-                f"An unexpected error occurred fetching panorama: {e}"
-            ) from e
+        return await self._download(
+            "/panorama",
+            destination,
+            max_bytes=max_bytes,
+            accept="image/jpeg, */*",
+            authenticated=False,
+        )
 
     async def async_prune_downloads(
         self, payload: PruneDownloadsPayload
@@ -28,7 +28,7 @@ class PluginMethodsMixin:
         response = await self._request(
             method="GET", path="/plugins", authenticated=True
         )
-        return PluginApiResponse.model_validate(response)
+        return self._validate_response(PluginApiResponse, response)
 
     async def async_set_plugin_status(
         self, plugin_name: str, payload: PluginStatusSetPayload
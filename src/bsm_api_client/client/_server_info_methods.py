@@ -5,20 +5,40 @@ This module provides the `ServerInfoMethodsMixin` class, which includes
 methods for retrieving information about server instances from the Bedrock
 Server Manager API.
 """
+import asyncio
 import logging
-from typing import Any, Dict, Optional, List, TYPE_CHECKING
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Optional,
+    List,
+    Type,
+    Union,
+    TYPE_CHECKING,
+)
 from urllib.parse import quote
 
-import aiohttp
-from ..exceptions import APIError, ServerNotFoundError, AuthError, CannotConnectError
+from ..exceptions import APIError, ServerNotFoundError
 from ..models import GeneralApiResponse
+from ..overview import DEFAULT_OVERVIEW_CONCURRENCY, OVERVIEW_FIELDS, ServerOverview
 
 if TYPE_CHECKING:
-    from ..client_base import ClientBase
+    from ..client_base import ClientBase, DownloadDestination, ModelT
 
 
 _LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.server_info")
 
+# Overview field -> the per-server method that fetches it.
+_OVERVIEW_METHODS = {
+    "status": "async_get_server_running_status",
+    "config_status": "async_get_server_config_status",
+    "version": "async_get_server_version",
+    "process_info": "async_get_server_process_info",
+}
+
 
 class ServerInfoMethodsMixin:
     """Mixin for server information endpoints."""
@@ -36,6 +56,24 @@ class ServerInfoMethodsMixin:
             is_retry: bool = False,
         ) -> Any: ...
 
+        def _validate_response(
+            self: "ClientBase", model_cls: Type[ModelT], data: Any
+        ) -> ModelT: ...
+
+        async def _download(
+            self: "ClientBase",
+            path: str,
+            destination: Optional["DownloadDestination"] = None,
+            max_bytes: Optional[int] = None,
+            chunk_size: int = ...,
+            accept: str = "*/*",
+            authenticated: bool = True,
+        ) -> Union[bytes, int]: ...
+
+        async def _batched_server_entry(
+            self: "ClientBase", server_name: str
+        ) -> Optional[Dict[str, Any]]: ...
+
     async def async_get_servers(self) -> GeneralApiResponse:
         """Retrieves a list of all detected server instances with their status and version.
 
@@ -44,7 +82,7 @@ class ServerInfoMethodsMixin:
         """
         _LOGGER.debug("Fetching server list from /api/servers")
         response_data = await self._request("GET", "/servers", authenticated=True)
-        return GeneralApiResponse.model_validate(response_data)
+        return self._validate_response(GeneralApiResponse, response_data)
 
     async def async_get_server_names(self) -> List[str]:
         """Fetches a list of server names.
@@ -122,16 +160,29 @@ class ServerInfoMethodsMixin:
             f"/server/{encoded_server_name}/process_info",
             authenticated=True,
         )
-        return GeneralApiResponse.model_validate(response)
-
-    async def async_get_world_icon_image(self, server_name: str) -> bytes:
+        return self._validate_response(GeneralApiResponse, response)
+
+    async def async_get_world_icon_image(
+        self,
+        server_name: str,
+        destination: Optional["DownloadDestination"] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Union[bytes, int]:
         """Retrieves the world icon image for a server.
 
+        The image is streamed from the server; pass `destination` to write it
+        to a file path or binary file object instead of returning it.
+
         Args:
             server_name: The name of the server.
+            destination: Optional file path or binary file object to write the
+                image to.
+            max_bytes: Optional size limit; larger images raise
+                `ResponseTooLargeError`.
 
         Returns:
-            The raw bytes of the world icon image.
+            The raw bytes of the world icon image, or the number of bytes
+            written if `destination` is given.
 
         Raises:
             ValueError: If `server_name` is empty.
@@ -143,89 +194,21 @@ class ServerInfoMethodsMixin:
         _LOGGER.info("Fetching world icon for server '%s'.", server_name)
 
         encoded_server_name = quote(server_name)
-        # Path is /api/server/{server_name}/world/icon.
-        # self._base_url already contains /api, so path for _request should be server/...
-        # However, for direct session call for binary data:
-        url = f"{self._base_url}/server/{encoded_server_name}/world/icon"
-
-        headers = {"Accept": "image/jpeg, */*"}
-        if self._jwt_token:
-            headers["Authorization"] = f"Bearer {self._jwt_token}"
-
-        _LOGGER.debug("Request: GET %s for world icon", url)
-        try:
-            async with self._session.get(
-                url,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=self._request_timeout),
-            ) as response:
-                _LOGGER.debug("Response Status for GET %s: %s", url, response.status)
-                if not response.ok:
-                    # Attempt re-authentication for 401, then retry or raise.
-                    # This logic is complex to duplicate from _request.
-                    # For simplicity in this direct call, we'll handle common errors directly.
-                    if (
-                        response.status == 401 and self._jwt_token
-                    ):  # Check if token was used
-                        _LOGGER.warning(
-                            "Received 401 for world icon, attempting token refresh and retry once."
-                        )
-                        async with self._auth_lock:  # Ensure only one refresh attempt
-                            self._jwt_token = None  # Clear potentially invalid token
-                            await self.authenticate()  # Attempt to get a new token
-
-                        if self._jwt_token:  # If new token obtained, retry the request
-                            headers["Authorization"] = f"Bearer {self._jwt_token}"
-                            async with self._session.get(
-                                url,
-                                headers=headers,
-                                timeout=aiohttp.ClientTimeout(
-                                    total=self._request_timeout
-                                ),
-                            ) as retry_response:
-                                if not retry_response.ok:
-                                    await self._handle_api_error(
-                                        retry_response,
-                                        f"/server/{encoded_server_name}/world/icon",
-                                    )
-                                    raise APIError(
-                                        f"World icon request failed with status {retry_response.status} after retry."
-                                    )
-                                return await retry_response.read()
-                        else:  # Failed to get new token
-                            raise AuthError(
-                                "Failed to re-authenticate for world icon request."
-                            )
-
-                    await self._handle_api_error(
-                        response, f"/server/{encoded_server_name}/world/icon"
-                    )
-                    raise APIError(
-                        f"World icon request failed with status {response.status}"
-                    )  # Should be caught by _handle_api_error
-                return await response.read()  # Returns bytes
-        except aiohttp.ClientError as e:
-            _LOGGER.error(
-                "AIOHTTP client error fetching world icon for '%s': %s", server_name, e
-            )
-            raise CannotConnectError(
-                f"AIOHTTP Client Error fetching world icon: {e}", original_exception=e
-            ) from e
-        except APIError:  # Re-raise APIError from _handle_api_error or auth failure
-            raise
-        except Exception as e:
-            _LOGGER.exception(
-                "Unexpected error fetching world icon for '%s': %s", server_name, e
-            )
-            raise APIError(
-                f"An unexpected error occurred fetching world icon: {e}"
-            ) from e
+        return await self._download(
+            f"/server/{encoded_server_name}/world/icon",
+            destination,
+            max_bytes=max_bytes,
+            accept="image/jpeg, */*",
+        )
 
     async def async_get_server_running_status(
         self, server_name: str
     ) -> GeneralApiResponse:
         """Checks if the Bedrock server process is currently running.
 
+        When the client batches server lookups, the status comes from a
+        shared `/servers` fetch and `data` only contains `running`.
+
         Args:
             server_name: The name of the server.
 
@@ -233,6 +216,12 @@ class ServerInfoMethodsMixin:
             A `GeneralApiResponse` object containing the running status.
         """
         _LOGGER.debug("Fetching running status for server '%s'", server_name)
+        server = await self._batched_server_entry(server_name)
+        if server is not None and server.get("status") is not None:
+            return GeneralApiResponse(
+                status="success",
+                data={"running": str(server["status"]).upper() == "RUNNING"},
+            )
         encoded_server_name = quote(server_name)
         # Path changed from /running_status to /status for the new API.
         response = await self._request(
@@ -240,7 +229,7 @@ class ServerInfoMethodsMixin:
             f"/server/{encoded_server_name}/status",
             authenticated=True,
         )
-        return GeneralApiResponse.model_validate(response)
+        return self._validate_response(GeneralApiResponse, response)
 
     async def async_get_server_config_status(
         self, server_name: str
@@ -260,11 +249,14 @@ class ServerInfoMethodsMixin:
             f"/server/{encoded_server_name}/config_status",
             authenticated=True,
         )
-        return GeneralApiResponse.model_validate(response)
+        return self._validate_response(GeneralApiResponse, response)
 
     async def async_get_server_version(self, server_name: str) -> GeneralApiResponse:
         """Gets the installed Bedrock server version.
 
+        When the client batches server lookups, the version comes from a
+        shared `/servers` fetch.
+
         Args:
             server_name: The name of the server.
 
@@ -272,13 +264,18 @@ class ServerInfoMethodsMixin:
             A `GeneralApiResponse` object containing the server version.
         """
         _LOGGER.debug("Fetching version for server '%s'", server_name)
+        server = await self._batched_server_entry(server_name)
+        if server is not None and server.get("version") is not None:
+            return GeneralApiResponse(
+                status="success", data={"version": server["version"]}
+            )
         encoded_server_name = quote(server_name)
         response = await self._request(
             "GET",
             f"/server/{encoded_server_name}/version",
             authenticated=True,
         )
-        return GeneralApiResponse.model_validate(response)
+        return self._validate_response(GeneralApiResponse, response)
 
     async def async_get_server_properties(self, server_name: str) -> GeneralApiResponse:
         """Retrieves the server's properties.
@@ -296,7 +293,7 @@ class ServerInfoMethodsMixin:
             f"/server/{encoded_server_name}/properties/get",
             authenticated=True,
         )
-        return GeneralApiResponse.model_validate(response)
+        return self._validate_response(GeneralApiResponse, response)
 
     async def async_get_server_permissions_data(
         self, server_name: str
@@ -316,7 +313,7 @@ class ServerInfoMethodsMixin:
             f"/server/{encoded_server_name}/permissions/get",
             authenticated=True,
         )
-        return GeneralApiResponse.model_validate(response)
+        return self._validate_response(GeneralApiResponse, response)
 
     async def async_get_server_allowlist(self, server_name: str) -> GeneralApiResponse:
         """Retrieves the server's allowlist.
@@ -334,4 +331,116 @@ class ServerInfoMethodsMixin:
             f"/server/{encoded_server_name}/allowlist/get",
             authenticated=True,
         )
-        return GeneralApiResponse.model_validate(response)
+        return self._validate_response(GeneralApiResponse, response)
+
+    async def async_iter_servers_overview(
+        self,
+        names: Optional[Iterable[str]] = None,
+        include: Iterable[str] = OVERVIEW_FIELDS,
+        max_concurrency: int = DEFAULT_OVERVIEW_CONCURRENCY,
+    ) -> AsyncIterator[ServerOverview]:
+        """Fetches an overview of many servers, yielding each as it completes.
+
+        The selected fields are fetched for every server concurrently, with
+        at most `max_concurrency` requests in flight. A failed request is
+        recorded in the server's `errors` instead of being raised, so one
+        bad server does not hold back or fail the others. Leaving the
+        iteration early cancels the requests still pending.
+
+        Args:
+            names: The servers to fetch. Defaults to every server from
+                `async_get_server_names`.
+            include: The fields to fetch, from `OVERVIEW_FIELDS`.
+            max_concurrency: Maximum number of requests in flight.
+
+        Yields:
+            A `ServerOverview` per server, in completion order.
+
+        Raises:
+            ValueError: If `include` names an unknown field or
+                `max_concurrency` is not positive.
+        """
+        fields = tuple(dict.fromkeys(include))
+        unknown = [f for f in fields if f not in _OVERVIEW_METHODS]
+        if unknown:
+            raise ValueError(
+                f"Unknown overview fields {unknown}; expected any of {OVERVIEW_FIELDS}."
+            )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        if names is None:
+            names = await self.async_get_server_names()
+        names = list(dict.fromkeys(names))
+        _LOGGER.debug(
+            "Fetching overview %s for %d servers (max %d concurrent requests).",
+            fields,
+            len(names),
+            max_concurrency,
+        )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(server_name: str, field: str) -> GeneralApiResponse:
+            async with semaphore:
+                return await getattr(self, _OVERVIEW_METHODS[field])(server_name)
+
+        async def overview(server_name: str) -> ServerOverview:
+            started = time.monotonic()
+            results = await asyncio.gather(
+                *(fetch(server_name, field) for field in fields),
+                return_exceptions=True,
+            )
+            values: Dict[str, GeneralApiResponse] = {}
+            errors: Dict[str, Exception] = {}
+            for field, result in zip(fields, results):
+                if isinstance(result, Exception):
+                    _LOGGER.debug(
+                        "Overview %s for server '%s' failed: %r",
+                        field,
+                        server_name,
+                        result,
+                    )
+                    errors[field] = result
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    values[field] = result
+            return ServerOverview(
+                server_name,
+                errors=errors,
+                elapsed=time.monotonic() - started,
+                **values,
+            )
+
+        tasks = [asyncio.create_task(overview(name)) for name in names]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def async_get_servers_overview(
+        self,
+        names: Optional[Iterable[str]] = None,
+        include: Iterable[str] = OVERVIEW_FIELDS,
+        max_concurrency: int = DEFAULT_OVERVIEW_CONCURRENCY,
+    ) -> Dict[str, ServerOverview]:
+        """Fetches an overview of many servers concurrently.
+
+        Takes the same arguments as `async_iter_servers_overview`.
+
+        Returns:
+            A `ServerOverview` per server, keyed by name in the order of
+            `names`, or of `async_get_server_names` if `names` is omitted.
+        """
+        if names is None:
+            names = await self.async_get_server_names()
+        names = list(dict.fromkeys(names))
+        results = {
+            overview.name: overview
+            async for overview in self.async_iter_servers_overview(
+                names, include, max_concurrency
+            )
+        }
+        return {name: results[name] for name in names}
@@ -8,18 +8,29 @@ method for interacting with the Bedrock Server Manager API.
 
 import aiohttp
 import asyncio
+import contextlib
 import logging
+import os
+import time
 from typing import (
     Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Iterator,
     Dict,
     Optional,
     Mapping,
     Union,
     List,
     Tuple,
+    Type,
+    TypeVar,
 )
 from urllib.parse import urlparse
 
+from pydantic import BaseModel
+
 # Import exceptions from the same package level
 from .exceptions import (
     APIError,
@@ -31,12 +42,58 @@ from .exceptions import (
     InvalidInputError,
     OperationFailedError,
     APIServerSideError,
+    ResponseTooLargeError,
+)
+from .batching import BatchStats, ServerBatchConfig, ServerEntry, ServerListLoader
+from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerStats
+from .conditional import ConditionalStats, ValidatorCache
+from .connection_pool import (
+    ConnectionPoolConfig,
+    PoolStats,
+    _PoolCounters,
+    _collect_pool_stats,
 )
+from .event_hub import EventHub, EventHubConfig
+from .json_codec import JsonCodec, resolve_json_codec
+from .metrics import ClientMetrics, MetricsConfig
 from .models import Token
-from .websocket_client import WebSocketClient
+from .response_cache import CacheStats, ResponseCache, ResponseCacheConfig
+from .retry import (
+    RetryPolicy,
+    RetryStats,
+    _RETRY_ACTIONS,
+    _RetryCounters,
+    call_with_retries,
+)
+from .rate_limit import LimiterStats, RequestLimiter
+from .single_flight import SingleFlight, SingleFlightStats
+from .timeouts import (
+    DEFAULT_REQUEST_TIMEOUT,
+    TimeoutConfig,
+    TimeoutProfile,
+    _TIMEOUT_OVERRIDE,
+    _TimeoutResolver,
+)
+from .token_refresh import TokenRefreshConfig, refresh_delay, token_expires_at
+from .upload import DEFAULT_UPLOAD_CHUNK_SIZE, ProgressCallback, iter_file_chunks
+from .websocket_client import HeartbeatConfig, ReconnectPolicy, WebSocketClient
 
 _LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.base")
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Methods that are safe to coalesce or replay without side effects.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Chunk size used when streaming binary downloads.
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+DownloadDestination = Union[str, "os.PathLike[str]", BinaryIO]
+
+# Requests sent over a Unix domain socket still need an absolute URL; the
+# connector ignores the host, which only ends up in the `Host` header.
+_UNIX_SOCKET_ROOT_URL = "http://localhost"
+
 
 class ClientBase:
     """Base class containing core API client logic.
@@ -48,6 +105,8 @@ class ClientBase:
     Attributes:
         _host: The hostname of the Bedrock Server Manager.
         _port: The port of the Bedrock Server Manager.
+        _unix_socket: The Unix domain socket path, if the manager is reached
+            over a local socket instead of TCP.
         _username: The username for authentication.
         _password: The password for authentication.
         _session: The `aiohttp.ClientSession` used for making requests.
@@ -62,19 +121,92 @@ class ClientBase:
         jwt_token: Optional[str] = None,
         session: Optional[aiohttp.ClientSession] = None,
         base_path: str = "/api",
-        request_timeout: int = 90,
+        request_timeout: Optional[float] = None,
         verify_ssl: bool = True,
+        pool_config: Optional[ConnectionPoolConfig] = None,
+        json_codec: Union[str, JsonCodec, Callable[[bytes], Any], None] = "auto",
+        coalesce_requests: bool = False,
+        response_cache: Union[bool, ResponseCacheConfig, None] = None,
+        conditional_requests: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Union[bool, CircuitBreakerConfig, None] = None,
+        max_in_flight: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        token_refresh: Union[bool, TokenRefreshConfig, None] = True,
+        timeouts: Optional[TimeoutConfig] = None,
+        unix_socket: Optional[str] = None,
+        metrics: Union[bool, MetricsConfig] = True,
+        batch_server_lookups: Union[bool, ServerBatchConfig, None] = None,
+        event_hub: Optional[EventHubConfig] = None,
     ):
         """Initializes the base API client.
         Args:
-            base_url: The base URL of the Bedrock Server Manager (e.g., http://localhost:8080).
+            base_url: The base URL of the Bedrock Server Manager (e.g., http://localhost:8080),
+                or `unix:///path/to/manager.sock` to connect over a Unix domain socket.
             username: The username for authentication.
             password: The password for authentication.
             jwt_token: An optional JWT token to use for authentication.
             session: An optional `aiohttp.ClientSession` to use for requests.
             base_path: The base path for the API.
-            request_timeout: The timeout for requests in seconds.
+            request_timeout: The total timeout in seconds for login and logout
+                (default 90). If given explicitly, it also becomes the total
+                limit of every request using the `fast_read` or `action`
+                profile (all requests except the `long_running` endpoints),
+                unless `timeouts` customises those profiles.
             verify_ssl: Whether to verify the SSL certificate.
+            pool_config: Optional `ConnectionPoolConfig` used to tune the connector
+                of the internally created session. Ignored if `session` is given.
+            json_codec: The JSON codec used for request bodies, responses and
+                WebSocket frames: "auto" (orjson if installed), "json", "orjson",
+                a `JsonCodec`, or a callable that decodes `bytes`.
+            coalesce_requests: If True, identical concurrent GET requests share a
+                single in-flight HTTP request (see `coalesce_stats()`).
+            response_cache: Enables the TTL/LRU cache for read-only endpoints.
+                Pass True for the default `ResponseCacheConfig` or a config
+                instance to customize per-endpoint TTLs and the size bound.
+            conditional_requests: If True, GET responses carrying an `ETag` or
+                `Last-Modified` header are revalidated with `If-None-Match` /
+                `If-Modified-Since`, and a `304 Not Modified` reuses the
+                previously decoded payload and validated model.
+            retry_policy: Optional `RetryPolicy` for retrying connection failures,
+                timeouts and 502/503/504 responses. Only idempotent requests are
+                retried unless the policy or `retry_actions()` opts in.
+            circuit_breaker: Enables a circuit breaker for this host. Pass True
+                for the default `CircuitBreakerConfig` or a config instance.
+                While open, requests fail immediately with `CircuitOpenError`.
+            max_in_flight: Maximum number of concurrent HTTP requests. Excess
+                requests wait in FIFO order. `None` means unlimited.
+            requests_per_second: Sustained request rate enforced with a token
+                bucket. `None` means unlimited.
+            burst: Token bucket capacity, i.e. how many requests may be sent
+                back-to-back before pacing starts. Defaults to
+                `requests_per_second` rounded down (at least 1).
+            token_refresh: Refreshes the JWT in the background shortly before
+                its `exp` claim, and logs in before sending a request with an
+                expired token. Pass a `TokenRefreshConfig` to tune the margin
+                and clock skew allowance, or False to rely on 401 responses
+                only. Requires `username` and `password`.
+            timeouts: Optional `TimeoutConfig` with the named timeout profiles
+                (connect, socket-read and total limits) and the table that
+                assigns them to endpoints. Defaults to `TimeoutConfig()`.
+            unix_socket: Path of a Unix domain socket to connect to instead of
+                the host and port of `base_url`, which then only provides the
+                scheme, `Host` header and WebSocket URL. Equivalent to a
+                `unix://` base URL. Requires the internal session, or a
+                session whose connector is an `aiohttp.UnixConnector`.
+            metrics: Per-endpoint request metrics exposed as `metrics`. Pass a
+                `MetricsConfig` to change the latency buckets or endpoint
+                templates, or False to disable them. Bytes and connection wait
+                are only recorded for the internally created session.
+            batch_server_lookups: Serves per-server running status and version
+                lookups made together from a single `GET /servers` request
+                (see `batch_stats()`). Pass True to batch lookups made in the
+                same event-loop tick or a `ServerBatchConfig` with a longer
+                window. Servers missing from the list fall back to their own
+                request.
+            event_hub: Optional `EventHubConfig` for the shared WebSocket
+                event hub exposed as `events`.
         """
         if not base_url:
             raise ValueError("base_url must be provided.")
@@ -86,7 +218,19 @@ class ClientBase:
 
         # Robustly parse the input base_url string
         parsed_uri = urlparse(base_url)
-        if not parsed_uri.scheme or not parsed_uri.netloc:
+        if parsed_uri.scheme == "unix":
+            socket_path = f"{parsed_uri.netloc}{parsed_uri.path}"
+            if not socket_path:
+                raise ValueError(
+                    f"Invalid base_url provided: '{base_url}'. A unix:// URL must include the socket path."
+                )
+            if unix_socket is not None and unix_socket != socket_path:
+                raise ValueError(
+                    f"unix_socket '{unix_socket}' conflicts with base_url '{base_url}'."
+                )
+            unix_socket = socket_path
+            parsed_uri = urlparse(_UNIX_SOCKET_ROOT_URL)
+        elif not parsed_uri.scheme or not parsed_uri.netloc:
             raise ValueError(
                 f"Invalid base_url provided: '{base_url}'. Must include scheme (http/https) and hostname."
             )
@@ -94,6 +238,11 @@ class ClientBase:
         self._host = parsed_uri.hostname
         self._port = parsed_uri.port
         self._use_ssl = parsed_uri.scheme == "https"
+        self._unix_socket = unix_socket
+        # Used in log messages, errors and the circuit breaker name.
+        self._target_address = unix_socket or (
+            f"{self._host}{f':{self._port}' if self._port is not None else ''}"
+        )
 
         self._api_base_segment = (
             f"/{base_path.strip('/')}" if base_path.strip("/") else ""
@@ -106,45 +255,303 @@ class ClientBase:
 
         self._username = username
         self._password = password
-        self._request_timeout = request_timeout
+        self._request_timeout = (
+            DEFAULT_REQUEST_TIMEOUT if request_timeout is None else request_timeout
+        )
+        self._timeouts = _TimeoutResolver(
+            timeouts or TimeoutConfig(),
+            self._request_timeout,
+            total_is_explicit=request_timeout is not None,
+        )
         self._verify_ssl = verify_ssl
 
+        self._json_codec = resolve_json_codec(json_codec)
+        self._pool_config = pool_config or ConnectionPoolConfig()
+        self._pool_counters = _PoolCounters()
+        self.metrics = ClientMetrics(
+            metrics if isinstance(metrics, MetricsConfig) else None,
+            enabled=bool(metrics),
+        )
+
         if session is None:
             _LOGGER.debug("No session provided, creating an internal ClientSession.")
-            connector = None
+            connector_kwargs = self._pool_config.connector_kwargs()
             if self._use_ssl and not self._verify_ssl:
                 _LOGGER.warning(
                     "Creating internal session with SSL certificate verification DISABLED. "
                     "This is insecure for production."
                 )
-                connector = aiohttp.TCPConnector(ssl=False)
-            self._session = aiohttp.ClientSession(connector=connector)
+                connector_kwargs["ssl"] = False
+            if self._unix_socket is not None:
+                _LOGGER.debug("Connecting over Unix socket %s.", self._unix_socket)
+                connector = aiohttp.UnixConnector(
+                    self._unix_socket, **self._pool_config.unix_connector_kwargs()
+                )
+            else:
+                connector = aiohttp.TCPConnector(**connector_kwargs)
+            trace_configs = [self._pool_counters.trace_config()]
+            if self.metrics.enabled:
+                trace_configs.append(self.metrics.trace_config())
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                trace_configs=trace_configs,
+            )
             self._close_session = True
         else:
             self._session = session
             self._close_session = False
+            if pool_config is not None:
+                _LOGGER.info(
+                    "An external ClientSession is provided; pool_config is ignored "
+                    "and the provided session's connector settings take precedence."
+                )
             if self._use_ssl and not self._verify_ssl:
                 _LOGGER.info(
                     "An external ClientSession is provided, and verify_ssl=False was requested by user. "
                     "The provided session's SSL verification behavior will take precedence."
                 )
+            if self._unix_socket is not None and not isinstance(
+                session.connector, aiohttp.UnixConnector
+            ):
+                _LOGGER.warning(
+                    "unix_socket '%s' was requested but the provided ClientSession "
+                    "does not use an aiohttp.UnixConnector; requests will go over TCP.",
+                    self._unix_socket,
+                )
 
         self._jwt_token: Optional[str] = jwt_token
         self._default_headers: Mapping[str, str] = {
             "Accept": "application/json",
         }
         self._auth_lock = asyncio.Lock()
+        self._token_refresh_config: Optional[TokenRefreshConfig] = None
+        if token_refresh and username and password:
+            self._token_refresh_config = (
+                token_refresh
+                if isinstance(token_refresh, TokenRefreshConfig)
+                else TokenRefreshConfig()
+            )
+        self._token_expires_at: Optional[float] = None
+        self._token_refresh_task: Optional[asyncio.Task] = None
+        self._login_future: Optional["asyncio.Future[None]"] = None
+        if jwt_token and self._token_refresh_config is not None:
+            # No running loop is required here; the refresh is scheduled on
+            # the first request or `authenticate()` call.
+            self._token_expires_at = token_expires_at(
+                jwt_token, self._token_refresh_config
+            )
+        self._coalesce_requests = coalesce_requests
+        self._single_flight = SingleFlight()
+        self._retry_policy = retry_policy
+        self._circuit_breaker: Optional[CircuitBreaker] = None
+        if circuit_breaker:
+            self._circuit_breaker = CircuitBreaker(
+                self._target_address,
+                (
+                    circuit_breaker
+                    if isinstance(circuit_breaker, CircuitBreakerConfig)
+                    else None
+                ),
+            )
+        self._retry_counters = _RetryCounters()
+        self._limiter = RequestLimiter(
+            max_in_flight=max_in_flight,
+            requests_per_second=requests_per_second,
+            burst=burst,
+        )
+        self._validator_cache: Optional[ValidatorCache] = (
+            ValidatorCache() if conditional_requests else None
+        )
+        self._response_cache: Optional[ResponseCache] = None
+        if response_cache:
+            self._response_cache = ResponseCache(
+                response_cache
+                if isinstance(response_cache, ResponseCacheConfig)
+                else None
+            )
+
+        self._server_loader: Optional[ServerListLoader] = None
+        if batch_server_lookups:
+            self._server_loader = ServerListLoader(
+                self._fetch_server_entries,
+                (
+                    batch_server_lookups
+                    if isinstance(batch_server_lookups, ServerBatchConfig)
+                    else None
+                ),
+            )
+
+        self._event_hub_config = event_hub
+        self._event_hub: Optional[EventHub] = None
 
         _LOGGER.debug("ClientBase initialized for base URL: %s", self._base_url)
 
     async def close(self) -> None:
         """Closes the underlying aiohttp.ClientSession if it was created internally."""
+        self._cancel_token_refresh()
+        if self._event_hub is not None:
+            await self._event_hub.close()
         if self._session and self._close_session and not self._session.closed:
             await self._session.close()
             _LOGGER.debug(
                 "Closed internally managed ClientSession for %s", self._base_url
             )
 
+    @property
+    def events(self) -> EventHub:
+        """The shared WebSocket event hub.
+
+        All subscribers share one reconnecting WebSocket connection, which
+        is opened on the first `events.subscribe()` and closed by `close()`.
+        """
+        if self._event_hub is None:
+            self._event_hub = EventHub(self, self._event_hub_config)
+        return self._event_hub
+
+    def pool_stats(self) -> PoolStats:
+        """Returns a snapshot of the session's connection pool usage.
+
+        The `created` and `reused` counters are only tracked for the internally
+        created session; they stay at zero when an external session is used.
+
+        Returns:
+            A `PoolStats` object describing open, idle and reused connections.
+        """
+        connector = None if self._session.closed else self._session.connector
+        return _collect_pool_stats(connector, self._pool_counters)
+
+    def coalesce_stats(self) -> SingleFlightStats:
+        """Returns counters for single-flight request coalescing.
+
+        Returns:
+            A `SingleFlightStats` object with the number of executed and
+            deduplicated requests. All counters stay at zero unless the client
+            was created with `coalesce_requests=True`.
+        """
+        return self._single_flight.stats()
+
+    def batch_stats(self) -> Optional[BatchStats]:
+        """Returns per-server lookup batching counters, or `None` if disabled."""
+        if self._server_loader is None:
+            return None
+        return self._server_loader.stats()
+
+    def retry_stats(self) -> RetryStats:
+        """Returns counters for retries performed by the retry policy."""
+        return self._retry_counters.snapshot()
+
+    @contextlib.contextmanager
+    def retry_actions(self) -> Iterator[None]:
+        """Allows non-idempotent requests made in this context to be retried.
+
+        The opt-in applies to the current task only and has no effect unless a
+        `retry_policy` is configured.
+
+        Example:
+            >>> with client.retry_actions():
+            ...     await client.async_start_server("my-server")
+        """
+        token = _RETRY_ACTIONS.set(True)
+        try:
+            yield
+        finally:
+            _RETRY_ACTIONS.reset(token)
+
+    def circuit_stats(self) -> Optional[CircuitBreakerStats]:
+        """Returns circuit breaker state and counters, or `None` if disabled."""
+        if self._circuit_breaker is None:
+            return None
+        return self._circuit_breaker.stats()
+
+    def limiter_stats(self) -> LimiterStats:
+        """Returns the client-side limits, queue depth and queue wait times."""
+        return self._limiter.stats()
+
+    def set_request_limits(self, **limits: Optional[float]) -> None:
+        """Changes the client-side request limits at runtime.
+
+        Only the given limits are changed; pass `None` to remove a limit.
+        Queued requests are admitted immediately if the new limits allow it.
+
+        Args:
+            **limits: Any of `max_in_flight`, `requests_per_second` and `burst`,
+                with the same meaning as the constructor arguments.
+
+        Raises:
+            ValueError: If a limit is not positive.
+            TypeError: If an unknown limit is given.
+
+        Example:
+            >>> client.set_request_limits(max_in_flight=4, requests_per_second=10)
+        """
+        self._limiter.configure(**limits)
+
+    @contextlib.contextmanager
+    def timeout_override(self, profile: Union[str, TimeoutProfile]) -> Iterator[None]:
+        """Uses the given timeout profile for requests made in this context.
+
+        The override applies to the current task only and takes precedence
+        over the endpoint's default profile.
+
+        Args:
+            profile: A profile name (e.g. "long_running") or a `TimeoutProfile`.
+
+        Raises:
+            ValueError: If `profile` names an unknown profile.
+
+        Example:
+            >>> with client.timeout_override("long_running"):
+            ...     await client.async_start_server("my-server")
+        """
+        if not isinstance(profile, TimeoutProfile):
+            self._timeouts.profile(profile)
+        token = _TIMEOUT_OVERRIDE.set(profile)
+        try:
+            yield
+        finally:
+            _TIMEOUT_OVERRIDE.reset(token)
+
+    def _timeout_for(self, method: str, path: str) -> aiohttp.ClientTimeout:
+        """Returns the `aiohttp.ClientTimeout` for a request to `path`."""
+        return self._timeouts.for_request(method, path)
+
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Returns response cache counters, or `None` if the cache is disabled."""
+        if self._response_cache is None:
+            return None
+        return self._response_cache.stats()
+
+    def conditional_stats(self) -> Optional[ConditionalStats]:
+        """Returns conditional request counters, or `None` if disabled."""
+        if self._validator_cache is None:
+            return None
+        return self._validator_cache.stats()
+
+    def _validate_response(self, model_cls: Type[ModelT], data: Any) -> ModelT:
+        """Validates response data as `model_cls`.
+
+        If `data` is a payload remembered for conditional requests, the model
+        validated from it is memoized so a `304 Not Modified` is not validated
+        again.
+        """
+        if self._validator_cache is not None:
+            return self._validator_cache.validate(model_cls, data)
+        return model_cls.model_validate(data)
+
+    def invalidate_cache(self, path_prefix: Optional[str] = None) -> int:
+        """Evicts cached responses.
+
+        Args:
+            path_prefix: Evict only entries whose path starts with this prefix
+                (e.g. "/server/my-server"). If `None`, the whole cache is cleared.
+
+        Returns:
+            The number of entries evicted (0 if the cache is disabled).
+        """
+        if self._response_cache is None:
+            return 0
+        return self._response_cache.invalidate(path_prefix)
+
     async def __aenter__(self) -> "ClientBase":
         return self
 
@@ -156,8 +563,9 @@ class ClientBase:
     ) -> Tuple[str, Dict[str, Any]]:
         """Extracts error details from an API response.
 
-        Tries to parse a JSON response body to find a detailed error message.
-        Falls back to using the response text or reason if JSON parsing fails.
+        Reads the response body once and tries to decode it as JSON to find a
+        detailed error message. Falls back to using the response text or reason
+        if JSON parsing fails.
 
         Args:
             response: The `aiohttp.ClientResponse` object from the failed request.
@@ -169,9 +577,12 @@ class ClientBase:
         error_data: Dict[str, Any] = {}
 
         try:
-            response_text = await response.text()
+            raw_body = await response.read()
+            response_text = raw_body.decode(
+                response.get_encoding() or "utf-8", errors="replace"
+            )
             if response.content_type == "application/json":
-                parsed_json = await response.json(content_type=None)
+                parsed_json = self._json_codec.loads(raw_body)
                 if isinstance(parsed_json, dict):
                     error_data = parsed_json
                 else:
@@ -350,6 +761,175 @@ class ClientBase:
     ) -> Any:
         """Internal method to make API requests.
 
+        Cacheable GET requests are answered from the response cache when it is
+        enabled, and mutating requests evict the cached entries they affect.
+        When request coalescing is enabled, identical concurrent idempotent
+        requests are joined onto a single in-flight request. The actual HTTP
+        exchange is performed by `_send_request`.
+
+        Args:
+            method: The HTTP method for the request (e.g., "GET", "POST").
+            path: The API endpoint path.
+            json_data: An optional dictionary to be sent as the JSON request body.
+            params: An optional dictionary of query parameters.
+            authenticated: Whether the request requires authentication.
+            is_retry: Whether this is a retry attempt after a token refresh.
+
+        Returns:
+            The JSON response from the API as a dictionary or list.
+
+        Raises:
+            CannotConnectError: If a connection to the server cannot be established.
+            APIError: For various API-related errors.
+        """
+        path = path if path.startswith("/") else f"/{path}"
+        method_upper = method.upper()
+        cache = self._response_cache
+
+        if cache is None or is_retry:
+            return await self._coalesced_request(
+                method, path, json_data, params, authenticated, is_retry
+            )
+
+        if method_upper not in _IDEMPOTENT_METHODS:
+            try:
+                return await self._coalesced_request(
+                    method, path, json_data, params, authenticated, is_retry
+                )
+            finally:
+                evicted = cache.invalidate_for_mutation(path)
+                if evicted:
+                    _LOGGER.debug(
+                        "%s %s evicted %d cached response(s).", method, path, evicted
+                    )
+
+        ttl = cache.ttl_for(path) if method_upper == "GET" else None
+        if ttl is None or json_data is not None:
+            return await self._coalesced_request(
+                method, path, json_data, params, authenticated, is_retry
+            )
+
+        key = ResponseCache.make_key(path, params)
+        found, cached = cache.get(key)
+        if found:
+            _LOGGER.debug("Cache hit for GET %s", path)
+            return cached
+        generation = cache.generation
+        result = await self._coalesced_request(
+            method, path, json_data, params, authenticated, is_retry
+        )
+        cache.set(key, result, ttl, generation)
+        return result
+
+    async def _fetch_server_entries(self) -> List[ServerEntry]:
+        response = await self._request("GET", "/servers", authenticated=True)
+        servers = response.get("servers") if isinstance(response, dict) else None
+        return servers if isinstance(servers, list) else []
+
+    async def _batched_server_entry(self, server_name: str) -> Optional[ServerEntry]:
+        """Returns the server's entry from a batched server list fetch.
+
+        Returns `None` if batching is disabled or the server is not listed,
+        in which case the caller sends its own per-server request.
+        """
+        if self._server_loader is None:
+            return None
+        return await self._server_loader.load(server_name)
+
+    async def _coalesced_request(
+        self,
+        method: str,
+        path: str,
+        json_data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        authenticated: bool,
+        is_retry: bool,
+    ) -> Any:
+        """Sends a request, joining an identical in-flight one if coalescing is on."""
+        if (
+            self._coalesce_requests
+            and not is_retry
+            and json_data is None
+            and method.upper() in _IDEMPOTENT_METHODS
+        ):
+            key = SingleFlight.make_key(method, path, params, authenticated)
+            return await self._single_flight.do(
+                key,
+                lambda: self._send_with_retries(
+                    method, path, None, params, authenticated, False
+                ),
+            )
+        return await self._send_with_retries(
+            method, path, json_data, params, authenticated, is_retry
+        )
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        path: str,
+        json_data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        authenticated: bool,
+        is_retry: bool,
+        body_factory: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """Sends a request through the limiter and circuit breaker, retrying per the retry policy."""
+
+        async def attempt() -> Any:
+            breaker = self._circuit_breaker
+            if breaker is not None:
+                breaker.before_call()
+            try:
+                with self.metrics.measure(method, path):
+                    result = await self._send_request(
+                        method,
+                        path,
+                        json_data=json_data,
+                        params=params,
+                        authenticated=authenticated,
+                        is_retry=is_retry,
+                        body_factory=body_factory,
+                    )
+            except BaseException as error:
+                if breaker is not None:
+                    breaker.record(error)
+                raise
+            if breaker is not None:
+                breaker.record(None)
+            return result
+
+        policy = self._retry_policy
+        if (
+            policy is None
+            or is_retry
+            or not policy.allows(method.upper() in _IDEMPOTENT_METHODS)
+        ):
+            async with self._limiter.slot():
+                return await attempt()
+        # Every attempt, including retries, waits for a limiter slot so
+        # retries cannot exceed the configured concurrency or rate.
+        return await call_with_retries(
+            policy,
+            attempt,
+            f"{method} {path}",
+            self._retry_counters,
+            slot=self._limiter.slot,
+            attempt_timeout=self._timeout_for(method, path).total,
+        )
+
+    async def _send_request(
+        self,
+        method: str,
+        path: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        authenticated: bool = True,
+        is_retry: bool = False,
+        body_factory: Optional[Callable[[], Any]] = None,
+        conditional: bool = True,
+    ) -> Any:
+        """Sends a single API request and processes the response.
+
         This method constructs the full URL, adds authentication headers if
         required, and handles the request/response cycle, including error
         handling and automatic token refresh on 401 errors.
@@ -361,6 +941,12 @@ class ClientBase:
             params: An optional dictionary of query parameters.
             authenticated: Whether the request requires authentication.
             is_retry: Whether this is a retry attempt after a token refresh.
+            body_factory: Optional callable returning a fresh request body
+                (e.g. `aiohttp.FormData`) for each send, used instead of
+                `json_data` for streamed bodies that cannot be replayed.
+            conditional: Whether to send the remembered validators. A
+                `304 Not Modified` whose payload is no longer remembered is
+                sent again with this set to False.
 
         Returns:
             The JSON response from the API as a dictionary or list.
@@ -376,37 +962,42 @@ class ClientBase:
         if json_data is not None:
             headers["Content-Type"] = "application/json"
 
+        validator_key = None
+        sent_validators = False
+        if (
+            self._validator_cache is not None
+            and method.upper() == "GET"
+            and json_data is None
+        ):
+            validator_key = ValidatorCache.make_key(request_path_segment, params)
+            if conditional:
+                validators = self._validator_cache.request_headers(validator_key)
+                headers.update(validators)
+                sent_validators = bool(validators)
+
+        sent_token: Optional[str] = None
         if authenticated:
-            async with self._auth_lock:
-                if not self._jwt_token and not is_retry:
-                    _LOGGER.debug(
-                        "No token for auth request to %s, attempting login.", url
-                    )
-                    try:
-                        await self.authenticate()
-                    except AuthError:
-                        raise
-            if authenticated and not self._jwt_token:
-                _LOGGER.error(
-                    "Auth required for %s but no token after lock/login attempt.", url
-                )
-                raise AuthError(
-                    "Authentication required but no token available after login attempt."
-                )
-            if authenticated and self._jwt_token:
-                headers["Authorization"] = f"Bearer {self._jwt_token}"
+            sent_token = await self._current_token(url, is_retry)
+            headers["Authorization"] = f"Bearer {sent_token}"
 
         _LOGGER.debug(
             "Request: %s %s (Params: %s, Auth: %s)", method, url, params, authenticated
         )
         try:
+            if body_factory is not None:
+                body = body_factory()
+            elif json_data is not None:
+                body = self._json_codec.dumps(json_data)
+            else:
+                body = None
             async with self._session.request(
                 method,
                 url,
-                json=json_data,
+                data=body,
                 params=params,
                 headers=headers,
-                timeout=aiohttp.ClientTimeout(total=self._request_timeout),
+                timeout=self._timeout_for(method, request_path_segment),
+                trace_request_ctx=self.metrics.active_sample(),
             ) as response:
                 _LOGGER.debug(
                     "Response Status for %s %s: %s", method, url, response.status
@@ -418,15 +1009,16 @@ class ClientBase:
                             "Received 401 for %s, attempting token refresh and retry.",
                             url,
                         )
-                        async with self._auth_lock:
-                            self._jwt_token = None
-                        return await self._request(
+                        await self._ensure_token(rejected=sent_token)
+                        return await self._send_request(
                             method,
                             request_path_segment,
                             json_data=json_data,
                             params=params,
                             authenticated=True,
                             is_retry=True,
+                            body_factory=body_factory,
+                            conditional=conditional,
                         )
                     await self._handle_api_error(response, request_path_segment)
                     raise APIError(  # Should be unreachable
@@ -438,15 +1030,55 @@ class ClientBase:
                     request_path_segment,
                     response.status,
                 )
+                if response.status == 304:
+                    cached_payload = (
+                        self._validator_cache.not_modified(validator_key)
+                        if validator_key is not None
+                        else None
+                    )
+                    if cached_payload is not None:
+                        _LOGGER.debug(
+                            "Not modified: reusing payload for %s", request_path_segment
+                        )
+                        return cached_payload
+                    if not sent_validators:
+                        raise APIError(
+                            f"Received 304 Not Modified for {request_path_segment} "
+                            "without a cached response to reuse.",
+                            status_code=response.status,
+                        )
+                    # The entry was evicted or replaced while the request was
+                    # in flight: fetch the full response instead.
+                    _LOGGER.debug(
+                        "Not modified, but no payload is remembered for %s; "
+                        "requesting it unconditionally.",
+                        request_path_segment,
+                    )
+                    return await self._send_request(
+                        method,
+                        request_path_segment,
+                        params=params,
+                        authenticated=authenticated,
+                        is_retry=is_retry,
+                        conditional=False,
+                    )
+
                 if response.status == 204 or response.content_length == 0:
                     return {
                         "status": "success",
                         "message": "Operation successful (No Content)",
                     }
 
+                raw_body = await response.read()
+                if not raw_body:
+                    return {
+                        "status": "success",
+                        "message": "Operation successful (No Content)",
+                    }
+
                 try:
                     json_response: Union[Dict[str, Any], List[Any]] = (
-                        await response.json(content_type=None)
+                        self._json_codec.loads(raw_body)
                     )
                     if (
                         isinstance(json_response, dict)
@@ -483,13 +1115,15 @@ class ClientBase:
                             request_path_segment,
                         )
                         # Calling method handles this specific status.
+                    elif validator_key is not None:
+                        self._validator_cache.store(
+                            validator_key, response.headers, json_response
+                        )
                     return json_response
-                except (
-                    aiohttp.ContentTypeError,
-                    ValueError,
-                    asyncio.TimeoutError,
-                ) as json_error:
-                    resp_text = await response.text()
+                except ValueError as json_error:
+                    resp_text = raw_body.decode(
+                        response.get_encoding() or "utf-8", errors="replace"
+                    )
                     _LOGGER.warning(
                         "Successful API response (%s) for %s not valid JSON (%s). Raw: %s",
                         response.status,
@@ -505,9 +1139,7 @@ class ClientBase:
 
         except aiohttp.ClientConnectionError as e:
             # Construct target address string for error message
-            target_address = (
-                f"{self._host}{f':{self._port}' if self._port is not None else ''}"
-            )
+            target_address = self._target_address
             _LOGGER.error(
                 "API connection error for %s: %s", url, e
             )  # url already has full path
@@ -543,6 +1175,483 @@ class ClientBase:
                 f"An unexpected error occurred during request to {url}: {e}"
             ) from e
 
+    @contextlib.asynccontextmanager
+    async def _open_download(
+        self,
+        path: str,
+        accept: str = "*/*",
+        authenticated: bool = True,
+        extra_headers: Optional[Mapping[str, str]] = None,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Opens a streaming GET request and yields the successful response.
+
+        This is the binary counterpart of `_send_request`: the request goes
+        through the request limiter and circuit breaker, a 401 triggers one
+        token refresh and replay, error statuses are raised through
+        `_handle_api_error`, and connection errors or timeouts while the body
+        is being read are raised as `CannotConnectError`. Downloads are not
+        retried by the retry policy, since a partially consumed stream
+        cannot be replayed.
+
+        Args:
+            path: The API endpoint path, relative to the API base URL.
+            accept: The `Accept` header to send.
+            authenticated: Whether the request requires authentication.
+            extra_headers: Additional request headers (e.g. validators).
+
+        Yields:
+            The `aiohttp.ClientResponse`, with its body not yet read.
+
+        Raises:
+            CannotConnectError: If the connection fails or times out.
+            APIError: For error responses.
+        """
+        request_path_segment = path if path.startswith("/") else f"/{path}"
+        url = f"{self._base_url}{request_path_segment}"
+        async with self._limiter.slot():
+            breaker = self._circuit_breaker
+            if breaker is not None:
+                breaker.before_call()
+            try:
+                with self.metrics.measure("GET", request_path_segment) as sample:
+                    is_retry = False
+                    while True:
+                        headers = {"Accept": accept, **(extra_headers or {})}
+                        sent_token: Optional[str] = None
+                        if authenticated:
+                            sent_token = await self._current_token(url, is_retry)
+                            headers["Authorization"] = f"Bearer {sent_token}"
+                        _LOGGER.debug("Request: GET %s (download)", url)
+                        try:
+                            async with self._session.get(
+                                url,
+                                headers=headers,
+                                timeout=self._timeout_for("GET", request_path_segment),
+                                trace_request_ctx=sample,
+                            ) as response:
+                                _LOGGER.debug(
+                                    "Response Status for GET %s: %s",
+                                    url,
+                                    response.status,
+                                )
+                                unauthorized = (
+                                    response.status == 401
+                                    and authenticated
+                                    and not is_retry
+                                )
+                                if not unauthorized:
+                                    if not response.ok:
+                                        await self._handle_api_error(
+                                            response, request_path_segment
+                                        )
+                                        raise APIError(  # Should be unreachable
+                                            "Error handler did not raise, this should not happen."
+                                        )
+                                    yield response
+                                    break
+                        except asyncio.TimeoutError as e:
+                            _LOGGER.error("Download timed out for %s: %s", url, e)
+                            raise CannotConnectError(
+                                f"Request timed out for {url}", original_exception=e
+                            ) from e
+                        except aiohttp.ClientError as e:
+                            _LOGGER.error(
+                                "AIOHTTP client error downloading %s: %s", url, e
+                            )
+                            raise CannotConnectError(
+                                f"AIOHTTP Client Error: {e}", original_exception=e
+                            ) from e
+                        _LOGGER.warning(
+                            "Received 401 for %s, attempting token refresh and retry.",
+                            url,
+                        )
+                        await self._ensure_token(rejected=sent_token)
+                        is_retry = True
+            except BaseException as error:
+                if breaker is not None:
+                    breaker.record(error)
+                raise
+            if breaker is not None:
+                breaker.record(None)
+
+    @staticmethod
+    def _check_download_size(
+        size: Optional[int], max_bytes: Optional[int], path: str
+    ) -> None:
+        if max_bytes is not None and size is not None and size > max_bytes:
+            raise ResponseTooLargeError(
+                f"Download of {path} exceeds the limit of {max_bytes} bytes.",
+                max_bytes=max_bytes,
+            )
+
+    async def _iter_response(
+        self,
+        response: aiohttp.ClientResponse,
+        path: str,
+        max_bytes: Optional[int],
+        chunk_size: int,
+    ) -> AsyncIterator[bytes]:
+        self._check_download_size(response.content_length, max_bytes, path)
+        # The response-chunk trace hook only fires for read(), so streamed
+        # bodies are counted here.
+        sample = self.metrics.active_sample()
+        received = 0
+        async for chunk in response.content.iter_chunked(chunk_size):
+            received += len(chunk)
+            if sample is not None:
+                sample.bytes_received += len(chunk)
+            self._check_download_size(received, max_bytes, path)
+            yield chunk
+
+    async def _iter_download(
+        self,
+        path: str,
+        max_bytes: Optional[int] = None,
+        chunk_size: int = _DOWNLOAD_CHUNK_SIZE,
+        accept: str = "*/*",
+        authenticated: bool = True,
+    ) -> AsyncIterator[bytes]:
+        """Streams a binary response as an async iterator of chunks.
+
+        Args:
+            path: The API endpoint path.
+            max_bytes: Abort with `ResponseTooLargeError` once the body
+                exceeds this many bytes. `None` means unlimited.
+            chunk_size: Maximum size of each yielded chunk.
+            accept: The `Accept` header to send.
+            authenticated: Whether the request requires authentication.
+
+        Yields:
+            The response body in chunks.
+        """
+        async with self._open_download(path, accept, authenticated) as response:
+            async for chunk in self._iter_response(
+                response, path, max_bytes, chunk_size
+            ):
+                yield chunk
+
+    async def _download(
+        self,
+        path: str,
+        destination: Optional[DownloadDestination] = None,
+        max_bytes: Optional[int] = None,
+        chunk_size: int = _DOWNLOAD_CHUNK_SIZE,
+        accept: str = "*/*",
+        authenticated: bool = True,
+        conditional: bool = True,
+    ) -> Union[bytes, int]:
+        """Downloads a binary response into memory, a file path or a file object.
+
+        In-memory downloads are revalidated with the conditional request
+        validators when `conditional_requests` is enabled, and a
+        `304 Not Modified` returns the previously downloaded body. If that
+        body is no longer remembered, the download is sent again without
+        validators.
+
+        Args:
+            path: The API endpoint path.
+            destination: `None` to return the body as bytes, a file path to
+                write to (via a temporary `.part` file that replaces the
+                target when complete), or a binary file object to write to.
+            max_bytes: Abort with `ResponseTooLargeError` once the body
+                exceeds this many bytes. `None` means unlimited.
+            chunk_size: Size of the chunks read from the connection.
+            accept: The `Accept` header to send.
+            authenticated: Whether the request requires authentication.
+            conditional: Whether to send the remembered validators.
+
+        Returns:
+            The body as bytes if `destination` is `None`, otherwise the number
+            of bytes written.
+
+        Raises:
+            ResponseTooLargeError: If the body exceeds `max_bytes`.
+            CannotConnectError: If the connection fails or times out.
+            APIError: For error responses.
+        """
+        request_path_segment = path if path.startswith("/") else f"/{path}"
+        validator_key = None
+        extra_headers: Dict[str, str] = {}
+        if self._validator_cache is not None and destination is None:
+            validator_key = ValidatorCache.make_key(request_path_segment)
+            if conditional:
+                extra_headers = self._validator_cache.request_headers(validator_key)
+
+        async with self._open_download(
+            path, accept, authenticated, extra_headers
+        ) as response:
+            chunks = self._iter_response(response, path, max_bytes, chunk_size)
+            if destination is not None:
+                return await self._write_download(chunks, destination)
+            if response.status != 304:
+                buffer = bytearray()
+                async for chunk in chunks:
+                    buffer.extend(chunk)
+                body = bytes(buffer)
+                if validator_key is not None:
+                    self._validator_cache.store(validator_key, response.headers, body)
+                return body
+            cached_body = (
+                self._validator_cache.not_modified(validator_key)
+                if validator_key is not None
+                else None
+            )
+            if cached_body is not None:
+                _LOGGER.debug("Not modified: reusing download for %s", path)
+                return cached_body
+            if not extra_headers:
+                raise APIError(
+                    f"Received 304 Not Modified for {request_path_segment} "
+                    "without a cached download to reuse.",
+                    status_code=response.status,
+                )
+        # The entry was evicted or replaced while the request was in flight.
+        _LOGGER.debug(
+            "Not modified, but no download is remembered for %s; "
+            "downloading it unconditionally.",
+            path,
+        )
+        return await self._download(
+            path, None, max_bytes, chunk_size, accept, authenticated, conditional=False
+        )
+
+    @staticmethod
+    async def _write_download(
+        chunks: AsyncIterator[bytes], destination: DownloadDestination
+    ) -> int:
+        """Writes `chunks` to a file path or file object without blocking the loop."""
+        written = 0
+        if not isinstance(destination, (str, os.PathLike)):
+            async for chunk in chunks:
+                await asyncio.to_thread(destination.write, chunk)
+                written += len(chunk)
+            return written
+
+        target = os.fspath(destination)
+        partial = f"{target}.part"
+        file = await asyncio.to_thread(open, partial, "wb")
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(file.write, chunk)
+                written += len(chunk)
+        except BaseException:
+            await asyncio.to_thread(file.close)
+            with contextlib.suppress(OSError):
+                await asyncio.to_thread(os.remove, partial)
+            raise
+        await asyncio.to_thread(file.close)
+        await asyncio.to_thread(os.replace, partial, target)
+        return written
+
+    async def _upload(
+        self,
+        path: str,
+        file_path: str,
+        field_name: str = "file",
+        content_type: str = "application/octet-stream",
+        chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+        max_bytes_per_second: Optional[float] = None,
+    ) -> Any:
+        """Uploads a file as a streamed `multipart/form-data` POST request.
+
+        The file is read in chunks off the event loop and never held in memory
+        as a whole. The request goes through the same path as `_request`
+        (limiter, circuit breaker, endpoint timeout profile, 401 refresh and
+        error handling). Each attempt streams the file from the start, so the
+        upload can be retried when the retry policy allows it for actions
+        (see `retry_actions()`).
+
+        Args:
+            path: The API endpoint path.
+            file_path: The local file to upload.
+            field_name: The multipart field name.
+            content_type: The content type of the file part.
+            chunk_size: Size of the chunks read from the file.
+            progress: Optional callback (sync or async) receiving an
+                `UploadProgress` after each chunk.
+            max_bytes_per_second: Optional bandwidth cap.
+
+        Returns:
+            The decoded JSON response.
+
+        Raises:
+            OSError: If the file cannot be read.
+            CannotConnectError: If a connection to the server cannot be established.
+            APIError: For error responses.
+        """
+        path = path if path.startswith("/") else f"/{path}"
+        total_bytes = await asyncio.to_thread(os.path.getsize, file_path)
+        filename = os.path.basename(file_path)
+        streams: List[AsyncIterator[bytes]] = []
+
+        def body() -> aiohttp.FormData:
+            stream = iter_file_chunks(
+                file_path, total_bytes, chunk_size, progress, max_bytes_per_second
+            )
+            streams.append(stream)
+            form = aiohttp.FormData()
+            form.add_field(
+                field_name, stream, filename=filename, content_type=content_type
+            )
+            return form
+
+        _LOGGER.debug("Uploading %s (%d bytes) to %s", filename, total_bytes, path)
+        try:
+            return await self._send_with_retries(
+                "POST", path, None, None, True, False, body_factory=body
+            )
+        finally:
+            # Close streams left half-read by a failed attempt (and their files).
+            for stream in streams:
+                await stream.aclose()
+            if self._response_cache is not None:
+                self._response_cache.invalidate_for_mutation(path)
+
+    def _token_usable(self) -> bool:
+        """Returns whether the stored token can be sent without logging in first.
+
+        Also schedules the background refresh for a token passed in via
+        `jwt_token`, which cannot be done before an event loop is running.
+        """
+        if not self._jwt_token:
+            return False
+        if self._token_expires_at is None:
+            return True
+        if self._token_refresh_task is None:
+            self._schedule_token_refresh()
+        return time.monotonic() < self._token_expires_at
+
+    def _set_token(self, token: Optional[str], issued_now: bool = False) -> None:
+        """Stores a new token and (re)schedules its proactive refresh."""
+        self._jwt_token = token
+        self._token_expires_at = None
+        self._cancel_token_refresh()
+        if token and self._token_refresh_config is not None:
+            self._token_expires_at = token_expires_at(
+                token, self._token_refresh_config, issued_now=issued_now
+            )
+            self._schedule_token_refresh()
+
+    def _schedule_token_refresh(self) -> None:
+        if self._token_expires_at is None or self._token_refresh_config is None:
+            return
+        delay = refresh_delay(self._token_expires_at, self._token_refresh_config)
+        _LOGGER.debug("Scheduling proactive token refresh in %.1fs.", delay)
+        self._token_refresh_task = asyncio.get_running_loop().create_task(
+            self._refresh_token_later(self._jwt_token, delay)
+        )
+
+    def _cancel_token_refresh(self) -> None:
+        task = self._token_refresh_task
+        self._token_refresh_task = None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _refresh_token_later(self, token: Optional[str], delay: float) -> None:
+        """Background task that replaces `token` before it expires.
+
+        The old token stays in place until the new one has been received, so
+        requests sent during the refresh are never left without a token. If
+        the refresh fails, it is retried while the old token is still valid.
+        """
+        config = self._token_refresh_config
+        while True:
+            await asyncio.sleep(delay)
+            if self._jwt_token != token or config is None:
+                return
+            try:
+                # Holding the lock merges this refresh with any login started
+                # by a request; requests with a valid token never take it.
+                async with self._auth_lock:
+                    if self._jwt_token != token:
+                        return
+                    new_token = await self._fetch_token()
+            except AuthError as e:
+                expires_at = self._token_expires_at or 0.0
+                remaining = expires_at - time.monotonic()
+                if remaining <= 0:
+                    _LOGGER.warning(
+                        "Proactive token refresh failed and the token has expired: %s",
+                        e,
+                    )
+                    return
+                delay = min(config.retry_interval, remaining)
+                _LOGGER.warning(
+                    "Proactive token refresh failed, retrying in %.1fs: %s", delay, e
+                )
+                continue
+            if self._jwt_token == token:
+                _LOGGER.debug("Token refreshed proactively before expiry.")
+                self._set_token(new_token.access_token, issued_now=True)
+            return
+
+    async def _current_token(self, url: str, is_retry: bool = False) -> str:
+        """Returns the token to send with a request, logging in first if needed.
+
+        A valid token is read without taking the auth lock; the lock is only
+        involved when a login is actually required.
+
+        Raises:
+            AuthError: If no token is available after the login attempt.
+        """
+        if not self._token_usable() and not is_retry:
+            _LOGGER.debug(
+                "No valid token for auth request to %s, attempting login.", url
+            )
+            await self._ensure_token()
+        token = self._jwt_token
+        if not token:
+            _LOGGER.error(
+                "Auth required for %s but no token after lock/login attempt.", url
+            )
+            raise AuthError(
+                "Authentication required but no token available after login attempt."
+            )
+        return token
+
+    async def _ensure_token(self, rejected: Optional[str] = None) -> None:
+        """Makes sure a usable token is stored, logging in at most once.
+
+        Concurrent callers share a single login: the first one starts it and
+        the others await the same future, so they are all released together
+        instead of one at a time through the auth lock.
+
+        Args:
+            rejected: A token the server answered with 401. It is discarded
+                unless another caller has already replaced it.
+
+        Raises:
+            AuthError: If the login fails.
+        """
+        login = self._login_future
+        if login is None:
+            login = asyncio.ensure_future(self._login_if_needed(rejected))
+            self._login_future = login
+            login.add_done_callback(self._forget_login)
+        elif rejected is not None and rejected == self._jwt_token:
+            # The running login may have decided the token was still fine;
+            # wait for it, then discard the rejected token.
+            await asyncio.shield(login)
+            return await self._ensure_token(rejected)
+        await asyncio.shield(login)
+
+    def _forget_login(self, login: "asyncio.Future[None]") -> None:
+        if self._login_future is login:
+            self._login_future = None
+        if not login.cancelled():
+            # Mark the exception as retrieved; awaiting callers re-raise it.
+            login.exception()
+
+    async def _login_if_needed(self, rejected: Optional[str]) -> None:
+        async with self._auth_lock:
+            if rejected is not None and self._jwt_token == rejected:
+                self._set_token(None)
+                if not (self._username and self._password):
+                    return
+            if not self._token_usable():
+                await self.authenticate()
+
     async def authenticate(self) -> Token:
         """Authenticates with the API and retrieves a JWT token.
 
@@ -558,86 +1667,98 @@ class ClientBase:
                 connection issues, or other API errors.
         """
         _LOGGER.info("Attempting API authentication for user %s", self._username)
-        self._jwt_token = None
         try:
-            # FastAPI's OAuth2PasswordRequestForm expects x-www-form-urlencoded data.
-            form_data = aiohttp.FormData()
-            form_data.add_field("username", self._username)
-            form_data.add_field("password", self._password)
-
-            # Make the request without using self._request to avoid auth loop and content-type issues
-            # Use _server_root_url for auth path as it's not under the general _api_base_segment (e.g. /api)
-            url = f"{self._server_root_url}/auth/token"
-            headers = {"Accept": "application/json"}  # Still expect JSON response
-
-            _LOGGER.debug("Request: POST %s (Form Data Auth to root path)", url)
-            async with self._session.post(
-                url,
-                data=form_data,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=self._request_timeout),
-            ) as response:
-                _LOGGER.debug("Response Status for POST %s: %s", url, response.status)
-                if not response.ok:
-                    # Use _handle_api_error for consistent error raising based on status
-                    await self._handle_api_error(response, "/auth/token")
-                    # Should be unreachable if _handle_api_error raises
-                    raise AuthError(
-                        f"Authentication failed with status {response.status}"
-                    )
+            token = await self._fetch_token()
+        except AuthError:
+            self._set_token(None)
+            raise
+        self._set_token(token.access_token, issued_now=True)
+        _LOGGER.info("Authentication successful, token received.")
+        return token
 
-                try:
-                    response_data = await response.json(content_type=None)
-                except (
-                    aiohttp.ContentTypeError,
-                    ValueError,
-                    asyncio.TimeoutError,
-                ) as json_error:
-                    resp_text = await response.text()
-                    _LOGGER.error(
-                        "Auth response was not valid JSON: %s. Raw: %s",
-                        json_error,
-                        resp_text[:200],
-                    )
-                    raise AuthError(
-                        f"Authentication response was not valid JSON: {json_error}"
+    async def _fetch_token(self) -> Token:
+        """Logs in with the configured credentials and returns the new token.
+
+        Unlike `authenticate()`, this does not touch the stored token, so the
+        current token stays usable while a background refresh is running.
+
+        Raises:
+            AuthError: If the login fails for any reason.
+        """
+        with self.metrics.measure("POST", "/auth/token") as sample:
+            try:
+                # FastAPI's OAuth2PasswordRequestForm expects x-www-form-urlencoded data.
+                form_data = aiohttp.FormData()
+                form_data.add_field("username", self._username)
+                form_data.add_field("password", self._password)
+
+                # Make the request without using self._request to avoid auth loop and content-type issues
+                # Use _server_root_url for auth path as it's not under the general _api_base_segment (e.g. /api)
+                url = f"{self._server_root_url}/auth/token"
+                headers = {"Accept": "application/json"}  # Still expect JSON response
+
+                _LOGGER.debug("Request: POST %s (Form Data Auth to root path)", url)
+                async with self._session.post(
+                    url,
+                    data=form_data,
+                    headers=headers,
+                    timeout=self._timeouts.default(),
+                    trace_request_ctx=sample,
+                ) as response:
+                    _LOGGER.debug(
+                        "Response Status for POST %s: %s", url, response.status
                     )
+                    if not response.ok:
+                        # Use _handle_api_error for consistent error raising based on status
+                        await self._handle_api_error(response, "/auth/token")
+                        # Should be unreachable if _handle_api_error raises
+                        raise AuthError(
+                            f"Authentication failed with status {response.status}"
+                        )
 
-            token = Token.model_validate(response_data)
-            self._jwt_token = token.access_token
-            _LOGGER.info("Authentication successful, token received.")
-            return token
+                    raw_body = await response.read()
+                    try:
+                        response_data = self._json_codec.loads(raw_body)
+                    except ValueError as json_error:
+                        resp_text = raw_body.decode("utf-8", errors="replace")
+                        _LOGGER.error(
+                            "Auth response was not valid JSON: %s. Raw: %s",
+                            json_error,
+                            resp_text[:200],
+                        )
+                        raise AuthError(
+                            f"Authentication response was not valid JSON: {json_error}"
+                        )
 
-        except AuthError:  # Re-raise specific AuthErrors
-            _LOGGER.error("Authentication failed.")
-            self._jwt_token = None
-            raise
-        except APIError as e:  # Catch errors from _handle_api_error
-            _LOGGER.error("API error during authentication: %s", e)
-            self._jwt_token = None
-            # Wrap it in AuthError if it's not already one (e.g. 400 from _handle_api_error)
-            if not isinstance(e, AuthError):
-                raise AuthError(f"API error during login: {e.args[0]}") from e
-            raise e
-        except aiohttp.ClientConnectionError as e:
-            target_address = (
-                f"{self._host}{f':{self._port}' if self._port is not None else ''}"
-            )
-            _LOGGER.error(
-                "Connection error during authentication to %s: %s", target_address, e
-            )
-            self._jwt_token = None
-            raise AuthError(
-                f"Connection error during login to {target_address}: {e}"
-            ) from e
-        except asyncio.TimeoutError as e:
-            _LOGGER.error("Timeout during authentication: %s", e)
-            self._jwt_token = None
-            raise AuthError(f"Timeout during login: {e}") from e
-        except Exception as e:
-            _LOGGER.exception("Unexpected error during authentication: %s", e)
-            self._jwt_token = None
-            raise AuthError(f"An unexpected error occurred during login: {e}") from e
+                return Token.model_validate(response_data)
+
+            except AuthError:  # Re-raise specific AuthErrors
+                _LOGGER.error("Authentication failed.")
+                raise
+            except APIError as e:  # Catch errors from _handle_api_error
+                _LOGGER.error("API error during authentication: %s", e)
+                # Wrap it in AuthError if it's not already one (e.g. 400 from _handle_api_error)
+                if not isinstance(e, AuthError):
+                    raise AuthError(f"API error during login: {e.args[0]}") from e
+                raise e
+            except aiohttp.ClientConnectionError as e:
+                target_address = self._target_address
+                _LOGGER.error(
+                    "Connection error during authentication to %s: %s",
+                    target_address,
+                    e,
+                )
+                raise AuthError(
+                    f"Connection error during login to {target_address}: {e}"
+                ) from e
+            except asyncio.TimeoutError as e:
+                _LOGGER.error("Timeout during authentication: %s", e)
+                raise AuthError(f"Timeout during login: {e}") from e
+            except Exception as e:
+                _LOGGER.exception("Unexpected error during authentication: %s", e)
+                raise AuthError(
+                    f"An unexpected error occurred during login: {e}"
+                ) from e
 
     async def async_logout(self) -> Dict[str, Any]:
         """Logs the current user out.
@@ -667,7 +1788,7 @@ class ClientBase:
             async with self._session.get(
                 url,
                 headers=headers,
-                timeout=aiohttp.ClientTimeout(total=self._request_timeout),
+                timeout=self._timeouts.default(),
             ) as response:
                 _LOGGER.debug("Response Status for GET %s: %s", url, response.status)
                 if not response.ok:
@@ -675,18 +1796,11 @@ class ClientBase:
                     # Should be unreachable
                     raise APIError(f"Logout failed with status {response.status}")
 
+                raw_body = await response.read()
                 try:
-                    response_data = (
-                        await response.json(content_type=None)
-                        if response.content_length != 0
-                        else {}
-                    )
-                except (
-                    aiohttp.ContentTypeError,
-                    ValueError,
-                    asyncio.TimeoutError,
-                ) as json_error:
-                    resp_text = await response.text()
+                    response_data = self._json_codec.loads(raw_body) if raw_body else {}
+                except ValueError as json_error:
+                    resp_text = raw_body.decode("utf-8", errors="replace")
                     _LOGGER.warning(
                         "Logout response was not valid JSON: %s. Raw: %s",
                         json_error,
@@ -699,7 +1813,7 @@ class ClientBase:
                     }
 
             # Clear local token regardless of exact response content, if HTTP call was ok
-            self._jwt_token = None
+            self._set_token(None)
             _LOGGER.info("Logout request successful. Local token cleared.")
             return response_data  # Typically an empty dict or success message
         except APIError as e:
@@ -707,24 +1821,37 @@ class ClientBase:
             # Decide if to clear local token even on error.
             # If auth error (401), token might be invalid anyway.
             if isinstance(e, AuthError):
-                self._jwt_token = None
+                self._set_token(None)
                 _LOGGER.warning("AuthError during logout, cleared local token anyway.")
             raise
         except Exception as e:
             _LOGGER.exception("Unexpected error during logout: %s", e)
             raise APIError(f"An unexpected error occurred during logout: {e}") from e
 
-    async def websocket_connect(self) -> WebSocketClient:
+    async def websocket_connect(
+        self,
+        reconnect: Union[bool, ReconnectPolicy, None] = None,
+        heartbeat: Union[bool, HeartbeatConfig, None] = True,
+    ) -> WebSocketClient:
         """
         Connects to the WebSocket endpoint.
 
+        Args:
+            reconnect: Makes the returned client reconnect with jittered
+                backoff when the connection is lost, re-subscribe to its
+                topics and log in again if the token was rejected. Pass True
+                for the default `ReconnectPolicy` or a policy instance.
+            heartbeat: Pings the manager while listening, detects dead
+                connections and records the round-trip time in `metrics`.
+                True (the default) uses `HeartbeatConfig()`; pass a config
+                to tune it or False to disable it.
+
         Returns:
             A WebSocketClient instance.
         """
         # Ensure we have a token or try to authenticate
-        async with self._auth_lock:
-            if not self._jwt_token:
-                await self.authenticate()
+        if not self._token_usable():
+            await self._ensure_token()
 
         ws_scheme = "wss" if self._use_ssl else "ws"
         # Typically the websocket endpoint is at /ws relative to the server root
@@ -732,4 +1859,24 @@ class ClientBase:
             f"{ws_scheme}://{self._host}{f':{self._port}' if self._port else ''}/ws"
         )
 
-        return WebSocketClient(self._session, ws_url, self._jwt_token)
+        return WebSocketClient(
+            self._session,
+            ws_url,
+            self._jwt_token,
+            json_codec=self._json_codec,
+            reconnect=reconnect,
+            token_provider=self._websocket_token if reconnect else None,
+            heartbeat=heartbeat,
+            metrics=self.metrics,
+        )
+
+    async def _websocket_token(self, rejected: Optional[str] = None) -> Optional[str]:
+        """Returns a usable token for a WebSocket (re)connect.
+
+        Args:
+            rejected: The token the WebSocket handshake was refused with, if
+                any; it is discarded and a new one fetched.
+        """
+        if rejected is not None or not self._token_usable():
+            await self._ensure_token(rejected=rejected)
+        return self._jwt_token
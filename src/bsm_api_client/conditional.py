@@ -0,0 +1,136 @@
+# src/bsm_api_client/conditional.py
+"""Conditional request support (ETag / Last-Modified) for the API client.
+
+This module provides the `ValidatorCache` used by `ClientBase` when
+`conditional_requests=True`. Responses that carry an `ETag` or
+`Last-Modified` header are remembered together with their decoded payload.
+Subsequent GET requests send `If-None-Match` / `If-Modified-Since`, and a
+`304 Not Modified` answer is served from the remembered payload. Pydantic
+models validated from a remembered payload are memoized as well, so a 304
+returns the previously validated model without parsing or validating again.
+"""
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Mapping, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.conditional")
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@dataclass
+class _ValidatorEntry:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    payload: Any
+    models: Dict[type, BaseModel] = field(default_factory=dict)
+
+    def request_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass(frozen=True)
+class ConditionalStats:
+    """Counters describing conditional request reuse.
+
+    Attributes:
+        not_modified: Responses answered with `304 Not Modified`.
+        stored: Responses remembered because they carried validators.
+        size: Entries currently remembered.
+    """
+
+    not_modified: int
+    stored: int
+    size: int
+
+
+class ValidatorCache:
+    """An LRU-bounded store of response validators and their payloads."""
+
+    def __init__(self, max_entries: int = 128) -> None:
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, _ValidatorEntry]" = OrderedDict()
+        self._by_payload: Dict[int, Hashable] = {}
+        self._not_modified = 0
+        self._stored = 0
+
+    @staticmethod
+    def make_key(path: str, params: Optional[Dict[str, Any]] = None) -> Hashable:
+        """Builds the key for a request path and query parameters."""
+        frozen_params = (
+            tuple(sorted((str(k), str(v)) for k, v in params.items())) if params else ()
+        )
+        return (path, frozen_params)
+
+    def request_headers(self, key: Hashable) -> Dict[str, str]:
+        """Returns the conditional headers to send for `key` (may be empty)."""
+        entry = self._entries.get(key)
+        return entry.request_headers() if entry is not None else {}
+
+    def not_modified(self, key: Hashable) -> Optional[Any]:
+        """Returns the remembered payload for a `304 Not Modified` response.
+
+        Returns:
+            The payload, or `None` if nothing is remembered for `key`.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self._not_modified += 1
+        return entry.payload
+
+    def store(self, key: Hashable, headers: Mapping[str, str], payload: Any) -> None:
+        """Remembers a successful response if it carries validators.
+
+        A response without `ETag` or `Last-Modified` forgets any previous entry.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        self._discard(key)
+        if not etag and not last_modified:
+            return
+        self._entries[key] = _ValidatorEntry(etag, last_modified, payload)
+        self._by_payload[id(payload)] = key
+        self._stored += 1
+        while len(self._entries) > self._max_entries:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+
+    def validate(self, model_cls: Type[ModelT], payload: Any) -> ModelT:
+        """Validates `payload` as `model_cls`, reusing a memoized model if any.
+
+        Only payloads remembered by this cache are memoized; anything else is
+        validated normally.
+        """
+        key = self._by_payload.get(id(payload))
+        entry = self._entries.get(key) if key is not None else None
+        if entry is None or entry.payload is not payload:
+            return model_cls.model_validate(payload)
+        model = entry.models.get(model_cls)
+        if model is None:
+            model = model_cls.model_validate(payload)
+            entry.models[model_cls] = model
+        return model  # type: ignore[return-value]
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._by_payload.pop(id(entry.payload), None)
+
+    def stats(self) -> ConditionalStats:
+        """Returns the current counters."""
+        return ConditionalStats(
+            not_modified=self._not_modified,
+            stored=self._stored,
+            size=len(self._entries),
+        )
@@ -0,0 +1,155 @@
+# src/bsm_api_client/connection_pool.py
+"""Connection pool configuration and statistics for the API client.
+
+This module provides the `ConnectionPoolConfig` dataclass used to tune the
+`aiohttp.TCPConnector` (or `aiohttp.UnixConnector`) that `ClientBase` creates
+for its internal session, and the `PoolStats` snapshot returned by
+`ClientBase.pool_stats()`.
+"""
+
+import logging
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Optional
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.pool")
+
+
+@dataclass(frozen=True)
+class ConnectionPoolConfig:
+    """Tuning options for the internally created connection pool.
+
+    Attributes:
+        limit: Total number of simultaneous connections. 0 means unlimited.
+        limit_per_host: Simultaneous connections to a single endpoint.
+            0 means unlimited.
+        keepalive_timeout: Seconds an idle connection is kept open for reuse.
+            `None` disables the timeout.
+        ttl_dns_cache: Seconds resolved DNS entries are cached. `None` caches
+            forever.
+        use_dns_cache: Whether to cache DNS lookups at all.
+        force_close: Close connections after each request (disables keep-alive).
+        enable_cleanup_closed: Abort SSL transports that were not shut down
+            cleanly by the peer.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: Optional[float] = 15.0
+    ttl_dns_cache: Optional[int] = 10
+    use_dns_cache: bool = True
+    force_close: bool = False
+    enable_cleanup_closed: bool = False
+
+    def connector_kwargs(self) -> dict:
+        """Returns the keyword arguments for an `aiohttp.TCPConnector`."""
+        kwargs: dict = {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "ttl_dns_cache": self.ttl_dns_cache,
+            "use_dns_cache": self.use_dns_cache,
+            "force_close": self.force_close,
+            "enable_cleanup_closed": self.enable_cleanup_closed,
+        }
+        # aiohttp rejects keepalive_timeout together with force_close=True.
+        if not self.force_close:
+            kwargs["keepalive_timeout"] = self.keepalive_timeout
+        return kwargs
+
+    def unix_connector_kwargs(self) -> dict:
+        """Returns the keyword arguments for an `aiohttp.UnixConnector`.
+
+        DNS and SSL options do not apply to a local socket and are left out.
+        """
+        kwargs = self.connector_kwargs()
+        for key in ("ttl_dns_cache", "use_dns_cache", "enable_cleanup_closed"):
+            kwargs.pop(key)
+        return kwargs
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """A point-in-time snapshot of connection pool usage.
+
+    Attributes:
+        open: Connections currently open (idle plus in use).
+        idle: Open connections waiting in the pool for reuse.
+        in_use: Connections currently serving a request.
+        created: Connections established since the client was created.
+        reused: Requests served by an already open pooled connection.
+        limit: Total connection limit of the pool (0 means unlimited).
+        limit_per_host: Per-endpoint connection limit (0 means unlimited).
+    """
+
+    open: int
+    idle: int
+    in_use: int
+    created: int
+    reused: int
+    limit: int
+    limit_per_host: int
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of connection acquisitions served from the pool."""
+        total = self.created + self.reused
+        return self.reused / total if total else 0.0
+
+
+class _PoolCounters:
+    """Counts connection creation and reuse via aiohttp trace hooks."""
+
+    def __init__(self) -> None:
+        self.created = 0
+        self.reused = 0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Builds a `TraceConfig` that feeds this counter."""
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_create)
+        trace_config.on_connection_reuseconn.append(self._on_reuse)
+        return trace_config
+
+    async def _on_create(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        self.created += 1
+
+    async def _on_reuse(
+        self, session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        self.reused += 1
+
+
+def _collect_pool_stats(
+    connector: Optional[aiohttp.BaseConnector], counters: _PoolCounters
+) -> PoolStats:
+    """Reads pool occupancy from an aiohttp connector.
+
+    aiohttp does not expose pool occupancy publicly, so the idle and acquired
+    collections are read defensively and reported as zero if unavailable.
+    """
+    idle = 0
+    in_use = 0
+    limit = 0
+    limit_per_host = 0
+    if connector is not None and not connector.closed:
+        conns = getattr(connector, "_conns", None) or {}
+        try:
+            idle = sum(len(bucket) for bucket in conns.values())
+        except (AttributeError, TypeError):
+            _LOGGER.debug("Unable to read idle connections from %r", connector)
+        in_use = len(getattr(connector, "_acquired", ()) or ())
+        limit = connector.limit
+        limit_per_host = connector.limit_per_host
+    return PoolStats(
+        open=idle + in_use,
+        idle=idle,
+        in_use=in_use,
+        created=counters.created,
+        reused=counters.reused,
+        limit=limit,
+        limit_per_host=limit_per_host,
+    )
@@ -0,0 +1,391 @@
+# src/bsm_api_client/event_hub.py
+"""Shared WebSocket event hub with per-subscriber queues.
+
+This module provides `EventHub`, exposed as `BedrockServerManagerApi.events`.
+The hub keeps one reconnecting WebSocket connection per client and fans
+incoming messages out to any number of local `Subscription` objects. Each
+subscription receives messages for its exact manager topics (e.g.
+`event:after_server_start`) and, optionally, messages whose topic matches
+local shell-style patterns (e.g. `task:*`), and has its own bounded queue
+with an `OverflowPolicy`, so a slow consumer cannot grow memory without
+limit. The manager only understands exact topic names: topics are
+subscribed on it when the first local subscriber asks for them and
+unsubscribed when the last one goes away, while patterns only filter the
+messages the connection already receives.
+"""
+
+import asyncio
+import collections
+import enum
+import fnmatch
+import logging
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .websocket_client import ReconnectPolicy, WebSocketClient
+
+if TYPE_CHECKING:
+    from .client_base import ClientBase
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.event_hub")
+
+# Characters that make a shell-style pattern; the manager has no wildcards.
+_PATTERN_CHARS = frozenset("*?[")
+
+
+class OverflowPolicy(str, enum.Enum):
+    """What a subscription does with a message when its queue is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    """Discard the oldest queued message to make room."""
+    DROP_NEWEST = "drop_newest"
+    """Discard the incoming message."""
+    BLOCK = "block"
+    """Wait for room. This pauses delivery to every subscriber."""
+
+
+@dataclass(frozen=True)
+class EventHubConfig:
+    """Configuration for the shared event hub.
+
+    Attributes:
+        queue_size: Default queue bound for new subscriptions.
+        overflow: Default `OverflowPolicy` for new subscriptions.
+        reconnect: Reconnect policy of the shared WebSocket connection.
+    """
+
+    queue_size: int = 256
+    overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    reconnect: ReconnectPolicy = ReconnectPolicy()
+
+    def __post_init__(self) -> None:
+        if self.queue_size < 1:
+            raise ValueError("queue_size must be at least 1.")
+        object.__setattr__(self, "overflow", OverflowPolicy(self.overflow))
+
+
+@dataclass(frozen=True)
+class EventHubStats:
+    """A snapshot of the event hub.
+
+    Attributes:
+        connected: Whether the shared WebSocket is open.
+        subscribers: Number of open local subscriptions.
+        topics: Manager-side topic subscriptions and their reference counts.
+        delivered: Messages dispatched to matching subscribers, including
+            ones then dropped by an overflow policy.
+        dropped: Messages discarded by overflow policies.
+    """
+
+    connected: bool
+    subscribers: int
+    topics: Dict[str, int]
+    delivered: int
+    dropped: int
+
+
+class Subscription:
+    """A local subscriber to the event hub.
+
+    Iterate over it (or call `get()`) to receive messages whose `topic` is
+    one of its topics or matches one of its patterns. Messages are shared
+    between subscribers and must not be mutated. Iteration ends when the
+    subscription or the hub is closed.
+    """
+
+    def __init__(
+        self,
+        hub: "EventHub",
+        topics: Tuple[str, ...],
+        patterns: Tuple[str, ...],
+        queue_size: int,
+        overflow: OverflowPolicy,
+    ) -> None:
+        self._hub = hub
+        self.topics = topics
+        self.patterns = patterns
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.dropped = 0
+        self._buffer: Deque[Dict[str, Any]] = collections.deque()
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+
+    @property
+    def closed(self) -> bool:
+        """Whether the subscription has been closed."""
+        return self._closed
+
+    @property
+    def pending(self) -> int:
+        """Number of queued messages."""
+        return len(self._buffer)
+
+    def matches(self, topic: str) -> bool:
+        """Returns whether `topic` is one of the topics or matches a pattern."""
+        return topic in self.topics or any(
+            fnmatch.fnmatchcase(topic, p) for p in self.patterns
+        )
+
+    def _offer(self, message: Dict[str, Any]) -> Optional[Awaitable[None]]:
+        """Queues `message`; returns an awaitable if the caller must wait."""
+        if self._closed:
+            return None
+        if len(self._buffer) >= self.queue_size:
+            if self.overflow is OverflowPolicy.BLOCK:
+                return self._put_when_writable(message)
+            self.dropped += 1
+            if self.overflow is OverflowPolicy.DROP_NEWEST:
+                return None
+            self._buffer.popleft()
+        self._buffer.append(message)
+        self._readable.set()
+        return None
+
+    async def _put_when_writable(self, message: Dict[str, Any]) -> None:
+        while len(self._buffer) >= self.queue_size:
+            self._writable.clear()
+            await self._writable.wait()
+            if self._closed:
+                return
+        self._buffer.append(message)
+        self._readable.set()
+
+    def _finish(self, error: Optional[BaseException] = None) -> None:
+        """Ends the subscription once the queued messages are consumed."""
+        if self._closed:
+            return
+        self._closed = True
+        self._error = error
+        self._readable.set()
+        self._writable.set()
+
+    async def get(self) -> Dict[str, Any]:
+        """Returns the next matching message.
+
+        Raises:
+            StopAsyncIteration: If the subscription is closed.
+            APIError: If the hub's connection failed for good.
+        """
+        while not self._buffer:
+            if self._closed:
+                if self._error is not None:
+                    raise self._error
+                raise StopAsyncIteration
+            self._readable.clear()
+            await self._readable.wait()
+        message = self._buffer.popleft()
+        self._writable.set()
+        return message
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        return await self.get()
+
+    async def close(self) -> None:
+        """Closes the subscription and releases its topics."""
+        if self._closed:
+            return
+        self._buffer.clear()
+        self._finish()
+        await self._hub._release(self)
+
+    async def __aenter__(self) -> "Subscription":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+
+class EventHub:
+    """Multiplexes one WebSocket connection across local subscribers.
+
+    Example:
+        ```python
+        async with await client.events.subscribe(
+            "event:after_server_start",
+            "event:after_server_stop",
+            queue_size=100,
+            overflow="drop_oldest",
+        ) as sub:
+            async for message in sub:
+                print(message["topic"])
+        ```
+    """
+
+    def __init__(
+        self, client: "ClientBase", config: Optional[EventHubConfig] = None
+    ) -> None:
+        """Initializes the hub. The connection is opened on first use.
+
+        Args:
+            client: The client whose WebSocket endpoint and token are used.
+            config: Hub configuration. Defaults to `EventHubConfig()`.
+        """
+        self._client = client
+        self.config = config or EventHubConfig()
+        self._ws: Optional[WebSocketClient] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self._subscribers: List[Subscription] = []
+        self._topics: Dict[str, int] = {}
+        self._delivered = 0
+        self._dropped = 0
+
+    async def subscribe(
+        self,
+        *topics: str,
+        patterns: Iterable[str] = (),
+        queue_size: Optional[int] = None,
+        overflow: Union[OverflowPolicy, str, None] = None,
+    ) -> Subscription:
+        """Creates a subscription for messages on `topics` or matching `patterns`.
+
+        Each topic is subscribed on the manager while at least one local
+        subscription uses it. Patterns are only matched locally against the
+        messages the connection receives, e.g. `task:*` for task updates the
+        manager sends without a subscription, or topics another subscriber
+        asked for.
+
+        Args:
+            *topics: Exact manager topics, e.g. `event:after_server_start`.
+            patterns: Shell-style patterns matched against message topics,
+                e.g. `task:*`. They are not sent to the manager.
+            queue_size: Queue bound. Defaults to `config.queue_size`.
+            overflow: Overflow policy. Defaults to `config.overflow`.
+
+        Returns:
+            The new `Subscription`.
+
+        Raises:
+            ValueError: If neither a topic nor a pattern is given, a topic
+                contains pattern characters (`*?[`), or `queue_size` is not
+                positive.
+            APIError: If the WebSocket connection cannot be opened.
+        """
+        patterns = tuple(dict.fromkeys(patterns))
+        if not topics and not patterns:
+            raise ValueError("At least one topic or pattern must be provided.")
+        wildcards = [t for t in topics if _PATTERN_CHARS.intersection(t)]
+        if wildcards:
+            raise ValueError(
+                f"Topics must be exact names, the manager has no wildcards: "
+                f"{wildcards}. Pass shell-style patterns as patterns=."
+            )
+        size = self.config.queue_size if queue_size is None else queue_size
+        if size < 1:
+            raise ValueError("queue_size must be at least 1.")
+        subscription = Subscription(
+            self,
+            tuple(dict.fromkeys(topics)),
+            patterns,
+            size,
+            OverflowPolicy(overflow or self.config.overflow),
+        )
+        async with self._lock:
+            ws = await self._ensure_connected()
+            added: List[str] = []
+            try:
+                for topic in subscription.topics:
+                    if topic not in self._topics:
+                        await ws.subscribe(topic)
+                    self._topics[topic] = self._topics.get(topic, 0) + 1
+                    added.append(topic)
+            except BaseException:
+                for topic in added:
+                    self._topics[topic] -= 1
+                    if not self._topics[topic]:
+                        del self._topics[topic]
+                raise
+            self._subscribers.append(subscription)
+        _LOGGER.debug(
+            "Added subscriber for %s",
+            subscription.topics + subscription.patterns,
+        )
+        return subscription
+
+    async def _ensure_connected(self) -> WebSocketClient:
+        if self._ws is None:
+            ws = await self._client.websocket_connect(reconnect=self.config.reconnect)
+            await ws.connect()
+            self._ws = ws
+            self._reader = asyncio.create_task(self._read(ws))
+        return self._ws
+
+    async def _release(self, subscription: Subscription) -> None:
+        async with self._lock:
+            if subscription not in self._subscribers:
+                return
+            self._subscribers.remove(subscription)
+            self._dropped += subscription.dropped
+            for topic in subscription.topics:
+                self._topics[topic] -= 1
+                if self._topics[topic] == 0:
+                    del self._topics[topic]
+                    if self._ws is not None:
+                        try:
+                            await self._ws.unsubscribe(topic)
+                        except Exception as e:
+                            _LOGGER.debug("Unsubscribing %s failed: %r", topic, e)
+
+    async def _read(self, ws: WebSocketClient) -> None:
+        error: Optional[BaseException] = None
+        try:
+            async for message in ws.listen():
+                topic = message.get("topic")
+                topic = topic if isinstance(topic, str) else ""
+                for subscription in list(self._subscribers):
+                    if not subscription.matches(topic):
+                        continue
+                    waiter = subscription._offer(message)
+                    if waiter is not None:
+                        await waiter
+                    self._delivered += 1
+        except Exception as e:
+            _LOGGER.error("Event hub connection failed: %s", e)
+            error = e
+        finally:
+            if self._ws is ws:
+                # Start over on the next subscribe().
+                self._ws = None
+                self._reader = None
+                self._topics.clear()
+                subscribers, self._subscribers = self._subscribers, []
+                for subscription in subscribers:
+                    self._dropped += subscription.dropped
+                    subscription._finish(error)
+
+    def stats(self) -> EventHubStats:
+        """Returns a snapshot of the hub's subscribers and counters."""
+        return EventHubStats(
+            connected=self._ws is not None and self._ws.stats().connected,
+            subscribers=len(self._subscribers),
+            topics=dict(self._topics),
+            delivered=self._delivered,
+            dropped=self._dropped + sum(s.dropped for s in self._subscribers),
+        )
+
+    async def close(self) -> None:
+        """Closes the connection and ends every subscription."""
+        ws, reader = self._ws, self._reader
+        if ws is None:
+            return
+        await ws.disconnect()
+        if reader is not None:
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
@@ -100,3 +100,27 @@ class APIServerSideError(APIError):
     """Indicates a server-side error on the API (e.g., 500 Internal Server Error)."""
 
     pass
+
+
+class CircuitOpenError(CannotConnectError):
+    """Raised without contacting the host while its circuit breaker is open.
+
+    The client has seen repeated connection failures for this host and fails
+    fast until the cooldown expires.
+    """
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ResponseTooLargeError(APIError):
+    """Raised when a download exceeds the caller's size limit.
+
+    The transfer is aborted as soon as the limit is exceeded (or up front if
+    the server announces a larger `Content-Length`).
+    """
+
+    def __init__(self, message: str, max_bytes: int):
+        super().__init__(message)
+        self.max_bytes = max_bytes
@@ -0,0 +1,419 @@
+# src/bsm_api_client/exporter.py
+"""OpenMetrics/Prometheus exporter for client and fleet metrics.
+
+This module provides `MetricsExporter`, which serves a `/metrics` endpoint
+from a small local aiohttp server. Fleet gauges (server status, version,
+process CPU and memory, known players) are collected from the manager on a
+background schedule with bounded concurrency, so a scrape only renders the
+last collected snapshot together with the client's request metrics
+(`ClientBase.metrics`) and never calls the manager itself.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
+
+from aiohttp import web
+
+from .exceptions import APIError
+
+if TYPE_CHECKING:
+    from .api_client import BedrockServerManagerApi
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.exporter")
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@dataclass(frozen=True)
+class ExporterConfig:
+    """Options for `MetricsExporter`.
+
+    Attributes:
+        interval: Seconds between two fleet collections.
+        max_concurrency: Maximum number of manager requests made at the same
+            time during a collection.
+        process_info: Whether to collect per-server CPU and memory usage
+            (one request per running server).
+        players: Whether to collect the number of players known to the
+            manager. This counts every player the manager has seen, not
+            the players currently online.
+        prefix: Prefix of all exported metric names.
+    """
+
+    interval: float = 30.0
+    max_concurrency: int = 4
+    process_info: bool = True
+    players: bool = True
+    prefix: str = "bsm"
+
+    def __post_init__(self) -> None:
+        if self.interval <= 0:
+            raise ValueError("interval must be positive.")
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+
+
+@dataclass(frozen=True)
+class _ServerSample:
+    name: str
+    status: str
+    version: str
+    cpu_percent: Optional[float] = None
+    memory_bytes: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class _FleetSample:
+    """The result of one fleet collection."""
+
+    collected_at: float = 0.0
+    duration: float = 0.0
+    up: bool = False
+    servers: Tuple[_ServerSample, ...] = ()
+    known_players: Optional[int] = None
+    errors: Mapping[str, int] = field(default_factory=dict)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _MetricWriter:
+    """Writes metric families in the OpenMetrics or Prometheus text format."""
+
+    def __init__(self, openmetrics: bool) -> None:
+        self.openmetrics = openmetrics
+        self._lines: List[str] = []
+
+    def family(self, name: str, metric_type: str, help_text: str) -> None:
+        # Prometheus 0.0.4 declares counters with their `_total` sample name;
+        # OpenMetrics declares the family name without it.
+        if metric_type == "counter" and not self.openmetrics:
+            name = f"{name}_total"
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {metric_type}")
+
+    def sample(self, name: str, labels: Mapping[str, str], value: float) -> None:
+        if labels:
+            rendered = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+            name = f"{name}{{{rendered}}}"
+        self._lines.append(f"{name} {_format_value(value)}")
+
+    def text(self) -> str:
+        if self.openmetrics:
+            self._lines.append("# EOF")
+        return "\n".join(self._lines) + "\n"
+
+
+def _as_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class MetricsExporter:
+    """Serves client request metrics and fleet gauges on `/metrics`.
+
+    Example:
+        ```python
+        async with MetricsExporter(client, port=9464):
+            await asyncio.Event().wait()
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "BedrockServerManagerApi",
+        config: Optional[ExporterConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 9464,
+    ) -> None:
+        """Initializes the exporter.
+
+        Args:
+            client: The client used to collect fleet data. Its request
+                metrics are exported as well.
+            config: Collection and naming options.
+            host: Address the HTTP server binds to.
+            port: Port the HTTP server listens on (0 picks a free port).
+        """
+        self._client = client
+        self.config = config or ExporterConfig()
+        self._host = host
+        self._port = port
+        self._fleet = _FleetSample()
+        self._errors: Dict[str, int] = {}
+        self._runner: Optional[web.AppRunner] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def port(self) -> Optional[int]:
+        """The port the server is listening on, once started."""
+        if self._runner is None or not self._runner.addresses:
+            return None
+        return self._runner.addresses[0][1]
+
+    async def __aenter__(self) -> "MetricsExporter":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        """Runs a first collection, then starts the HTTP server and schedule."""
+        await self.collect()
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self._host, self._port).start()
+        self._task = asyncio.create_task(self._collect_forever())
+        _LOGGER.info(
+            "Metrics exporter listening on http://%s:%s/metrics", self._host, self.port
+        )
+
+    async def stop(self) -> None:
+        """Stops the collection schedule and the HTTP server."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _collect_forever(self) -> None:
+        while True:
+            delay = self._fleet.collected_at + self.config.interval - time.time()
+            await asyncio.sleep(max(delay, 0.0))
+            try:
+                await self.collect()
+            except Exception:  # Keep the schedule alive; the next run retries.
+                _LOGGER.exception("Unexpected error during metrics collection.")
+
+    async def collect(self) -> None:
+        """Collects the fleet gauges once and replaces the cached snapshot.
+
+        Failures are logged and counted; the previous values are dropped
+        so stale readings are not exported as current.
+        """
+        started = time.monotonic()
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def call(stage: str, coro_factory) -> Any:
+            async with semaphore:
+                try:
+                    return await coro_factory()
+                except (APIError, asyncio.TimeoutError) as e:
+                    _LOGGER.warning("Metrics collection (%s) failed: %s", stage, e)
+                    self._errors[stage] = self._errors.get(stage, 0) + 1
+                    return None
+
+        servers_task = call("servers", self._client.async_get_servers)
+        if self.config.players:
+            servers_response, players_response = await asyncio.gather(
+                servers_task, call("players", self._client.async_get_players)
+            )
+        else:
+            servers_response, players_response = await servers_task, None
+
+        servers: List[Dict[str, Any]] = []
+        if servers_response is not None:
+            servers = [s for s in servers_response.servers or [] if s.get("name")]
+
+        process_info: List[Optional[Dict[str, Any]]] = [None] * len(servers)
+        if self.config.process_info:
+            running = [
+                i
+                for i, s in enumerate(servers)
+                if str(s.get("status", "")).upper() == "RUNNING"
+            ]
+            responses = await asyncio.gather(
+                *(
+                    call(
+                        "process_info",
+                        lambda name=servers[i]["name"]: (
+                            self._client.async_get_server_process_info(name)
+                        ),
+                    )
+                    for i in running
+                )
+            )
+            for i, response in zip(running, responses):
+                if response is not None and response.data:
+                    process_info[i] = response.data.get("process_info")
+
+        samples = []
+        for server, info in zip(servers, process_info):
+            info = info or {}
+            memory_mb = _as_float(info.get("memory_mb"))
+            samples.append(
+                _ServerSample(
+                    name=str(server["name"]),
+                    status=str(server.get("status", "UNKNOWN")).upper(),
+                    version=str(server.get("version", "UNKNOWN")),
+                    cpu_percent=_as_float(info.get("cpu_percent")),
+                    memory_bytes=(
+                        memory_mb * 1024 * 1024 if memory_mb is not None else None
+                    ),
+                )
+            )
+
+        known_players = None
+        if isinstance(players_response, dict):
+            players = players_response.get("players")
+            if isinstance(players, list):
+                known_players = len(players)
+
+        self._fleet = _FleetSample(
+            collected_at=time.time(),
+            duration=time.monotonic() - started,
+            up=servers_response is not None,
+            servers=tuple(samples),
+            known_players=known_players,
+            errors=dict(self._errors),
+        )
+
+    def render(self, openmetrics: bool = True) -> str:
+        """Renders the cached fleet snapshot and the client request metrics."""
+        p = self.config.prefix
+        w = _MetricWriter(openmetrics)
+        fleet = self._fleet
+
+        w.family(f"{p}_up", "gauge", "Whether the last collection reached the manager.")
+        w.sample(f"{p}_up", {}, 1 if fleet.up else 0)
+        w.family(
+            f"{p}_exporter_last_collection_timestamp_seconds",
+            "gauge",
+            "Time of the last fleet collection.",
+        )
+        w.sample(
+            f"{p}_exporter_last_collection_timestamp_seconds", {}, fleet.collected_at
+        )
+        w.family(
+            f"{p}_exporter_collection_duration_seconds",
+            "gauge",
+            "Duration of the last fleet collection.",
+        )
+        w.sample(f"{p}_exporter_collection_duration_seconds", {}, fleet.duration)
+        w.family(
+            f"{p}_exporter_collection_errors",
+            "counter",
+            "Failed manager requests during collections.",
+        )
+        for stage, count in sorted(fleet.errors.items()):
+            w.sample(f"{p}_exporter_collection_errors_total", {"stage": stage}, count)
+
+        w.family(f"{p}_server_info", "gauge", "Server version, always 1.")
+        for s in fleet.servers:
+            w.sample(f"{p}_server_info", {"server": s.name, "version": s.version}, 1)
+        w.family(f"{p}_server_status", "gauge", "Current server status, always 1.")
+        for s in fleet.servers:
+            w.sample(f"{p}_server_status", {"server": s.name, "status": s.status}, 1)
+        w.family(f"{p}_server_running", "gauge", "Whether the server is running.")
+        for s in fleet.servers:
+            w.sample(
+                f"{p}_server_running",
+                {"server": s.name},
+                1 if s.status == "RUNNING" else 0,
+            )
+        for attr, name, help_text in (
+            ("cpu_percent", "server_cpu_percent", "Server process CPU usage."),
+            ("memory_bytes", "server_memory_bytes", "Server process memory usage."),
+        ):
+            values = [(s.name, getattr(s, attr)) for s in fleet.servers]
+            values = [(n, v) for n, v in values if v is not None]
+            if values:
+                w.family(f"{p}_{name}", "gauge", help_text)
+                for server_name, value in values:
+                    w.sample(f"{p}_{name}", {"server": server_name}, value)
+        if fleet.known_players is not None:
+            w.family(
+                f"{p}_known_players",
+                "gauge",
+                "Players the manager has ever seen, online or not.",
+            )
+            w.sample(f"{p}_known_players", {}, fleet.known_players)
+
+        self._render_client_metrics(w, p)
+        return w.text()
+
+    def _render_client_metrics(self, w: _MetricWriter, p: str) -> None:
+        endpoints = sorted(
+            self._client.metrics.snapshot().endpoints.values(),
+            key=lambda m: (m.endpoint, m.method),
+        )
+        w.family(f"{p}_client_requests", "counter", "API requests by endpoint.")
+        for m in endpoints:
+            labels = {"method": m.method, "endpoint": m.endpoint}
+            w.sample(f"{p}_client_requests_total", labels, m.count)
+        w.family(
+            f"{p}_client_request_errors",
+            "counter",
+            "Failed API requests by endpoint and exception class.",
+        )
+        for m in endpoints:
+            for error, count in sorted(m.errors.items()):
+                labels = {"method": m.method, "endpoint": m.endpoint, "error": error}
+                w.sample(f"{p}_client_request_errors_total", labels, count)
+        w.family(
+            f"{p}_client_request_duration_seconds",
+            "histogram",
+            "API request latency by endpoint.",
+        )
+        for m in endpoints:
+            labels = {"method": m.method, "endpoint": m.endpoint}
+            for bound, count in m.latency_buckets:
+                w.sample(
+                    f"{p}_client_request_duration_seconds_bucket",
+                    {**labels, "le": _format_value(bound)},
+                    count,
+                )
+            w.sample(f"{p}_client_request_duration_seconds_count", labels, m.count)
+            w.sample(f"{p}_client_request_duration_seconds_sum", labels, m.latency_sum)
+        for attr, name, help_text in (
+            ("bytes_sent", "client_sent_bytes", "Request body bytes sent."),
+            (
+                "bytes_received",
+                "client_received_bytes",
+                "Response body bytes received.",
+            ),
+            (
+                "connection_wait",
+                "client_connection_wait_seconds",
+                "Time spent waiting for a connection.",
+            ),
+        ):
+            w.family(f"{p}_{name}", "counter", help_text)
+            for m in endpoints:
+                labels = {"method": m.method, "endpoint": m.endpoint}
+                w.sample(f"{p}_{name}_total", labels, getattr(m, attr))
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        openmetrics = "application/openmetrics-text" in request.headers.get(
+            "Accept", ""
+        )
+        response = web.Response(text=self.render(openmetrics))
+        # Set directly: web.Response(content_type=...) rejects parameters.
+        response.headers["Content-Type"] = (
+            OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE
+        )
+        return response
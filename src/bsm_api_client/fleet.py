@@ -0,0 +1,293 @@
+# src/bsm_api_client/fleet.py
+"""Client for a fleet of Bedrock Server Manager hosts.
+
+This module provides `FleetClient`, which owns one `BedrockServerManagerApi`
+per host, all sharing a single connection pool, and fans calls out to every
+host (or a subset) with a global and a per-host concurrency limit. Results
+are streamed as `HostResult` objects in completion order, so a slow or
+failing host neither holds back nor fails the others.
+"""
+
+import asyncio
+import contextlib
+import inspect
+import logging
+import time
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlparse
+
+import aiohttp
+
+from .api_client import BedrockServerManagerApi
+from .connection_pool import ConnectionPoolConfig
+from .metrics import ClientMetrics
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.fleet")
+
+T = TypeVar("T")
+
+FleetCall = Union[str, Callable[[BedrockServerManagerApi], Awaitable[Any]]]
+
+
+@dataclass(frozen=True)
+class HostResult(Generic[T]):
+    """The outcome of a fan-out call on one host.
+
+    Attributes:
+        host: The host name given to `FleetClient`.
+        result: The return value, if the call succeeded.
+        error: The exception raised by the call, if it failed (including
+            `asyncio.TimeoutError` when the per-host timeout expired).
+        elapsed: Seconds from the call starting on this host to its outcome,
+            excluding time spent waiting for a concurrency slot.
+    """
+
+    host: str
+    result: Optional[T] = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+    def unwrap(self) -> T:
+        """Returns the result or raises the error."""
+        if self.error is not None:
+            raise self.error
+        return self.result  # type: ignore[return-value]
+
+
+class FleetClient:
+    """Runs client calls across several managers with bounded fan-out.
+
+    Example:
+        ```python
+        async with FleetClient(
+            {"eu": "https://eu.example:11325", "us": "https://us.example:11325"},
+            username="admin",
+            password="secret",
+            max_concurrency=16,
+            per_host_concurrency=4,
+        ) as fleet:
+            async for res in fleet.stream("async_get_servers"):
+                print(res.host, res.result if res.ok else res.error)
+        ```
+    """
+
+    def __init__(
+        self,
+        hosts: Mapping[str, Union[str, Mapping[str, Any]]],
+        max_concurrency: Optional[int] = None,
+        per_host_concurrency: Optional[int] = None,
+        pool_config: Optional[ConnectionPoolConfig] = None,
+        verify_ssl: bool = True,
+        **client_kwargs: Any,
+    ) -> None:
+        """Initializes the fleet client.
+
+        Args:
+            hosts: Host name to base URL, or to a mapping of
+                `BedrockServerManagerApi` keyword arguments (which must
+                include `base_url`) overriding `client_kwargs` for that host.
+            max_concurrency: Maximum number of calls running at once across
+                the fleet. `None` means unlimited.
+            per_host_concurrency: Maximum number of calls running at once on
+                a single host. `None` means unlimited.
+            pool_config: Tuning for the shared connection pool.
+            verify_ssl: Whether to verify SSL certificates. Applies to the
+                shared pool, so it cannot differ between hosts.
+            **client_kwargs: Keyword arguments passed to every
+                `BedrockServerManagerApi` (e.g. `username`, `password`,
+                `retry_policy`).
+
+        Raises:
+            ValueError: If no hosts are given or a limit is not positive.
+        """
+        if not hosts:
+            raise ValueError("At least one host must be provided.")
+        for name, limit in (
+            ("max_concurrency", max_concurrency),
+            ("per_host_concurrency", per_host_concurrency),
+        ):
+            if limit is not None and limit < 1:
+                raise ValueError(f"{name} must be at least 1.")
+        for key in ("session", "verify_ssl", "pool_config"):
+            if key in client_kwargs:
+                raise ValueError(f"{key} is managed by FleetClient.")
+
+        connector_kwargs = (pool_config or ConnectionPoolConfig()).connector_kwargs()
+        if not verify_ssl:
+            connector_kwargs["ssl"] = False
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(**connector_kwargs),
+            trace_configs=[ClientMetrics.trace_config()],
+        )
+        self._global_limit = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        )
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._clients: Dict[str, BedrockServerManagerApi] = {}
+        for host, spec in hosts.items():
+            kwargs = dict(client_kwargs)
+            if isinstance(spec, str):
+                kwargs["base_url"] = spec
+            else:
+                kwargs.update(spec)
+            unix = kwargs.get("unix_socket") or (
+                urlparse(kwargs.get("base_url", "")).scheme == "unix"
+            )
+            # Unix socket hosts keep their own session with a UnixConnector.
+            if not unix:
+                kwargs["session"] = self._session
+            kwargs.setdefault("verify_ssl", verify_ssl)
+            self._clients[host] = BedrockServerManagerApi(**kwargs)
+            if per_host_concurrency:
+                self._host_limits[host] = asyncio.Semaphore(per_host_concurrency)
+
+    @property
+    def hosts(self) -> List[str]:
+        """The host names, in the order given."""
+        return list(self._clients)
+
+    @property
+    def clients(self) -> Mapping[str, BedrockServerManagerApi]:
+        """The per-host clients."""
+        return dict(self._clients)
+
+    def __getitem__(self, host: str) -> BedrockServerManagerApi:
+        return self._clients[host]
+
+    async def __aenter__(self) -> "FleetClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes every client and the shared connection pool."""
+        await asyncio.gather(*(client.close() for client in self._clients.values()))
+        if not self._session.closed:
+            await self._session.close()
+
+    def _resolve(
+        self, call: FleetCall, args: tuple, kwargs: dict
+    ) -> Callable[[BedrockServerManagerApi], Awaitable[Any]]:
+        if callable(call):
+            if args or kwargs:
+                raise TypeError("Arguments can only be given with a method name.")
+            return call
+        if call.startswith("_") or not inspect.iscoroutinefunction(
+            getattr(BedrockServerManagerApi, call, None)
+        ):
+            raise ValueError(f"'{call}' is not a public async client method.")
+        return lambda client: getattr(client, call)(*args, **kwargs)
+
+    def _select(self, hosts: Optional[Iterable[str]]) -> List[str]:
+        if hosts is None:
+            return list(self._clients)
+        selected = list(dict.fromkeys(hosts))
+        unknown = [h for h in selected if h not in self._clients]
+        if unknown:
+            raise KeyError(f"Unknown hosts: {unknown}")
+        return selected
+
+    async def _run_on(
+        self,
+        host: str,
+        func: Callable[[BedrockServerManagerApi], Awaitable[Any]],
+        timeout: Optional[float],
+    ) -> HostResult:
+        # Take the host slot first so a busy host does not hold global slots.
+        async with self._host_limits.get(host) or contextlib.nullcontext():
+            async with self._global_limit or contextlib.nullcontext():
+                started = time.monotonic()
+                try:
+                    if timeout is None:
+                        result = await func(self._clients[host])
+                    else:
+                        result = await asyncio.wait_for(
+                            func(self._clients[host]), timeout
+                        )
+                except Exception as e:
+                    _LOGGER.debug("Fleet call on %s failed: %r", host, e)
+                    return HostResult(host, error=e, elapsed=time.monotonic() - started)
+                return HostResult(
+                    host, result=result, elapsed=time.monotonic() - started
+                )
+
+    async def stream(
+        self,
+        call: FleetCall,
+        *args: Any,
+        hosts: Optional[Iterable[str]] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[HostResult]:
+        """Runs a call on each host and yields results as they complete.
+
+        Leaving the iteration early cancels the calls still pending.
+
+        Args:
+            call: A client method name (e.g. `"async_get_servers"`), called
+                with `args` and `kwargs`, or a coroutine function taking the
+                host's client.
+            *args: Positional arguments for the method.
+            hosts: Host names to run on. Defaults to all hosts.
+            timeout: Optional per-host time limit in seconds, counted once
+                the call has a concurrency slot.
+            **kwargs: Keyword arguments for the method.
+
+        Yields:
+            One `HostResult` per host, in completion order.
+
+        Raises:
+            ValueError: If `call` is not a public async client method.
+            KeyError: If `hosts` contains unknown host names.
+        """
+        func = self._resolve(call, args, kwargs)
+        tasks = [
+            asyncio.create_task(self._run_on(host, func, timeout))
+            for host in self._select(hosts)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def gather(
+        self,
+        call: FleetCall,
+        *args: Any,
+        hosts: Optional[Iterable[str]] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, HostResult]:
+        """Runs a call on each host and returns all results by host.
+
+        Takes the same arguments as `stream()`.
+        """
+        results: Dict[str, HostResult] = {}
+        async for result in self.stream(
+            call, *args, hosts=hosts, timeout=timeout, **kwargs
+        ):
+            results[result.host] = result
+        return results
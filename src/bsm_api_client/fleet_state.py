@@ -0,0 +1,449 @@
+# src/bsm_api_client/fleet_state.py
+"""Event-sourced in-memory mirror of a manager's servers.
+
+This module provides `FleetState`. It loads the server list once, keeps it
+current from WebSocket events received through the client's shared
+`EventHub`, and periodically reconciles with `/servers` to correct drift,
+such as events missed while the connection was down. Reads are synchronous
+dictionary lookups, so any number of consumers can share one mirror (and
+register change listeners) instead of each polling `/servers`.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .client_base import ClientBase
+    from .event_hub import Subscription
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.fleet_state")
+
+DEFAULT_STATE_TOPICS = (
+    "event:after_server_statuses_updated",
+    "event:after_server_start",
+    "event:after_server_stop",
+    "event:after_server_updated",
+    "event:after_delete_server_data",
+)
+
+# Lifecycle events that only name the server; the topic implies its status.
+_TOPIC_STATUSES = {
+    "event:after_server_start": "RUNNING",
+    "event:after_server_stop": "STOPPED",
+}
+_DELETE_TOPIC = "event:after_delete_server_data"
+
+
+@dataclass(frozen=True)
+class ServerStateUpdate:
+    """Server state carried by a WebSocket event.
+
+    Attributes:
+        servers: Rows to add or update. Each has at least a `name`.
+        removed: Names of servers that no longer exist.
+        complete: Whether `servers` is the full server list, so that any
+            server missing from it was removed.
+    """
+
+    servers: Tuple[Dict[str, Any], ...] = ()
+    removed: Tuple[str, ...] = ()
+    complete: bool = False
+
+
+def server_state_from_event(message: Mapping[str, Any]) -> Optional[ServerStateUpdate]:
+    """Extracts the server state carried by a WebSocket event.
+
+    Understands payloads with a full server list (`servers` or
+    `servers_data`), a server's `status`, and start, stop and delete events
+    for a `server_name`.
+
+    Args:
+        message: A message from `WebSocketClient.listen()`.
+
+    Returns:
+        The update, or None if the event does not carry enough state (e.g.
+        `after_server_updated`, or a failed action) and the server list has
+        to be fetched.
+    """
+    data = message.get("data")
+    if not isinstance(data, dict):
+        return None
+    for key in ("servers", "servers_data"):
+        servers = data.get(key)
+        if isinstance(servers, list) and all(
+            isinstance(s, dict) and isinstance(s.get("name"), str) for s in servers
+        ):
+            return ServerStateUpdate(servers=tuple(servers), complete=True)
+
+    name = data.get("server_name") or data.get("name")
+    if not isinstance(name, str):
+        return None
+    result = data.get("result")
+    if isinstance(result, dict) and result.get("status") == "error":
+        return None
+    topic = message.get("topic")
+    status = data.get("status")
+    if not isinstance(status, str):
+        status = _TOPIC_STATUSES.get(topic)
+    if status is not None:
+        row = {"name": name, "status": status}
+        if isinstance(data.get("version"), str):
+            row["version"] = data["version"]
+        return ServerStateUpdate(servers=(row,))
+    if topic == _DELETE_TOPIC:
+        return ServerStateUpdate(removed=(name,))
+    return None
+
+
+@dataclass(frozen=True)
+class FleetStateConfig:
+    """Configuration for `FleetState`.
+
+    Attributes:
+        reconcile_interval: Seconds between full fetches that correct drift.
+            `None` disables periodic reconciliation.
+        refresh_delay: When events arrive that carry no usable state, one
+            fetch is made this many seconds after the first of them.
+        topics: WebSocket topics to follow.
+    """
+
+    reconcile_interval: Optional[float] = 60.0
+    refresh_delay: float = 0.25
+    topics: Tuple[str, ...] = DEFAULT_STATE_TOPICS
+
+    def __post_init__(self) -> None:
+        if self.reconcile_interval is not None and self.reconcile_interval <= 0:
+            raise ValueError("reconcile_interval must be positive.")
+        if self.refresh_delay < 0:
+            raise ValueError("refresh_delay cannot be negative.")
+        if not self.topics:
+            raise ValueError("At least one topic must be provided.")
+        object.__setattr__(self, "topics", tuple(self.topics))
+
+
+@dataclass(frozen=True)
+class ServerChange:
+    """A change to one server in a `FleetState`.
+
+    Attributes:
+        name: The server name.
+        previous: The server's row before the change, or None if it was added.
+        current: The server's row after the change, or None if it was removed.
+        source: `"event"` if a WebSocket event carried the change, `"fetch"`
+            if it was found by fetching the server list.
+    """
+
+    name: str
+    previous: Optional[Mapping[str, Any]]
+    current: Optional[Mapping[str, Any]]
+    source: str
+
+    @property
+    def added(self) -> bool:
+        """Whether the server is new."""
+        return self.previous is None
+
+    @property
+    def removed(self) -> bool:
+        """Whether the server was removed."""
+        return self.current is None
+
+
+@dataclass(frozen=True)
+class FleetStateStats:
+    """A snapshot of a `FleetState`.
+
+    Attributes:
+        servers: Number of known servers.
+        live: Whether events are being received.
+        events: WebSocket events received.
+        fetches: Server list fetches, including the initial one.
+        corrections: Changes found by periodic reconciliation, i.e. drift
+            that events did not account for.
+        last_sync: `time.monotonic()` of the last completed fetch.
+    """
+
+    servers: int
+    live: bool
+    events: int
+    fetches: int
+    corrections: int
+    last_sync: Optional[float]
+
+
+ChangeListener = Callable[[ServerChange], Union[None, Awaitable[None]]]
+
+
+class FleetState:
+    """In-memory mirror of a manager's servers, kept current by events.
+
+    Example:
+        ```python
+        async with FleetState(client) as fleet:
+            fleet.add_listener(lambda change: print(change.name, change.current))
+            if fleet.status("survival") == "RUNNING":
+                ...
+        ```
+
+    Rows are the dictionaries returned by `async_get_servers`. They are
+    replaced, never modified, on change and must not be mutated.
+    """
+
+    def __init__(
+        self, client: "ClientBase", config: Optional[FleetStateConfig] = None
+    ) -> None:
+        """Initializes the mirror. Call `start()` (or enter it) to load it.
+
+        Args:
+            client: The client whose server list and event hub are used.
+            config: Mirror configuration. Defaults to `FleetStateConfig()`.
+        """
+        self._client = client
+        self.config = config or FleetStateConfig()
+        self._servers: Dict[str, Mapping[str, Any]] = {}
+        self._listeners: List[ChangeListener] = []
+        self._subscription: Optional["Subscription"] = None
+        self._tasks: List[asyncio.Task] = []
+        self._refresh: Optional[asyncio.Task] = None
+        self._started = False
+        self._closed = False
+        # Event generation and, per server, the generation that last changed
+        # it, so that a fetch does not undo events that arrived meanwhile.
+        self._generation = 0
+        self._touched: Dict[str, int] = {}
+        self._events = 0
+        self._fetches = 0
+        self._corrections = 0
+        self._last_sync: Optional[float] = None
+
+    async def start(self) -> None:
+        """Subscribes to events and loads the server list.
+
+        Raises:
+            APIError: If the event subscription or the initial fetch fails.
+        """
+        if self._started:
+            return
+        if self._closed:
+            raise RuntimeError("The fleet state is closed.")
+        self._started = True
+        try:
+            # Subscribe first so that no change is lost between the two.
+            self._subscription = await self._client.events.subscribe(
+                *self.config.topics
+            )
+            await self._sync("seed")
+        except BaseException:
+            self._started = False
+            if self._subscription is not None:
+                await self._subscription.close()
+                self._subscription = None
+            raise
+        self._tasks.append(asyncio.create_task(self._read(self._subscription)))
+        if self.config.reconcile_interval is not None:
+            self._tasks.append(asyncio.create_task(self._reconcile_periodically()))
+        _LOGGER.debug("Fleet state started with %d servers.", len(self._servers))
+
+    def get(self, name: str) -> Optional[Mapping[str, Any]]:
+        """Returns the row of server `name`, or None if it is unknown."""
+        return self._servers.get(name)
+
+    def status(self, name: str) -> Optional[str]:
+        """Returns the upper-cased status of server `name`, if known."""
+        row = self._servers.get(name)
+        status = row.get("status") if row is not None else None
+        return status.upper() if isinstance(status, str) else None
+
+    def servers(self) -> Dict[str, Mapping[str, Any]]:
+        """Returns a copy of all rows, keyed by server name."""
+        return dict(self._servers)
+
+    def __getitem__(self, name: str) -> Mapping[str, Any]:
+        return self._servers[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._servers
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._servers))
+
+    def __len__(self) -> int:
+        return len(self._servers)
+
+    def add_listener(self, listener: ChangeListener) -> Callable[[], None]:
+        """Registers a callback (sync or async) called for every change.
+
+        Listeners run in the mirror's event task, one change at a time, so
+        slow listeners delay later updates. Exceptions are logged.
+
+        Returns:
+            A function that removes the listener.
+        """
+        self._listeners.append(listener)
+
+        def remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return remove
+
+    async def reconcile(self) -> List[ServerChange]:
+        """Fetches the server list now and applies any differences.
+
+        Returns:
+            The changes found.
+        """
+        return await self._sync("reconcile")
+
+    async def _sync(self, reason: str) -> List[ServerChange]:
+        since = self._generation
+        response = await self._client.async_get_servers()
+        rows = {s["name"]: s for s in response.servers if isinstance(s, dict)}
+        changes = []
+        for name in list(self._servers) + [n for n in rows if n not in self._servers]:
+            if self._touched.get(name, 0) > since:
+                # An event changed it after the fetch was sent.
+                continue
+            change = self._set(name, rows.get(name), "fetch")
+            if change is not None:
+                changes.append(change)
+        self._fetches += 1
+        self._last_sync = time.monotonic()
+        if reason == "reconcile" and changes:
+            self._corrections += len(changes)
+            _LOGGER.info("Reconciliation corrected %d server(s).", len(changes))
+        await self._notify(changes)
+        return changes
+
+    def _set(
+        self, name: str, row: Optional[Mapping[str, Any]], source: str
+    ) -> Optional[ServerChange]:
+        previous = self._servers.get(name)
+        if previous == row:
+            return None
+        if row is None:
+            del self._servers[name]
+        else:
+            self._servers[name] = row
+        return ServerChange(name, previous, row, source)
+
+    async def _apply(self, update: ServerStateUpdate) -> None:
+        self._generation += 1
+        rows: List[Tuple[str, Optional[Mapping[str, Any]]]]
+        if update.complete:
+            latest = {s["name"]: s for s in update.servers}
+            rows = [(n, None) for n in self._servers if n not in latest]
+            rows += list(latest.items())
+        else:
+            rows = [
+                (s["name"], {**self._servers.get(s["name"], {}), **s})
+                for s in update.servers
+            ]
+        rows += [(name, None) for name in update.removed]
+        changes = []
+        for name, row in rows:
+            self._touched[name] = self._generation
+            change = self._set(name, row, "event")
+            if change is not None:
+                changes.append(change)
+        await self._notify(changes)
+
+    async def _notify(self, changes: List[ServerChange]) -> None:
+        for change in changes:
+            for listener in list(self._listeners):
+                try:
+                    result = listener(change)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    _LOGGER.exception("Fleet state listener failed.")
+
+    async def _read(self, subscription: "Subscription") -> None:
+        try:
+            async for message in subscription:
+                self._events += 1
+                update = server_state_from_event(message)
+                if update is None:
+                    self._schedule_refresh()
+                else:
+                    await self._apply(update)
+        except Exception as e:
+            _LOGGER.error("Fleet state event stream failed: %s", e)
+        if not self._closed:
+            _LOGGER.warning(
+                "Fleet state no longer receives events; only reconciliation "
+                "keeps it current."
+            )
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh is None or self._refresh.done():
+            self._refresh = asyncio.create_task(self._delayed_refresh())
+
+    async def _delayed_refresh(self) -> None:
+        await asyncio.sleep(self.config.refresh_delay)
+        try:
+            await self._sync("event")
+        except Exception as e:
+            _LOGGER.warning("Fleet state refresh failed: %s", e)
+
+    async def _reconcile_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.reconcile_interval)
+            try:
+                await self._sync("reconcile")
+            except Exception as e:
+                _LOGGER.warning("Fleet state reconciliation failed: %s", e)
+
+    def stats(self) -> FleetStateStats:
+        """Returns a snapshot of the mirror's size and counters."""
+        subscription = self._subscription
+        return FleetStateStats(
+            servers=len(self._servers),
+            live=bool(
+                subscription is not None
+                and not subscription.closed
+                and self._tasks
+                and not self._tasks[0].done()
+            ),
+            events=self._events,
+            fetches=self._fetches,
+            corrections=self._corrections,
+            last_sync=self._last_sync,
+        )
+
+    async def close(self) -> None:
+        """Stops following events and reconciling. The rows stay readable."""
+        if self._closed:
+            return
+        self._closed = True
+        tasks = self._tasks + ([self._refresh] if self._refresh else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+        self._refresh = None
+        if self._subscription is not None:
+            await self._subscription.close()
+
+    async def __aenter__(self) -> "FleetState":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -0,0 +1,98 @@
+# src/bsm_api_client/json_codec.py
+"""JSON encoding/decoding backends for the API client.
+
+This module provides the `JsonCodec` used by `ClientBase` and
+`WebSocketClient` to decode response bodies and WebSocket frames straight
+from their raw payload, and to encode request bodies. The standard library
+`json` module is always available; `orjson` is used when installed
+(`pip install bsm-api-client[speedups]`) and the codec is set to "auto".
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.json")
+
+JsonLoads = Callable[[Union[bytes, str]], Any]
+JsonDumps = Callable[[Any], str]
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _orjson_dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode("utf-8")
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """A pair of JSON decode/encode callables.
+
+    Attributes:
+        name: A short name identifying the codec (e.g., "json", "orjson").
+        loads: Decodes a `bytes` or `str` payload. Must raise `ValueError`
+            (or a subclass such as `json.JSONDecodeError`) on malformed input.
+        dumps: Encodes a Python object to a JSON `str`.
+    """
+
+    name: str
+    loads: JsonLoads
+    dumps: JsonDumps = _stdlib_dumps
+
+
+STDLIB_CODEC = JsonCodec(name="json", loads=json.loads, dumps=_stdlib_dumps)
+ORJSON_CODEC: Optional[JsonCodec] = (
+    JsonCodec(name="orjson", loads=orjson.loads, dumps=_orjson_dumps)
+    if orjson is not None
+    else None
+)
+
+
+def resolve_json_codec(
+    codec: Union[str, JsonCodec, JsonLoads, None] = "auto",
+) -> JsonCodec:
+    """Resolves a codec setting into a `JsonCodec`.
+
+    Args:
+        codec: One of:
+            - "auto" or `None`: orjson if installed, otherwise the stdlib.
+            - "json": the standard library `json` module.
+            - "orjson": orjson (raises `ValueError` if it is not installed).
+            - A `JsonCodec` instance, used as-is.
+            - A callable, used as the decoder with the stdlib encoder.
+
+    Returns:
+        The resolved `JsonCodec`.
+
+    Raises:
+        ValueError: If the codec name is unknown or orjson is requested but
+            not installed.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None or codec == "auto":
+        return ORJSON_CODEC or STDLIB_CODEC
+    if codec == "json":
+        return STDLIB_CODEC
+    if codec == "orjson":
+        if ORJSON_CODEC is None:
+            raise ValueError(
+                "json_codec='orjson' requested but orjson is not installed. "
+                "Install it with `pip install bsm-api-client[speedups]`."
+            )
+        return ORJSON_CODEC
+    if callable(codec):
+        name = getattr(codec, "__qualname__", None) or type(codec).__name__
+        return JsonCodec(name=f"custom:{name}", loads=codec)
+    raise ValueError(
+        f"Invalid json_codec: {codec!r}. Expected 'auto', 'json', 'orjson', "
+        "a JsonCodec or a callable."
+    )
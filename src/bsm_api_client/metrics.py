@@ -0,0 +1,413 @@
+# src/bsm_api_client/metrics.py
+"""Per-endpoint request metrics for the API client.
+
+This module provides `ClientMetrics`, exposed as `ClientBase.metrics`, which
+records for every logical endpoint (e.g. `GET /server/{name}/status`) the
+request count, errors by exception class, a latency histogram, bytes sent
+and received, and the time spent waiting for a connection. Latency and
+outcome are measured by `ClientBase` around each request attempt; bytes and
+connection wait are collected through aiohttp trace hooks, which are only
+installed on the internally created session.
+"""
+
+import contextlib
+import contextvars
+import logging
+import time
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.metrics")
+
+# Upper bounds in seconds; a final +Inf bucket is implied.
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+
+# Path templates, checked in order. `{...}` segments are replaced by the
+# placeholder and `*` keeps the actual segment. Paths matching no template
+# are reported as they are, which is fine for the client's static paths.
+DEFAULT_ENDPOINT_TEMPLATES: Tuple[str, ...] = (
+    "/server/install",
+    "/server/{name}/backup/list/{backup_type}",
+    "/server/{name}/*",
+    "/server/{name}/*/*",
+    "/plugins/reload",
+    "/plugins/trigger_event",
+    "/plugins/{plugin_name}",
+    "/tasks/status/{task_id}",
+)
+
+# The sample of the request being measured in the current task. Set by
+# `ClientMetrics.measure()` and passed to aiohttp as `trace_request_ctx`.
+_ACTIVE_SAMPLE: contextvars.ContextVar[Optional["_RequestSample"]] = (
+    contextvars.ContextVar("bsm_api_client_metrics_sample", default=None)
+)
+
+
+@dataclass(frozen=True)
+class MetricsConfig:
+    """Options for the per-endpoint metrics.
+
+    Attributes:
+        latency_buckets: Upper bounds (seconds) of the latency histogram
+            buckets, in increasing order.
+        endpoint_templates: Path templates used to group requests by logical
+            endpoint. `{...}` segments match any value and `*` matches any
+            value but keeps it in the endpoint name.
+    """
+
+    latency_buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    endpoint_templates: Tuple[str, ...] = DEFAULT_ENDPOINT_TEMPLATES
+
+    def __post_init__(self) -> None:
+        buckets = tuple(float(b) for b in self.latency_buckets)
+        if not buckets or list(buckets) != sorted(set(buckets)) or buckets[0] <= 0:
+            raise ValueError(
+                "latency_buckets must be positive and strictly increasing."
+            )
+        object.__setattr__(self, "latency_buckets", buckets)
+
+
+@dataclass(frozen=True)
+class EndpointMetrics:
+    """Metrics for one logical endpoint.
+
+    Attributes:
+        method: The HTTP method.
+        endpoint: The path template, e.g. `/server/{name}/status`.
+        count: Completed requests, including failed ones.
+        errors: Failed requests by exception class name.
+        latency_sum: Total request time in seconds.
+        latency_buckets: Cumulative `(upper bound, count)` pairs; the last
+            bound is `inf`.
+        bytes_sent: Request body bytes sent.
+        bytes_received: Response body bytes received.
+        connection_wait: Total seconds spent waiting for a pooled connection
+            or establishing a new one.
+        connection_wait_max: Longest single connection wait in seconds.
+    """
+
+    method: str
+    endpoint: str
+    count: int
+    errors: Mapping[str, int]
+    latency_sum: float
+    latency_buckets: Tuple[Tuple[float, int], ...]
+    bytes_sent: int
+    bytes_received: int
+    connection_wait: float
+    connection_wait_max: float
+
+    @property
+    def error_count(self) -> int:
+        """Total number of failed requests."""
+        return sum(self.errors.values())
+
+    @property
+    def average_latency(self) -> float:
+        """Mean request time in seconds."""
+        return self.latency_sum / self.count if self.count else 0.0
+
+    def latency_quantile(self, q: float) -> float:
+        """Estimates a latency quantile (0..1) from the histogram.
+
+        Returns the upper bound of the bucket containing the quantile, or the
+        largest finite bound if it falls in the overflow bucket.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for bound, cumulative in self.latency_buckets:
+            if cumulative >= rank and bound != float("inf"):
+                return bound
+        return self.latency_buckets[-2][0]
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """A point-in-time copy of the per-endpoint metrics.
+
+    Attributes:
+        endpoints: Metrics per `(method, endpoint)`.
+        since: Wall-clock time (`time.time()`) the metrics were last reset.
+    """
+
+    endpoints: Mapping[Tuple[str, str], EndpointMetrics] = field(default_factory=dict)
+    since: float = 0.0
+
+    def get(self, method: str, endpoint: str) -> Optional[EndpointMetrics]:
+        """Returns the metrics of one endpoint, if it has been called."""
+        return self.endpoints.get((method.upper(), endpoint))
+
+    def slowest(self, limit: int = 10) -> List[EndpointMetrics]:
+        """Returns the endpoints with the highest total time spent."""
+        return sorted(
+            self.endpoints.values(), key=lambda m: m.latency_sum, reverse=True
+        )[:limit]
+
+
+class _RequestSample:
+    """Measurements of one request attempt, filled in by the trace hooks."""
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "bytes_sent",
+        "bytes_received",
+        "connection_wait",
+        "_wait_started",
+    )
+
+    def __init__(self, method: str, endpoint: str) -> None:
+        self.method = method
+        self.endpoint = endpoint
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.connection_wait = 0.0
+        self._wait_started: Optional[float] = None
+
+
+class _EndpointCounters:
+    """Mutable accumulators for one endpoint."""
+
+    __slots__ = (
+        "count",
+        "errors",
+        "latency_sum",
+        "bucket_counts",
+        "bytes_sent",
+        "bytes_received",
+        "connection_wait",
+        "connection_wait_max",
+    )
+
+    def __init__(self, bucket_count: int) -> None:
+        self.count = 0
+        self.errors: Dict[str, int] = {}
+        self.latency_sum = 0.0
+        # One count per bucket plus the overflow bucket; not cumulative.
+        self.bucket_counts = [0] * (bucket_count + 1)
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.connection_wait = 0.0
+        self.connection_wait_max = 0.0
+
+
+def _split(path: str) -> List[str]:
+    return path.strip("/").split("/")
+
+
+class ClientMetrics:
+    """Collects per-endpoint request metrics for one client."""
+
+    def __init__(
+        self, config: Optional[MetricsConfig] = None, enabled: bool = True
+    ) -> None:
+        self.config = config or MetricsConfig()
+        self.enabled = enabled
+        self._templates = [
+            (template, _split(template)) for template in self.config.endpoint_templates
+        ]
+        self._template_cache: Dict[str, str] = {}
+        self._counters: Dict[Tuple[str, str], _EndpointCounters] = {}
+        self._since = time.time()
+
+    def endpoint_for(self, path: str) -> str:
+        """Returns the endpoint template for a request path (query excluded)."""
+        path = path.split("?", 1)[0]
+        cached = self._template_cache.get(path)
+        if cached is not None:
+            return cached
+        segments = _split(path)
+        endpoint = path
+        for template, parts in self._templates:
+            if len(parts) == len(segments) and all(
+                p == s or p == "*" or p.startswith("{") for p, s in zip(parts, segments)
+            ):
+                endpoint = "/" + "/".join(
+                    s if p == "*" else p for p, s in zip(parts, segments)
+                )
+                break
+        if len(self._template_cache) < 1024:
+            self._template_cache[path] = endpoint
+        return endpoint
+
+    @contextlib.contextmanager
+    def measure(self, method: str, path: str) -> Iterator[Optional[_RequestSample]]:
+        """Measures one request attempt made inside the block.
+
+        Yields the sample to pass to aiohttp as `trace_request_ctx` (`None`
+        when metrics are disabled). The outcome is taken from the exception
+        leaving the block, if any; cancellations are not recorded.
+        """
+        if not self.enabled:
+            yield None
+            return
+        sample = _RequestSample(method.upper(), self.endpoint_for(path))
+        token = _ACTIVE_SAMPLE.set(sample)
+        started = time.perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            yield sample
+        except Exception as exc:
+            error = exc
+            raise
+        except BaseException:
+            sample = None
+            raise
+        finally:
+            _ACTIVE_SAMPLE.reset(token)
+            if sample is not None:
+                self._record(sample, time.perf_counter() - started, error)
+
+    def observe(
+        self,
+        method: str,
+        path: str,
+        elapsed: float,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Records an operation timed outside `measure()`, e.g. a WebSocket ping.
+
+        Args:
+            method: The method label, e.g. `"PING"`.
+            path: The path, grouped by the endpoint templates.
+            elapsed: The latency in seconds.
+            error: The failure, if the operation failed.
+        """
+        if self.enabled:
+            sample = _RequestSample(method.upper(), self.endpoint_for(path))
+            self._record(sample, elapsed, error)
+
+    @staticmethod
+    def active_sample() -> Optional[_RequestSample]:
+        """Returns the sample of the request measured in the current task."""
+        return _ACTIVE_SAMPLE.get()
+
+    def _record(
+        self,
+        sample: _RequestSample,
+        elapsed: float,
+        error: Optional[BaseException],
+    ) -> None:
+        key = (sample.method, sample.endpoint)
+        counters = self._counters.get(key)
+        if counters is None:
+            counters = self._counters[key] = _EndpointCounters(
+                len(self.config.latency_buckets)
+            )
+        counters.count += 1
+        if error is not None:
+            name = type(error).__name__
+            counters.errors[name] = counters.errors.get(name, 0) + 1
+        counters.latency_sum += elapsed
+        index = len(self.config.latency_buckets)
+        for i, bound in enumerate(self.config.latency_buckets):
+            if elapsed <= bound:
+                index = i
+                break
+        counters.bucket_counts[index] += 1
+        counters.bytes_sent += sample.bytes_sent
+        counters.bytes_received += sample.bytes_received
+        counters.connection_wait += sample.connection_wait
+        if sample.connection_wait > counters.connection_wait_max:
+            counters.connection_wait_max = sample.connection_wait
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Returns a copy of the metrics collected since the last reset."""
+        bounds = self.config.latency_buckets + (float("inf"),)
+        endpoints: Dict[Tuple[str, str], EndpointMetrics] = {}
+        for (method, endpoint), c in self._counters.items():
+            cumulative = 0
+            buckets = []
+            for bound, bucket_count in zip(bounds, c.bucket_counts):
+                cumulative += bucket_count
+                buckets.append((bound, cumulative))
+            endpoints[(method, endpoint)] = EndpointMetrics(
+                method=method,
+                endpoint=endpoint,
+                count=c.count,
+                errors=dict(c.errors),
+                latency_sum=c.latency_sum,
+                latency_buckets=tuple(buckets),
+                bytes_sent=c.bytes_sent,
+                bytes_received=c.bytes_received,
+                connection_wait=c.connection_wait,
+                connection_wait_max=c.connection_wait_max,
+            )
+        return MetricsSnapshot(endpoints=endpoints, since=self._since)
+
+    def reset(self) -> None:
+        """Discards all collected metrics."""
+        self._counters.clear()
+        self._since = time.time()
+
+    @staticmethod
+    def trace_config() -> aiohttp.TraceConfig:
+        """Builds a `TraceConfig` that adds bytes and connection wait to samples.
+
+        The hooks find their sample through `trace_request_ctx`, so one
+        config serves every client sharing a session.
+        """
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(ClientMetrics._on_wait_start)
+        trace_config.on_connection_queued_end.append(ClientMetrics._on_wait_end)
+        trace_config.on_connection_create_start.append(ClientMetrics._on_wait_start)
+        trace_config.on_connection_create_end.append(ClientMetrics._on_wait_end)
+        trace_config.on_request_chunk_sent.append(ClientMetrics._on_chunk_sent)
+        trace_config.on_response_chunk_received.append(ClientMetrics._on_chunk_received)
+        return trace_config
+
+    @staticmethod
+    async def _on_wait_start(
+        session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        sample = ctx.trace_request_ctx
+        if sample is not None:
+            sample._wait_started = time.perf_counter()
+
+    @staticmethod
+    async def _on_wait_end(
+        session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any
+    ) -> None:
+        sample = ctx.trace_request_ctx
+        if sample is not None and sample._wait_started is not None:
+            sample.connection_wait += time.perf_counter() - sample._wait_started
+            sample._wait_started = None
+
+    @staticmethod
+    async def _on_chunk_sent(
+        session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        params: aiohttp.TraceRequestChunkSentParams,
+    ) -> None:
+        sample = ctx.trace_request_ctx
+        if sample is not None:
+            sample.bytes_sent += len(params.chunk)
+
+    @staticmethod
+    async def _on_chunk_received(
+        session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        params: aiohttp.TraceResponseChunkReceivedParams,
+    ) -> None:
+        sample = ctx.trace_request_ctx
+        if sample is not None:
+            sample.bytes_received += len(params.chunk)
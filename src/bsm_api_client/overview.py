@@ -0,0 +1,55 @@
+# src/bsm_api_client/overview.py
+"""Per-server overview results for bulk status fetching.
+
+This module provides `ServerOverview`, which collects the status, config
+status, version and process info responses for one server as returned by
+`async_get_servers_overview`, together with any per-field errors, so that
+one failing endpoint or server does not fail the whole batch.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from .models import GeneralApiResponse
+
+OVERVIEW_FIELDS: Tuple[str, ...] = (
+    "status",
+    "config_status",
+    "version",
+    "process_info",
+)
+"""The fields `async_get_servers_overview` can include, in request order."""
+
+DEFAULT_OVERVIEW_CONCURRENCY = 8
+
+
+@dataclass(frozen=True)
+class ServerOverview:
+    """Status, version and process info for one server.
+
+    Each field holds the response of the matching per-server method, or
+    `None` if it was not requested or the request failed.
+
+    Attributes:
+        name: The server name.
+        status: Response of `async_get_server_running_status`.
+        config_status: Response of `async_get_server_config_status`.
+        version: Response of `async_get_server_version`.
+        process_info: Response of `async_get_server_process_info`.
+        errors: The exception raised for each failed field, by field name.
+        elapsed: Seconds from the first request for this server starting to
+            the last one finishing.
+    """
+
+    name: str
+    status: Optional[GeneralApiResponse] = None
+    config_status: Optional[GeneralApiResponse] = None
+    version: Optional[GeneralApiResponse] = None
+    process_info: Optional[GeneralApiResponse] = None
+    errors: Dict[str, Exception] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether every requested field was fetched."""
+        return not self.errors
@@ -0,0 +1,227 @@
+# src/bsm_api_client/rate_limit.py
+"""Client-side concurrency and rate limiting.
+
+This module provides the `RequestLimiter` used by `ClientBase` to cap the
+number of in-flight requests and the request rate (token bucket). Requests
+over a limit wait in FIFO order instead of all reaching the manager at once.
+Both limits can be changed at runtime with `RequestLimiter.configure()`.
+"""
+
+import asyncio
+import collections
+import contextlib
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Optional
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.rate_limit")
+
+_UNSET: Any = object()
+
+
+@dataclass(frozen=True)
+class LimiterStats:
+    """A snapshot of limiter settings and queueing behaviour.
+
+    Attributes:
+        max_in_flight: Maximum concurrent requests, or `None` if unlimited.
+        requests_per_second: Sustained request rate, or `None` if unlimited.
+        burst: Token bucket capacity.
+        in_flight: Requests currently holding a slot.
+        waiting: Requests currently queued for a slot or a rate token.
+        acquired: Requests admitted since the client was created.
+        delayed: Admitted requests that had to wait.
+        total_wait: Total seconds spent waiting by all requests.
+        max_wait: Longest single wait in seconds.
+    """
+
+    max_in_flight: Optional[int]
+    requests_per_second: Optional[float]
+    burst: int
+    in_flight: int
+    waiting: int
+    acquired: int
+    delayed: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def average_wait(self) -> float:
+        """Mean wait per admitted request in seconds."""
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+
+class RequestLimiter:
+    """Caps concurrent requests and paces them with a token bucket."""
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            max_in_flight: Maximum concurrent requests. `None` means unlimited.
+            requests_per_second: Sustained request rate. `None` means unlimited.
+            burst: Requests allowed back-to-back before pacing starts. Defaults
+                to `max(1, int(requests_per_second))`.
+        """
+        self._max_in_flight: Optional[int] = None
+        self._rate: Optional[float] = None
+        self._burst = 1
+        self._in_flight = 0
+        self._waiting = 0
+        self._slot_waiters: Deque["asyncio.Future[None]"] = collections.deque()
+        self._tokens = 0.0
+        self._refilled_at = time.monotonic()
+        self._bucket_lock = asyncio.Lock()
+        self._acquired = 0
+        self._delayed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self.configure(
+            max_in_flight=max_in_flight,
+            requests_per_second=requests_per_second,
+            burst=burst,
+        )
+
+    def configure(
+        self,
+        max_in_flight: Optional[int] = _UNSET,
+        requests_per_second: Optional[float] = _UNSET,
+        burst: Optional[int] = _UNSET,
+    ) -> None:
+        """Changes the limits at runtime. Omitted arguments are left unchanged.
+
+        Args:
+            max_in_flight: New concurrency cap, or `None` to remove it.
+            requests_per_second: New sustained rate, or `None` to remove it.
+            burst: New token bucket capacity, or `None` for the default.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if max_in_flight is not _UNSET:
+            if max_in_flight is not None and max_in_flight < 1:
+                raise ValueError("max_in_flight must be at least 1.")
+            self._max_in_flight = max_in_flight
+        if requests_per_second is not _UNSET:
+            if requests_per_second is not None and requests_per_second <= 0:
+                raise ValueError("requests_per_second must be positive.")
+            self._refill()
+            self._rate = requests_per_second
+            if burst is _UNSET:
+                burst = None
+        if burst is not _UNSET:
+            if burst is not None and burst < 1:
+                raise ValueError("burst must be at least 1.")
+            self._burst = burst or max(1, int(self._rate or 1))
+            self._tokens = min(
+                self._tokens if self._acquired else self._burst, self._burst
+            )
+        self._wake_slot_waiters()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limit is configured."""
+        return self._max_in_flight is not None or self._rate is not None
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[float]:
+        """Waits for a concurrency slot and a rate token, then holds the slot.
+
+        Yields:
+            The number of seconds spent waiting.
+        """
+        started = time.monotonic()
+        self._waiting += 1
+        try:
+            await self._acquire_slot()
+        except BaseException:
+            self._waiting -= 1
+            raise
+        try:
+            try:
+                await self._acquire_token()
+            finally:
+                self._waiting -= 1
+            waited = time.monotonic() - started
+            self._record_wait(waited)
+            yield waited
+        finally:
+            self._release_slot()
+
+    def _record_wait(self, waited: float) -> None:
+        self._acquired += 1
+        if waited > 0.001:
+            self._delayed += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+            _LOGGER.debug("Request waited %.3fs for the client-side limiter.", waited)
+
+    async def _acquire_slot(self) -> None:
+        if self._max_in_flight is None or (
+            self._in_flight < self._max_in_flight and not self._slot_waiters
+        ):
+            self._in_flight += 1
+            return
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._slot_waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before cancellation.
+                self._release_slot()
+            else:
+                with contextlib.suppress(ValueError):
+                    self._slot_waiters.remove(waiter)
+            raise
+
+    def _release_slot(self) -> None:
+        self._in_flight -= 1
+        self._wake_slot_waiters()
+
+    def _wake_slot_waiters(self) -> None:
+        while self._slot_waiters and (
+            self._max_in_flight is None or self._in_flight < self._max_in_flight
+        ):
+            waiter = self._slot_waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self._rate is not None:
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._refilled_at) * self._rate
+            )
+        self._refilled_at = now
+
+    async def _acquire_token(self) -> None:
+        if self._rate is None:
+            return
+        async with self._bucket_lock:
+            while self._rate is not None:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def stats(self) -> LimiterStats:
+        """Returns the current limiter settings and counters."""
+        return LimiterStats(
+            max_in_flight=self._max_in_flight,
+            requests_per_second=self._rate,
+            burst=self._burst,
+            in_flight=self._in_flight,
+            waiting=self._waiting,
+            acquired=self._acquired,
+            delayed=self._delayed,
+            total_wait=self._total_wait,
+            max_wait=self._max_wait,
+        )
@@ -0,0 +1,219 @@
+# src/bsm_api_client/response_cache.py
+"""TTL/LRU cache for read-only API endpoints.
+
+This module provides the `ResponseCacheConfig` dataclass and the
+`ResponseCache` used by `ClientBase` when `response_cache` is enabled.
+Only GET requests whose path matches one of the configured endpoint
+templates are cached. Any mutating request (POST, PUT, PATCH, DELETE)
+evicts the cached entries in the same resource scope, e.g. updating
+`/server/{name}/properties/set` evicts every cached `/server/{name}/...`
+entry as well as `/servers`.
+"""
+
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Pattern, Tuple
+from urllib.parse import unquote
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.cache")
+
+DEFAULT_ENDPOINT_TTLS: Mapping[str, float] = {
+    "/servers": 5.0,
+    "/server/{name}/properties/get": 30.0,
+    "/server/{name}/allowlist/get": 30.0,
+    "/server/{name}/permissions/get": 30.0,
+    "/content/worlds": 60.0,
+    "/content/addons": 60.0,
+    "/plugins": 30.0,
+    "/settings": 60.0,
+    "/players/get": 30.0,
+}
+
+
+def _template_to_regex(template: str) -> Pattern[str]:
+    parts = re.split(r"\{[^/{}]+\}", template)
+    return re.compile("^" + "[^/]+".join(re.escape(p) for p in parts) + "$")
+
+
+# Extra prefixes evicted by `/server/{name}/<action>/...` mutations besides the
+# server's own entries: world exports write into the content store, and
+# world/addon installs and resets consume or replace its files.
+_SERVER_ACTION_EXTRA_PREFIXES: Mapping[str, Tuple[str, ...]] = {
+    "world": ("/content",),
+    "addon": ("/content",),
+}
+
+
+@dataclass(frozen=True)
+class ResponseCacheConfig:
+    """Configuration for the read-endpoint response cache.
+
+    Attributes:
+        endpoint_ttls: Maps endpoint templates (e.g. "/server/{name}/properties/get")
+            to their TTL in seconds. Endpoints not listed here are never cached.
+        max_entries: Maximum number of cached responses; the least recently
+            used entry is evicted when the bound is exceeded.
+    """
+
+    endpoint_ttls: Mapping[str, float] = field(
+        default_factory=lambda: dict(DEFAULT_ENDPOINT_TTLS)
+    )
+    max_entries: int = 256
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters describing response cache effectiveness.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that had to go to the API.
+        evictions: Entries dropped because of the size bound.
+        invalidations: Entries dropped by mutating requests or explicit calls.
+        size: Entries currently cached.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+
+
+class ResponseCache:
+    """An LRU-bounded, per-endpoint TTL cache of decoded API responses.
+
+    Cached values are shared by reference, so callers must not mutate them.
+    """
+
+    def __init__(self, config: Optional[ResponseCacheConfig] = None) -> None:
+        self._config = config or ResponseCacheConfig()
+        self._rules: List[Tuple[Pattern[str], float]] = [
+            (_template_to_regex(template), ttl)
+            for template, ttl in self._config.endpoint_ttls.items()
+            if ttl > 0
+        ]
+        self._entries: "OrderedDict[Hashable, Tuple[float, str, Any]]" = OrderedDict()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        """A counter bumped by every invalidation.
+
+        Callers capture it before sending a request and pass it to `set()`
+        so that a response fetched before a mutation is not cached after it.
+        """
+        return self._generation
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """Returns the TTL for a request path, or `None` if it is not cacheable."""
+        path = unquote(path)
+        for pattern, ttl in self._rules:
+            if pattern.match(path):
+                return ttl
+        return None
+
+    @staticmethod
+    def make_key(path: str, params: Optional[Dict[str, Any]] = None) -> Hashable:
+        """Builds the cache key for a request path and query parameters."""
+        frozen_params = (
+            tuple(sorted((str(k), str(v)) for k, v in params.items())) if params else ()
+        )
+        return (unquote(path), frozen_params)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Looks up a cached response.
+
+        Returns:
+            A `(found, value)` tuple.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return False, None
+        expires_at, _, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return True, value
+
+    def set(self, key: Hashable, value: Any, ttl: float, generation: int) -> None:
+        """Stores a response unless the cache was invalidated since `generation`."""
+        if generation != self._generation:
+            _LOGGER.debug("Not caching %s: invalidated while in flight.", key)
+            return
+        path = key[0] if isinstance(key, tuple) else str(key)
+        self._entries[key] = (time.monotonic() + ttl, path, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._config.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, path_prefix: Optional[str] = None) -> int:
+        """Evicts cached entries.
+
+        Args:
+            path_prefix: Evict entries whose path equals or starts with this
+                prefix. If `None`, the whole cache is cleared.
+
+        Returns:
+            The number of entries evicted.
+        """
+        self._generation += 1
+        if path_prefix is None:
+            count = len(self._entries)
+            self._entries.clear()
+        else:
+            path_prefix = unquote(path_prefix)
+            stale = [
+                key
+                for key, (_, path, _) in self._entries.items()
+                if path == path_prefix or path.startswith(path_prefix.rstrip("/") + "/")
+            ]
+            for key in stale:
+                del self._entries[key]
+            count = len(stale)
+        self._invalidations += count
+        return count
+
+    def invalidate_for_mutation(self, path: str) -> int:
+        """Evicts the entries affected by a mutating request to `path`.
+
+        Server-scoped mutations (`/server/{name}/...`) evict that server's
+        entries and the `/servers` list, plus the prefixes listed for their
+        action in `_SERVER_ACTION_EXTRA_PREFIXES` (world and addon actions
+        change the content store). Other mutations evict entries under the
+        same top-level resource (e.g. `/plugins/reload` evicts `/plugins`).
+        """
+        segments = [s for s in unquote(path).split("/") if s]
+        if not segments:
+            return self.invalidate()
+        if segments[0] == "server":
+            count = self.invalidate("/servers")
+            if len(segments) > 1 and segments[1] != "install":
+                count += self.invalidate(f"/server/{segments[1]}")
+            if len(segments) > 2:
+                for prefix in _SERVER_ACTION_EXTRA_PREFIXES.get(segments[2], ()):
+                    count += self.invalidate(prefix)
+            return count
+        return self.invalidate(f"/{segments[0]}")
+
+    def stats(self) -> CacheStats:
+        """Returns the current cache counters."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            size=len(self._entries),
+        )
@@ -0,0 +1,227 @@
+# src/bsm_api_client/retry.py
+"""Retry policy with exponential backoff and full jitter.
+
+This module provides the `RetryPolicy` dataclass accepted by `ClientBase`
+and the `call_with_retries` helper that drives it. Only idempotent requests
+are retried automatically; non-idempotent actions (e.g. starting a server or
+triggering a backup) are retried only when the policy or the caller opts in.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import (
+    AsyncContextManager,
+    Awaitable,
+    Callable,
+    FrozenSet,
+    Optional,
+    TypeVar,
+)
+
+import aiohttp
+
+from .exceptions import APIError, CannotConnectError
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.retry")
+
+T = TypeVar("T")
+
+# Set by `ClientBase.retry_actions()` to allow retrying non-idempotent requests.
+_RETRY_ACTIONS: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "bsm_api_client_retry_actions", default=False
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Configuration for automatic request retries.
+
+    The delay before retry `n` (1-based) is drawn uniformly from
+    `[0, min(backoff_max, backoff_base * 2 ** (n - 1))]` ("full jitter").
+
+    Attributes:
+        max_attempts: Total attempts including the first one.
+        backoff_base: Upper bound of the first backoff window, in seconds.
+        backoff_max: Cap for any single backoff window, in seconds.
+        total_deadline: Overall limit in seconds for a request, counted from
+            the start of the first attempt and covering attempts as well as
+            backoff. It is never shorter than the request's own timeout
+            profile, so a long-running request always gets its full first
+            attempt. An attempt still running when it expires is cancelled
+            and the call fails with `CannotConnectError`; no retry is
+            scheduled whose backoff would end after it. `None` means no
+            deadline.
+        retry_on_statuses: HTTP status codes that are retried.
+        retry_on_timeout: Whether request timeouts are retried.
+        retry_on_connection_error: Whether connection failures are retried.
+        retry_non_idempotent: Whether POST/PUT/PATCH/DELETE requests are
+            retried without an explicit per-call opt-in.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 10.0
+    total_deadline: Optional[float] = 30.0
+    retry_on_statuses: FrozenSet[int] = frozenset({502, 503, 504})
+    retry_on_timeout: bool = True
+    retry_on_connection_error: bool = True
+    retry_non_idempotent: bool = False
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+
+    def backoff(self, retry_number: int) -> float:
+        """Returns the jittered delay before the given retry (1-based)."""
+        window = min(self.backoff_max, self.backoff_base * (2 ** (retry_number - 1)))
+        return random.uniform(0, window)
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Returns whether `error` is transient according to this policy."""
+        if isinstance(error, CannotConnectError):
+            original = error.original_exception
+            if isinstance(original, asyncio.TimeoutError):
+                return self.retry_on_timeout
+            if isinstance(original, aiohttp.ClientConnectionError):
+                return self.retry_on_connection_error
+            return False
+        if isinstance(error, APIError):
+            return error.status_code in self.retry_on_statuses
+        return False
+
+    def allows(self, idempotent: bool) -> bool:
+        """Returns whether a request of the given kind may be retried."""
+        return idempotent or self.retry_non_idempotent or _RETRY_ACTIONS.get()
+
+
+@dataclass(frozen=True)
+class RetryStats:
+    """Counters describing retry activity.
+
+    Attributes:
+        retries: Retries performed after a transient failure.
+        recovered: Requests that succeeded after at least one retry.
+        exhausted: Requests that failed after retries or the deadline ran out.
+    """
+
+    retries: int
+    recovered: int
+    exhausted: int
+
+
+class _RetryCounters:
+    def __init__(self) -> None:
+        self.retries = 0
+        self.recovered = 0
+        self.exhausted = 0
+
+    def snapshot(self) -> RetryStats:
+        return RetryStats(
+            retries=self.retries, recovered=self.recovered, exhausted=self.exhausted
+        )
+
+
+async def call_with_retries(
+    policy: RetryPolicy,
+    func: Callable[[], Awaitable[T]],
+    description: str,
+    counters: Optional[_RetryCounters] = None,
+    slot: Optional[Callable[[], AsyncContextManager]] = None,
+    attempt_timeout: Optional[float] = None,
+) -> T:
+    """Awaits `func()` and retries transient failures according to `policy`.
+
+    Args:
+        policy: The `RetryPolicy` to apply.
+        func: A zero-argument callable returning the awaitable for one attempt.
+        description: A short label (e.g. "GET /servers") used in log messages.
+        counters: Optional counters to update.
+        slot: Optional factory of a context manager held during each attempt
+            (e.g. a request limiter slot). Time spent waiting for it does
+            not count towards the deadline.
+        attempt_timeout: The timeout of a single attempt. The deadline is
+            extended to at least this long.
+
+    Returns:
+        The result of the first successful attempt.
+
+    Raises:
+        CannotConnectError: If `policy.total_deadline` expires during an
+            attempt.
+        Exception: The error of the last attempt once retries are exhausted
+            or the error is not retryable.
+    """
+    total_deadline = policy.total_deadline
+    if total_deadline is not None and attempt_timeout is not None:
+        total_deadline = max(total_deadline, attempt_timeout)
+    started: Optional[float] = None
+    attempt = 1
+    while True:
+        deadline = None
+        try:
+            async with slot() if slot is not None else contextlib.nullcontext():
+                if started is None:
+                    started = time.monotonic()
+                if total_deadline is not None:
+                    # Expires immediately if nothing remains.
+                    remaining = total_deadline - (time.monotonic() - started)
+                    deadline = asyncio.timeout(max(remaining, 0))
+                if deadline is None:
+                    result = await func()
+                else:
+                    async with deadline:
+                        result = await func()
+        except TimeoutError as error:
+            if deadline is None or not deadline.expired():
+                raise
+            _LOGGER.warning(
+                "Giving up on %s after %d attempt(s): deadline of %.1fs expired.",
+                description,
+                attempt,
+                total_deadline,
+            )
+            if counters is not None:
+                counters.exhausted += 1
+            raise CannotConnectError(
+                f"{description} did not complete within the retry deadline of "
+                f"{total_deadline}s.",
+                original_exception=error,
+            ) from error
+        except APIError as error:
+            if not policy.is_retryable(error) or attempt >= policy.max_attempts:
+                if attempt > 1 and counters is not None:
+                    counters.exhausted += 1
+                raise
+            delay = policy.backoff(attempt)
+            elapsed = time.monotonic() - started
+            if total_deadline is not None and elapsed + delay > total_deadline:
+                _LOGGER.warning(
+                    "Giving up on %s after %d attempt(s): retry deadline of %.1fs reached.",
+                    description,
+                    attempt,
+                    total_deadline,
+                )
+                if counters is not None:
+                    counters.exhausted += 1
+                raise
+            _LOGGER.warning(
+                "%s failed (%s); retrying in %.2fs (attempt %d of %d).",
+                description,
+                error,
+                delay,
+                attempt + 1,
+                policy.max_attempts,
+            )
+            if counters is not None:
+                counters.retries += 1
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+        if attempt > 1 and counters is not None:
+            counters.recovered += 1
+        return result
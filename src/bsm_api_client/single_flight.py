@@ -0,0 +1,107 @@
+# src/bsm_api_client/single_flight.py
+"""Single-flight coalescing of identical concurrent requests.
+
+This module provides the `SingleFlight` helper used by `ClientBase` when
+`coalesce_requests=True`. While a request for a given key is in flight, any
+identical request joins it and receives the same result (or exception)
+instead of sending its own HTTP request.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.single_flight")
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    """Counters describing single-flight coalescing.
+
+    Attributes:
+        executed: Requests that were actually sent.
+        deduplicated: Requests that joined an identical in-flight request.
+        in_flight: Distinct requests currently in flight.
+    """
+
+    executed: int
+    deduplicated: int
+    in_flight: int
+
+
+class SingleFlight:
+    """Shares one in-flight awaitable between callers using the same key.
+
+    Results are shared by reference, so callers must not mutate a coalesced
+    result in place.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._executed = 0
+        self._deduplicated = 0
+
+    @staticmethod
+    def make_key(
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        authenticated: bool = True,
+    ) -> Hashable:
+        """Builds a hashable key for a request.
+
+        Args:
+            method: The HTTP method.
+            path: The request path.
+            params: Optional query parameters. Values are compared as strings.
+            authenticated: Whether the request is authenticated.
+
+        Returns:
+            A hashable key identifying the request.
+        """
+        frozen_params = (
+            tuple(sorted((str(k), str(v)) for k, v in params.items())) if params else ()
+        )
+        return (method.upper(), path, frozen_params, authenticated)
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Runs `factory()` once for all concurrent callers with the same key.
+
+        The shared call runs in its own task, so cancelling one caller does not
+        cancel the request for the others.
+
+        Args:
+            key: The coalescing key (see `make_key`).
+            factory: A zero-argument callable returning the awaitable to run.
+
+        Returns:
+            The result of the shared awaitable.
+        """
+        future = self._calls.get(key)
+        if future is None:
+            self._executed += 1
+            future = asyncio.ensure_future(factory())
+            self._calls[key] = future
+            future.add_done_callback(lambda fut: self._forget(key, fut))
+        else:
+            self._deduplicated += 1
+            _LOGGER.debug("Coalescing request %s onto in-flight call.", key)
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        # Mark the exception as retrieved in case every caller was cancelled.
+        if not future.cancelled():
+            future.exception()
+
+    def stats(self) -> SingleFlightStats:
+        """Returns the current coalescing counters."""
+        return SingleFlightStats(
+            executed=self._executed,
+            deduplicated=self._deduplicated,
+            in_flight=len(self._calls),
+        )
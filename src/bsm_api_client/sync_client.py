@@ -0,0 +1,240 @@
+# src/bsm_api_client/sync_client.py
+"""Blocking facade over `BedrockServerManagerApi`.
+
+This module provides `SyncBedrockServerManagerApi` for code that is not
+async. It runs one event loop in a background thread for the lifetime of
+the client, so the HTTP session, pooled connections and JWT are reused
+across calls instead of being rebuilt by an `asyncio.run` per call.
+
+Every `async_*` method of `BedrockServerManagerApi` is exposed as a
+blocking method of the same name without the prefix (e.g.
+`async_get_servers` becomes `get_servers`); async generators become
+regular iterators. The methods are generated from the async client, so
+new endpoints are picked up automatically.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import threading
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Iterator,
+    TypeVar,
+    Union,
+)
+
+from .api_client import BedrockServerManagerApi
+from .models import Token
+from .timeouts import TimeoutProfile
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.sync")
+
+T = TypeVar("T")
+
+_ASYNC_PREFIX = "async_"
+
+
+class SyncBedrockServerManagerApi:
+    """Blocking API client backed by a persistent background event loop.
+
+    The client is thread-safe: any number of threads may call it at once.
+    Their calls run concurrently on the shared loop and are subject to the
+    same connection pool, request limits and token handling as with the
+    async client.
+
+    Example:
+        >>> from bsm_api_client import SyncBedrockServerManagerApi
+        >>> with SyncBedrockServerManagerApi("http://localhost:11325", "admin", "pw") as client:
+        ...     print(client.get_servers().servers)
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Starts the background loop and creates the async client on it.
+
+        Args:
+            *args: Positional arguments for `BedrockServerManagerApi`.
+            **kwargs: Keyword arguments for `BedrockServerManagerApi`. A
+                `session` cannot be passed, since it would be bound to
+                another event loop.
+
+        Raises:
+            ValueError: If `session` is given or the client arguments are
+                invalid.
+        """
+        if kwargs.get("session") is not None:
+            raise ValueError(
+                "SyncBedrockServerManagerApi creates its own session on its event loop."
+            )
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="bsm-api-client-loop", daemon=True
+        )
+        self._thread.start()
+        self._close_lock = threading.Lock()
+        self._closed = False
+
+        async def create() -> BedrockServerManagerApi:
+            return BedrockServerManagerApi(*args, **kwargs)
+
+        try:
+            self._client = self._run(create())
+        except BaseException:
+            self._closed = True
+            self._stop_loop()
+            raise
+        _LOGGER.debug("Started background event loop for the blocking client.")
+
+    @property
+    def async_client(self) -> BedrockServerManagerApi:
+        """The underlying async client.
+
+        Its coroutines must only be run on `loop`; call the blocking methods
+        instead when in doubt.
+        """
+        return self._client
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The background event loop."""
+        return self._loop
+
+    @property
+    def closed(self) -> bool:
+        """Whether `close()` has been called."""
+        return self._closed
+
+    def _run(self, coro: Awaitable[T]) -> T:
+        """Runs a coroutine on the background loop and waits for its result.
+
+        The coroutine runs in a copy of the caller's context, so
+        `timeout_override()` and `retry_actions()` apply to it.
+        """
+        if self._closed or self._on_loop_thread():
+            if inspect.iscoroutine(coro):
+                coro.close()
+            if self._closed:
+                raise RuntimeError("The client is closed.")
+            raise RuntimeError(
+                "Blocking client methods cannot be called from its own event loop."
+            )
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result()
+        except BaseException:
+            # e.g. KeyboardInterrupt in the calling thread: do not leave the
+            # request running on the loop.
+            future.cancel()
+            raise
+
+    def _on_loop_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def _iterate(self, agen: AsyncIterator[T]) -> Iterator[T]:
+        """Drives an async iterator from the calling thread."""
+
+        async def step() -> Any:
+            try:
+                return True, await agen.__anext__()
+            except StopAsyncIteration:
+                return False, None
+
+        try:
+            while True:
+                has_item, item = self._run(step())
+                if not has_item:
+                    return
+                yield item
+        finally:
+            aclose = getattr(agen, "aclose", None)
+            if aclose is not None and not self._closed:
+                self._run(aclose())
+
+    def authenticate(self) -> Token:
+        """Logs in and stores the token. Blocking version of `authenticate()`."""
+        return self._run(self._client.authenticate())
+
+    def timeout_override(
+        self, profile: Union[str, TimeoutProfile]
+    ) -> ContextManager[None]:
+        """Same as `BedrockServerManagerApi.timeout_override`, for this thread."""
+        return self._client.timeout_override(profile)
+
+    def retry_actions(self) -> ContextManager[None]:
+        """Same as `BedrockServerManagerApi.retry_actions`, for this thread."""
+        return self._client.retry_actions()
+
+    def close(self) -> None:
+        """Closes the async client and stops the background loop.
+
+        Calls still running in other threads are cancelled. Safe to call
+        more than once and from any thread except the loop's.
+        """
+        if self._on_loop_thread():
+            raise RuntimeError("The client cannot be closed from its own event loop.")
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        finally:
+            self._stop_loop()
+        _LOGGER.debug("Stopped background event loop for the blocking client.")
+
+    async def _shutdown(self) -> None:
+        try:
+            await self._client.close()
+        finally:
+            current = asyncio.current_task()
+            pending = [t for t in asyncio.all_tasks() if t is not current]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await self._loop.shutdown_asyncgens()
+
+    def _stop_loop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> "SyncBedrockServerManagerApi":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def _blocking_method(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    """Builds the blocking counterpart of the async client method `name`."""
+    sync_name = name[len(_ASYNC_PREFIX) :]
+
+    if inspect.isasyncgenfunction(func):
+
+        def method(self: SyncBedrockServerManagerApi, *args: Any, **kwargs: Any):
+            return self._iterate(getattr(self._client, name)(*args, **kwargs))
+
+    else:
+
+        def method(self: SyncBedrockServerManagerApi, *args: Any, **kwargs: Any):
+            return self._run(getattr(self._client, name)(*args, **kwargs))
+
+    functools.update_wrapper(method, func)
+    method.__name__ = sync_name
+    method.__qualname__ = f"{SyncBedrockServerManagerApi.__name__}.{sync_name}"
+    method.__doc__ = f"Blocking version of `{name}`.\n\n{inspect.getdoc(func) or ''}"
+    return method
+
+
+for _name, _func in inspect.getmembers(BedrockServerManagerApi):
+    if _name.startswith(_ASYNC_PREFIX) and (
+        inspect.iscoroutinefunction(_func) or inspect.isasyncgenfunction(_func)
+    ):
+        _method = _blocking_method(_name, _func)
+        setattr(SyncBedrockServerManagerApi, _method.__name__, _method)
+del _name, _func, _method
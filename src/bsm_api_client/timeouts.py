@@ -0,0 +1,192 @@
+# src/bsm_api_client/timeouts.py
+"""Named timeout profiles with separate connect, read and total budgets.
+
+This module provides the `TimeoutProfile` and `TimeoutConfig` dataclasses
+accepted by `ClientBase`. Every request is assigned a profile from the
+endpoint table in `TimeoutConfig.endpoint_profiles`, so cheap status reads
+fail within seconds against a dead host while installs, exports and backups
+keep a budget of many minutes. A profile can be forced for a block of calls
+with `ClientBase.timeout_override()`.
+
+A `request_timeout` passed to the client explicitly keeps its old meaning:
+the `fast_read` and `action` profiles (unless customised) become a plain
+total limit of that many seconds.
+"""
+
+import contextvars
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.timeouts")
+
+FAST_READ = "fast_read"
+ACTION = "action"
+LONG_RUNNING = "long_running"
+DEFAULT = "default"
+
+# Total timeout for login, logout and unprofiled requests when the client is
+# not given a `request_timeout`.
+DEFAULT_REQUEST_TIMEOUT = 90
+
+
+@dataclass(frozen=True)
+class TimeoutProfile:
+    """Connect, socket-read and total time limits for a request, in seconds.
+
+    Attributes:
+        connect: Limit for establishing the TCP/TLS connection. `None`
+            disables it.
+        sock_read: Limit between two reads from the socket, i.e. how long the
+            server may stay silent. `None` disables it.
+        total: Limit for the whole request including reading the body.
+            `None` disables it.
+    """
+
+    connect: Optional[float] = None
+    sock_read: Optional[float] = None
+    total: Optional[float] = None
+
+    def client_timeout(self) -> aiohttp.ClientTimeout:
+        """Returns the equivalent `aiohttp.ClientTimeout`."""
+        return aiohttp.ClientTimeout(
+            total=self.total, sock_connect=self.connect, sock_read=self.sock_read
+        )
+
+
+DEFAULT_TIMEOUT_PROFILES: Mapping[str, TimeoutProfile] = {
+    FAST_READ: TimeoutProfile(connect=5.0, sock_read=15.0, total=30.0),
+    ACTION: TimeoutProfile(connect=5.0, sock_read=120.0, total=120.0),
+    LONG_RUNNING: TimeoutProfile(connect=5.0, sock_read=900.0, total=1800.0),
+}
+
+# (HTTP method, path pattern, profile name). `*` matches one path segment;
+# the first matching rule wins.
+DEFAULT_ENDPOINT_PROFILES: Tuple[Tuple[str, str, str], ...] = (
+    ("POST", "/server/install", LONG_RUNNING),
+    ("POST", "/server/*/update", LONG_RUNNING),
+    ("DELETE", "/server/*/delete", LONG_RUNNING),
+    ("POST", "/server/*/world/export", LONG_RUNNING),
+    ("POST", "/server/*/world/install", LONG_RUNNING),
+    ("DELETE", "/server/*/world/reset", LONG_RUNNING),
+    ("POST", "/server/*/addon/install", LONG_RUNNING),
+    ("POST", "/server/*/backup/action", LONG_RUNNING),
+    ("POST", "/server/*/backups/prune", LONG_RUNNING),
+    ("POST", "/server/*/restore/action", LONG_RUNNING),
+    ("POST", "/content/upload", LONG_RUNNING),
+    ("POST", "/downloads/prune", LONG_RUNNING),
+    ("POST", "/players/scan", LONG_RUNNING),
+    ("GET", "*", FAST_READ),
+    ("HEAD", "*", FAST_READ),
+    ("*", "*", ACTION),
+)
+
+# Set by `ClientBase.timeout_override()` to force a profile for a block of calls.
+_TIMEOUT_OVERRIDE: contextvars.ContextVar[Union[str, TimeoutProfile, None]] = (
+    contextvars.ContextVar("bsm_api_client_timeout_override", default=None)
+)
+
+
+def _matches(pattern: str, path: str) -> bool:
+    if pattern == "*":
+        return True
+    pattern_parts = pattern.strip("/").split("/")
+    path_parts = path.strip("/").split("/")
+    if len(pattern_parts) != len(path_parts):
+        return False
+    return all(p == "*" or p == s for p, s in zip(pattern_parts, path_parts))
+
+
+@dataclass(frozen=True)
+class TimeoutConfig:
+    """Timeout profiles and the table assigning them to endpoints.
+
+    Attributes:
+        profiles: Profiles by name. Entries are merged over
+            `DEFAULT_TIMEOUT_PROFILES`, so only changed profiles need to be
+            given.
+        endpoint_profiles: `(method, path pattern, profile name)` rules,
+            checked in order. `*` matches any method or one path segment, and
+            a pattern of `*` alone matches any path.
+    """
+
+    profiles: Mapping[str, TimeoutProfile] = field(
+        default_factory=lambda: dict(DEFAULT_TIMEOUT_PROFILES)
+    )
+    endpoint_profiles: Tuple[Tuple[str, str, str], ...] = DEFAULT_ENDPOINT_PROFILES
+
+    def __post_init__(self) -> None:
+        merged = dict(DEFAULT_TIMEOUT_PROFILES)
+        merged.update(self.profiles)
+        object.__setattr__(self, "profiles", merged)
+        unknown = {
+            name
+            for _, _, name in self.endpoint_profiles
+            if name not in merged and name != DEFAULT
+        }
+        if unknown:
+            raise ValueError(
+                f"endpoint_profiles refers to unknown profiles: {sorted(unknown)}"
+            )
+
+    def profile_name_for(self, method: str, path: str) -> str:
+        """Returns the profile name assigned to a request, or `DEFAULT`."""
+        method = method.upper()
+        for rule_method, pattern, name in self.endpoint_profiles:
+            if rule_method in ("*", method) and _matches(pattern, path):
+                return name
+        return DEFAULT
+
+
+class _TimeoutResolver:
+    """Resolves requests to cached `aiohttp.ClientTimeout` objects."""
+
+    def __init__(
+        self,
+        config: TimeoutConfig,
+        default_total: Optional[float],
+        total_is_explicit: bool = False,
+    ) -> None:
+        self._config = config
+        self._profiles: Dict[str, TimeoutProfile] = dict(config.profiles)
+        if total_is_explicit:
+            # An explicit request_timeout applies to every request it used to,
+            # unless the profile was customised in `config`.
+            for name in (FAST_READ, ACTION):
+                if self._profiles.get(name) == DEFAULT_TIMEOUT_PROFILES[name]:
+                    self._profiles[name] = TimeoutProfile(total=default_total)
+        self._profiles.setdefault(DEFAULT, TimeoutProfile(total=default_total))
+        self._client_timeouts: Dict[str, aiohttp.ClientTimeout] = {
+            name: profile.client_timeout() for name, profile in self._profiles.items()
+        }
+
+    def profile(self, name: str) -> TimeoutProfile:
+        """Returns the profile called `name`.
+
+        Raises:
+            ValueError: If no such profile exists.
+        """
+        try:
+            return self._profiles[name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown timeout profile '{name}'. "
+                f"Known profiles: {sorted(self._profiles)}"
+            ) from None
+
+    def for_request(self, method: str, path: str) -> aiohttp.ClientTimeout:
+        """Returns the timeout for a request, honouring `timeout_override()`."""
+        override = _TIMEOUT_OVERRIDE.get()
+        if isinstance(override, TimeoutProfile):
+            return override.client_timeout()
+        name = override or self._config.profile_name_for(method, path)
+        timeout = self._client_timeouts.get(name)
+        if timeout is None:
+            timeout = self.profile(name).client_timeout()
+        return timeout
+
+    def default(self) -> aiohttp.ClientTimeout:
+        """Returns the timeout used for login, logout and unprofiled calls."""
+        return self._client_timeouts[DEFAULT]
@@ -0,0 +1,118 @@
+# src/bsm_api_client/token_refresh.py
+"""Proactive JWT refresh based on the token's `exp` claim.
+
+This module provides the `TokenRefreshConfig` dataclass accepted by
+`ClientBase` and helpers to read the expiry of a JWT without verifying its
+signature. The client uses the expiry to log in again in the background
+shortly before the token expires, instead of waiting for a 401.
+"""
+
+import base64
+import json
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.token_refresh")
+
+
+@dataclass(frozen=True)
+class TokenRefreshConfig:
+    """Configuration for proactive token refresh.
+
+    Attributes:
+        refresh_margin: Refresh the token this many seconds before it expires.
+            For short-lived tokens at most half of the remaining lifetime is
+            used as the margin.
+        clock_skew: Seconds by which the local clock may lag the server's.
+            Only used when the lifetime has to be computed from the local
+            wall clock, i.e. for tokens without an `iat` claim or tokens
+            passed in via `jwt_token`.
+        retry_interval: Seconds to wait before retrying a failed background
+            refresh while the current token is still valid.
+    """
+
+    refresh_margin: float = 60.0
+    clock_skew: float = 30.0
+    retry_interval: float = 10.0
+
+    def __post_init__(self) -> None:
+        if self.refresh_margin < 0 or self.clock_skew < 0:
+            raise ValueError("refresh_margin and clock_skew must not be negative.")
+        if self.retry_interval <= 0:
+            raise ValueError("retry_interval must be positive.")
+
+
+def decode_jwt_claims(token: str) -> Dict[str, Any]:
+    """Decodes the payload of a JWT without verifying its signature.
+
+    Args:
+        token: The encoded JWT.
+
+    Returns:
+        The claims dictionary.
+
+    Raises:
+        ValueError: If the token is not a well-formed JWT.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        raise ValueError("Token is not a JWT.")
+    payload = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Token payload could not be decoded: {e}") from e
+    if not isinstance(claims, dict):
+        raise ValueError("Token payload is not a JSON object.")
+    return claims
+
+
+def _numeric_claim(claims: Dict[str, Any], name: str) -> Optional[float]:
+    value = claims.get(name)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value) if math.isfinite(value) else None
+
+
+def token_expires_at(
+    token: str, config: TokenRefreshConfig, issued_now: bool = False
+) -> Optional[float]:
+    """Returns when `token` expires as a `time.monotonic()` deadline.
+
+    When the token was just issued and carries an `iat` claim, its lifetime
+    is `exp - iat`, which does not depend on the local clock. Otherwise the
+    remaining lifetime is `exp` minus the local wall clock minus
+    `config.clock_skew`.
+
+    Args:
+        token: The encoded JWT.
+        config: The refresh configuration.
+        issued_now: Whether the token was received from a login just now.
+
+    Returns:
+        The monotonic expiry deadline, or `None` if the token carries no
+        usable `exp` claim.
+    """
+    try:
+        claims = decode_jwt_claims(token)
+    except ValueError as e:
+        _LOGGER.debug("Cannot read token expiry: %s", e)
+        return None
+    exp = _numeric_claim(claims, "exp")
+    if exp is None:
+        return None
+    iat = _numeric_claim(claims, "iat")
+    if issued_now and iat is not None and iat < exp:
+        remaining = exp - iat
+    else:
+        remaining = exp - time.time() - config.clock_skew
+    return time.monotonic() + remaining
+
+
+def refresh_delay(expires_at: float, config: TokenRefreshConfig) -> float:
+    """Returns how many seconds to wait before refreshing a token."""
+    remaining = expires_at - time.monotonic()
+    return max(0.0, remaining - min(config.refresh_margin, remaining / 2))
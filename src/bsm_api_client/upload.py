@@ -0,0 +1,115 @@
+# src/bsm_api_client/upload.py
+"""Chunked file streaming with progress reporting and bandwidth limiting.
+
+This module provides the `UploadProgress` snapshot passed to upload progress
+callbacks and `iter_file_chunks`, which reads a file in fixed-size chunks
+off the event loop so that large uploads neither buffer the whole file in
+memory nor block other work on the loop.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Optional, Union
+
+_LOGGER = logging.getLogger(__name__.split(".")[0] + ".client.upload")
+
+DEFAULT_UPLOAD_CHUNK_SIZE = 256 * 1024
+
+
+@dataclass(frozen=True)
+class UploadProgress:
+    """A snapshot of an upload in progress.
+
+    Attributes:
+        bytes_sent: Bytes handed to the connection so far.
+        total_bytes: Size of the file being uploaded.
+        elapsed: Seconds since the first chunk was read.
+    """
+
+    bytes_sent: int
+    total_bytes: int
+    elapsed: float
+
+    @property
+    def rate(self) -> float:
+        """Average throughput so far in bytes per second."""
+        return self.bytes_sent / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def fraction(self) -> float:
+        """Completed fraction between 0.0 and 1.0."""
+        return self.bytes_sent / self.total_bytes if self.total_bytes else 1.0
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole file has been sent."""
+        return self.bytes_sent >= self.total_bytes
+
+
+ProgressCallback = Callable[[UploadProgress], Union[None, Awaitable[None]]]
+
+
+async def iter_file_chunks(
+    file_path: str,
+    total_bytes: int,
+    chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    progress: Optional[ProgressCallback] = None,
+    max_bytes_per_second: Optional[float] = None,
+) -> AsyncIterator[bytes]:
+    """Reads `file_path` in chunks, reporting progress and pacing the output.
+
+    File reads run in a worker thread. The file is opened on the first
+    iteration and closed when the iterator is exhausted or closed.
+
+    Args:
+        file_path: The file to read.
+        total_bytes: The file size, used for progress reporting.
+        chunk_size: Maximum size of each chunk.
+        progress: Optional callback (sync or async) called with an
+            `UploadProgress` after each chunk has been consumed.
+        max_bytes_per_second: Optional bandwidth cap. Chunks are delayed so
+            that the average rate does not exceed it.
+
+    Yields:
+        The file contents in chunks.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    if max_bytes_per_second is not None and max_bytes_per_second <= 0:
+        raise ValueError("max_bytes_per_second must be positive.")
+
+    file = await asyncio.to_thread(open, file_path, "rb")
+    try:
+        started = time.monotonic()
+        sent = 0
+        while True:
+            chunk = await asyncio.to_thread(file.read, chunk_size)
+            if not chunk:
+                break
+            if max_bytes_per_second is not None:
+                delay = started + sent / max_bytes_per_second - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            yield chunk
+            sent += len(chunk)
+            if progress is not None:
+                result = progress(
+                    UploadProgress(
+                        bytes_sent=sent,
+                        total_bytes=total_bytes,
+                        elapsed=time.monotonic() - started,
+                    )
+                )
+                if inspect.isawaitable(result):
+                    await result
+        _LOGGER.debug(
+            "Streamed %d bytes from %s in %.2fs.",
+            sent,
+            file_path,
+            time.monotonic() - started,
+        )
+    finally:
+        await asyncio.to_thread(file.close)
@@ -1,14 +1,119 @@
 import asyncio
-import json
 import logging
-from typing import AsyncGenerator, List, Dict, Any, Optional
+import random
+import time
+from dataclasses import dataclass
+from typing import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    List,
+    Dict,
+    Any,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import aiohttp
 
 from .exceptions import APIError, AuthError
+from .json_codec import JsonCodec, STDLIB_CODEC
+from .metrics import ClientMetrics
 
 _LOGGER = logging.getLogger(__name__)
 
+# Called before each reconnect with the token the server rejected (or None)
+# and returns the token to connect with.
+TokenProvider = Callable[[Optional[str]], Awaitable[Optional[str]]]
+
+
+@dataclass(frozen=True)
+class ReconnectPolicy:
+    """Configuration for automatic WebSocket reconnection.
+
+    The delay before reconnect attempt `n` (1-based) is drawn uniformly from
+    `[0, min(backoff_max, backoff_base * 2 ** (n - 1))]` ("full jitter"), so
+    clients do not reconnect in lockstep after a manager restart.
+
+    Attributes:
+        max_attempts: Consecutive failed attempts after which `listen()`
+            raises the last error. `None` retries forever.
+        backoff_base: Upper bound of the first backoff window, in seconds.
+        backoff_max: Cap for any single backoff window, in seconds.
+    """
+
+    max_attempts: Optional[int] = None
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+
+    def __post_init__(self) -> None:
+        if self.max_attempts is not None and self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+
+    def backoff(self, attempt: int) -> float:
+        """Returns the jittered delay before the given attempt (1-based)."""
+        window = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, window)
+
+
+@dataclass(frozen=True)
+class HeartbeatConfig:
+    """Configuration for WebSocket heartbeats and dead-peer detection.
+
+    While `listen()` runs, a ping is sent every `interval` seconds. A pong
+    not received within `pong_timeout`, or no frame at all (messages, pings
+    or pongs) for `idle_timeout` seconds, marks the connection as dead: it
+    is closed and, with reconnection enabled, re-established.
+
+    Attributes:
+        interval: Seconds between pings.
+        pong_timeout: Seconds to wait for the matching pong.
+        idle_timeout: Seconds without any received frame before the
+            connection is considered dead. `None` disables the deadline.
+    """
+
+    interval: float = 20.0
+    pong_timeout: float = 10.0
+    idle_timeout: Optional[float] = 60.0
+
+    def __post_init__(self) -> None:
+        if self.interval <= 0 or self.pong_timeout <= 0:
+            raise ValueError("interval and pong_timeout must be positive.")
+        if self.idle_timeout is not None and self.idle_timeout <= 0:
+            raise ValueError("idle_timeout must be positive.")
+
+
+@dataclass(frozen=True)
+class WebSocketStats:
+    """A snapshot of WebSocket connection health.
+
+    Attributes:
+        connected: Whether the socket is currently open.
+        reconnects: Successful reconnects after a lost connection.
+        failed_attempts: Reconnect attempts that failed.
+        last_gap: Seconds without a connection before the last reconnect.
+        max_gap: Longest time without a connection, in seconds.
+        total_gap: Total time without a connection, in seconds.
+        subscriptions: Topics replayed after each reconnect.
+        rtt: Round-trip time of the last answered ping, in seconds.
+        rtt_max: Highest ping round-trip time seen, in seconds.
+        missed_pongs: Pings not answered within `pong_timeout`.
+        idle_timeouts: Connections dropped for exceeding `idle_timeout`.
+    """
+
+    connected: bool
+    reconnects: int
+    failed_attempts: int
+    last_gap: Optional[float]
+    max_gap: float
+    total_gap: float
+    subscriptions: Tuple[str, ...]
+    rtt: Optional[float] = None
+    rtt_max: Optional[float] = None
+    missed_pongs: int = 0
+    idle_timeouts: int = 0
+
 
 class WebSocketClient:
     """
@@ -23,6 +128,11 @@ class WebSocketClient:
         session: aiohttp.ClientSession,
         url: str,
         token: Optional[str] = None,
+        json_codec: Optional[JsonCodec] = None,
+        reconnect: Union[bool, ReconnectPolicy, None] = None,
+        token_provider: Optional[TokenProvider] = None,
+        heartbeat: Union[bool, HeartbeatConfig, None] = None,
+        metrics: Optional[ClientMetrics] = None,
     ):
         """
         Initialize the WebSocketClient.
@@ -31,11 +141,58 @@ class WebSocketClient:
             session: The aiohttp ClientSession to use.
             url: The WebSocket URL.
             token: The JWT token for authentication.
+            json_codec: The `JsonCodec` used to decode incoming frames.
+                Defaults to the standard library codec.
+            reconnect: Keeps `listen()` running across lost connections by
+                reconnecting with jittered backoff and re-subscribing to
+                every active topic. Pass True for the default
+                `ReconnectPolicy` or a policy instance.
+            token_provider: Coroutine function returning the token to
+                (re)connect with. It receives the token the server rejected,
+                if any, so it can log in again.
+            heartbeat: Sends pings while `listen()` runs and treats the
+                connection as dead when pongs or frames stop arriving. Pass
+                True for the default `HeartbeatConfig` or a config instance.
+            metrics: Optional `ClientMetrics` that ping round-trip times are
+                recorded in, as method `PING` on endpoint `/ws`.
         """
         self._session = session
         self._url = url
         self._token = token
+        self._json_codec = json_codec or STDLIB_CODEC
         self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._reconnect: Optional[ReconnectPolicy] = None
+        if reconnect:
+            self._reconnect = (
+                reconnect
+                if isinstance(reconnect, ReconnectPolicy)
+                else ReconnectPolicy()
+            )
+        self._token_provider = token_provider
+        # Ordered set of active topics, replayed after a reconnect.
+        self._topics: Dict[str, None] = {}
+        self._closing = False
+        self._disconnected_at: Optional[float] = None
+        self._reconnects = 0
+        self._failed_attempts = 0
+        self._last_gap: Optional[float] = None
+        self._max_gap = 0.0
+        self._total_gap = 0.0
+        self._heartbeat: Optional[HeartbeatConfig] = None
+        if heartbeat:
+            self._heartbeat = (
+                heartbeat
+                if isinstance(heartbeat, HeartbeatConfig)
+                else HeartbeatConfig()
+            )
+        self._metrics = metrics
+        # Payload and send time of the ping awaiting its pong.
+        self._ping: Optional[Tuple[bytes, float]] = None
+        self._pong_received = asyncio.Event()
+        self._rtt: Optional[float] = None
+        self._rtt_max: Optional[float] = None
+        self._missed_pongs = 0
+        self._idle_timeouts = 0
 
     async def connect(self) -> "WebSocketClient":
         """
@@ -44,6 +201,13 @@ class WebSocketClient:
         Returns:
             self
         """
+        self._closing = False
+        if self._token_provider is not None:
+            self._token = await self._token_provider(None)
+        await self._open()
+        return self
+
+    async def _open(self) -> None:
         # The server expects the token as a query parameter '?token=...'
         # It does not check the Authorization header for WebSockets.
         url = self._url
@@ -52,7 +216,13 @@ class WebSocketClient:
             url = f"{url}{separator}token={self._token}"
 
         try:
-            self._ws = await self._session.ws_connect(url)
+            if self._heartbeat is None:
+                self._ws = await self._session.ws_connect(url)
+            else:
+                # Pings and pongs are handled in `_receive` to time them.
+                self._ws = await self._session.ws_connect(
+                    url, autoping=False, **self._idle_deadline(self._heartbeat)
+                )
             _LOGGER.info(f"Connected to WebSocket at {self._url}")
         except aiohttp.ClientResponseError as e:
             if e.status == 401 or e.status == 403:
@@ -65,10 +235,9 @@ class WebSocketClient:
         except Exception as e:
             raise APIError(f"WebSocket connection failed: {str(e)}")
 
-        return self
-
     async def disconnect(self):
         """Disconnect from the WebSocket server."""
+        self._closing = True
         if self._ws:
             await self._ws.close()
             self._ws = None
@@ -78,12 +247,18 @@ class WebSocketClient:
         """
         Subscribe to a topic.
 
+        With reconnection enabled, the topic is also re-subscribed after every
+        reconnect, and subscribing while reconnecting only records it.
+
         Args:
             topic: The topic to subscribe to.
         """
-        if not self._ws:
+        if not self._ws and not self._reconnect:
             raise APIError("WebSocket is not connected")
 
+        self._topics[topic] = None
+        if not self._ws:
+            return
         message = {"action": "subscribe", "topic": topic}
         await self._ws.send_json(message)
         _LOGGER.debug(f"Subscribed to {topic}")
@@ -95,9 +270,12 @@ class WebSocketClient:
         Args:
             topic: The topic to unsubscribe from.
         """
-        if not self._ws:
+        if not self._ws and not self._reconnect:
             raise APIError("WebSocket is not connected")
 
+        self._topics.pop(topic, None)
+        if not self._ws:
+            return
         message = {"action": "unsubscribe", "topic": topic}
         await self._ws.send_json(message)
         _LOGGER.debug(f"Unsubscribed from {topic}")
@@ -106,27 +284,188 @@ class WebSocketClient:
         """
         Listen for incoming messages.
 
+        Without reconnection, iteration stops when the connection closes.
+        With it, a lost connection is re-established transparently and
+        iteration only stops after `disconnect()`.
+
         Yields:
             Received messages as dictionaries.
+
+        Raises:
+            APIError: If reconnecting failed `max_attempts` times in a row.
         """
-        if not self._ws:
+        if not self._ws and not self._reconnect:
             raise APIError("WebSocket is not connected")
 
-        async for msg in self._ws:
-            if msg.type == aiohttp.WSMsgType.TEXT:
-                try:
-                    data = msg.json()
+        while not self._closing:
+            if self._ws is None:
+                await self._reconnect_with_backoff(self._reconnect)
+                continue
+            ws = self._ws
+            pinger = None
+            if self._heartbeat is not None:
+                pinger = asyncio.create_task(self._send_pings(ws, self._heartbeat))
+            try:
+                async for data in self._receive(ws):
                     yield data
-                except json.JSONDecodeError:
-                    _LOGGER.warning(f"Received non-JSON message: {msg.data}")
-            elif msg.type == aiohttp.WSMsgType.ERROR:
-                _LOGGER.error(
-                    f"WebSocket connection closed with error: {self._ws.exception()}"
+            finally:
+                if pinger is not None:
+                    pinger.cancel()
+                    await asyncio.gather(pinger, return_exceptions=True)
+            if not self._reconnect or self._closing:
+                return
+            _LOGGER.warning("WebSocket connection lost; reconnecting.")
+            self._disconnected_at = time.monotonic()
+            self._ws = None
+            await ws.close()
+
+    async def _receive(
+        self, ws: aiohttp.ClientWebSocketResponse
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Yields decoded messages from `ws` until it closes."""
+        try:
+            async for msg in ws:
+                if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    try:
+                        data = self._json_codec.loads(msg.data)
+                    except ValueError:
+                        _LOGGER.warning(f"Received non-JSON message: {msg.data!r:.200}")
+                        continue
+                    yield data
+                elif msg.type == aiohttp.WSMsgType.PING:
+                    await ws.pong(msg.data)
+                elif msg.type == aiohttp.WSMsgType.PONG:
+                    self._on_pong(msg.data)
+                elif msg.type == aiohttp.WSMsgType.ERROR:
+                    _LOGGER.error(
+                        f"WebSocket connection closed with error: {ws.exception()}"
+                    )
+                    break
+                elif msg.type in (
+                    aiohttp.WSMsgType.CLOSED,
+                    aiohttp.WSMsgType.CLOSING,
+                ):
+                    _LOGGER.info("WebSocket connection closed")
+                    break
+        except asyncio.TimeoutError:
+            # Only raised by the heartbeat's receive_timeout.
+            self._idle_timeouts += 1
+            _LOGGER.warning(
+                f"No WebSocket frames for {self._heartbeat.idle_timeout}s; "
+                "closing the connection"
+            )
+            await ws.close()
+        except (aiohttp.ClientError, ConnectionError) as e:
+            if not self._reconnect:
+                raise
+            _LOGGER.error(f"WebSocket receive failed: {e!r}")
+
+    @staticmethod
+    def _idle_deadline(config: HeartbeatConfig) -> Dict[str, Any]:
+        """Returns the `ws_connect` arguments that enforce `idle_timeout`."""
+        ws_timeout = getattr(aiohttp, "ClientWSTimeout", None)
+        if ws_timeout is None:
+            # aiohttp < 3.10
+            return {"receive_timeout": config.idle_timeout}
+        return {"timeout": ws_timeout(ws_receive=config.idle_timeout, ws_close=10.0)}
+
+    async def _send_pings(
+        self, ws: aiohttp.ClientWebSocketResponse, config: HeartbeatConfig
+    ) -> None:
+        """Pings `ws` periodically and closes it if a pong is missed."""
+        sequence = 0
+        while not ws.closed:
+            await asyncio.sleep(config.interval)
+            sequence += 1
+            payload = sequence.to_bytes(8, "big")
+            self._pong_received.clear()
+            self._ping = (payload, time.perf_counter())
+            try:
+                await ws.ping(payload)
+                await asyncio.wait_for(self._pong_received.wait(), config.pong_timeout)
+            except asyncio.TimeoutError:
+                # Only answered pings are round-trip samples; a miss is
+                # counted in `missed_pongs` instead.
+                self._missed_pongs += 1
+                _LOGGER.warning(
+                    f"No pong within {config.pong_timeout}s; closing the WebSocket"
                 )
-                break
-            elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSING):
-                _LOGGER.info("WebSocket connection closed")
-                break
+                await ws.close()
+                return
+            except (aiohttp.ClientError, ConnectionError):
+                return
+
+    def _on_pong(self, payload: bytes) -> None:
+        if self._ping is None or self._ping[0] != payload:
+            return
+        rtt = time.perf_counter() - self._ping[1]
+        self._ping = None
+        self._rtt = rtt
+        self._rtt_max = rtt if self._rtt_max is None else max(self._rtt_max, rtt)
+        if self._metrics is not None:
+            self._metrics.observe("PING", "/ws", rtt)
+        self._pong_received.set()
+
+    async def _reconnect_with_backoff(self, policy: ReconnectPolicy) -> None:
+        """Reconnects and re-subscribes, retrying with jittered backoff."""
+        lost_at = self._disconnected_at or time.monotonic()
+        rejected: Optional[str] = None
+        attempt = 0
+        while not self._closing:
+            attempt += 1
+            delay = policy.backoff(attempt)
+            _LOGGER.info(f"Reconnecting WebSocket (attempt {attempt}) in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            if self._closing:
+                return
+            try:
+                if self._token_provider is not None:
+                    self._token = await self._token_provider(rejected)
+                rejected = None
+                await self._open()
+                for topic in list(self._topics):
+                    await self._ws.send_json({"action": "subscribe", "topic": topic})
+            except (APIError, aiohttp.ClientError, ConnectionError) as e:
+                self._failed_attempts += 1
+                if isinstance(e, AuthError):
+                    rejected = self._token
+                if self._ws is not None:
+                    await self._ws.close()
+                    self._ws = None
+                _LOGGER.warning(f"WebSocket reconnect attempt {attempt} failed: {e}")
+                if policy.max_attempts is not None and attempt >= policy.max_attempts:
+                    if isinstance(e, APIError):
+                        raise
+                    raise APIError(f"WebSocket reconnect failed: {e}") from e
+                continue
+
+            gap = time.monotonic() - lost_at
+            self._reconnects += 1
+            self._last_gap = gap
+            self._max_gap = max(self._max_gap, gap)
+            self._total_gap += gap
+            self._disconnected_at = None
+            _LOGGER.info(
+                f"WebSocket reconnected after {gap:.2f}s; "
+                f"re-subscribed to {len(self._topics)} topic(s)"
+            )
+            return
+
+    def stats(self) -> WebSocketStats:
+        """Returns reconnect counts, connection gaps and heartbeat health."""
+        return WebSocketStats(
+            connected=self._ws is not None and not self._ws.closed,
+            reconnects=self._reconnects,
+            failed_attempts=self._failed_attempts,
+            last_gap=self._last_gap,
+            max_gap=self._max_gap,
+            total_gap=self._total_gap,
+            subscriptions=tuple(self._topics),
+            rtt=self._rtt,
+            rtt_max=self._rtt_max,
+            missed_pongs=self._missed_pongs,
+            idle_timeouts=self._idle_timeouts,
+        )
 
     async def __aenter__(self):
         await self.connect()
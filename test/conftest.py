@@ -6,10 +6,58 @@ import aiohttp
 import asyncio
 import os
 import sys
+from aiohttp.test_utils import TestServer
 from bsm_api_client.api_client import BedrockServerManagerApi
 from bsm_api_client.models import InstallServerPayload
 
 
+@pytest_asyncio.fixture
+async def local_api():
+    """Starts local fake managers for the duration of a test.
+
+    Yields an async factory that takes an `aiohttp.web.Application` holding
+    the test's routes, plus attributes to set on the server (e.g. `state`),
+    and returns the started `TestServer`.
+    """
+    servers = []
+
+    async def start(app, **attributes):
+        server = TestServer(app)
+        await server.start_server()
+        for name, value in attributes.items():
+            setattr(server, name, value)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in reversed(servers):
+        await server.close()
+
+
+@pytest_asyncio.fixture
+async def make_client():
+    """Yields a factory for clients of a `local_api` server.
+
+    `make_client(server, *args, **kwargs)` passes its arguments on to
+    `BedrockServerManagerApi`; `server` may also be a base URL. Unless
+    credentials or a token are given, the client uses a fixed JWT. Clients
+    are closed after the test.
+    """
+    clients = []
+
+    def make(server, *args, **kwargs):
+        if not args and "username" not in kwargs:
+            kwargs.setdefault("jwt_token", "token")
+        base_url = server if isinstance(server, str) else str(server.make_url("/"))
+        client = BedrockServerManagerApi(base_url, *args, **kwargs)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        await client.close()
+
+
 @pytest.fixture(scope="session")
 def server():
     """
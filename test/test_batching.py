@@ -0,0 +1,98 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from bsm_api_client.batching import ServerBatchConfig
+from bsm_api_client.exceptions import APIServerSideError, ServerNotFoundError
+
+SERVERS = [
+    {"name": "s1", "status": "RUNNING", "version": "1.21.0"},
+    {"name": "s2", "status": "STOPPED", "version": "1.20.0"},
+]
+
+
+@pytest_asyncio.fixture
+async def api_server(local_api):
+    """Starts a local server counting list and per-server requests."""
+    state = {"list": 0, "single": 0, "fail": False}
+
+    async def servers(request):
+        state["list"] += 1
+        if state["fail"]:
+            return web.json_response({"detail": "boom"}, status=500)
+        return web.json_response({"status": "success", "servers": SERVERS})
+
+    async def status(request):
+        state["single"] += 1
+        if request.match_info["name"] == "ghost":
+            return web.json_response({"detail": "Server not found"}, status=404)
+        return web.json_response({"status": "success", "data": {"running": False}})
+
+    app = web.Application()
+    app.router.add_get("/api/servers", servers)
+    app.router.add_get("/api/server/{name}/status", status)
+    return await local_api(app, state=state)
+
+
+@pytest.mark.asyncio
+async def test_same_tick_lookups_share_one_server_list(api_server, make_client):
+    """Status and version calls made together are served by one /servers fetch."""
+    client = make_client(api_server, batch_server_lookups=True)
+    s1, s2, v1, v2 = await asyncio.gather(
+        client.async_get_server_running_status("s1"),
+        client.async_get_server_running_status("s2"),
+        client.async_get_server_version("s1"),
+        client.async_get_server_version("s2"),
+    )
+    assert s1.data == {"running": True}
+    assert s2.data == {"running": False}
+    assert v1.data == {"version": "1.21.0"}
+    assert v2.data == {"version": "1.20.0"}
+    assert api_server.state == {"list": 1, "single": 0, "fail": False}
+
+    # A later tick starts a new batch.
+    await client.async_get_server_version("s1")
+    assert api_server.state["list"] == 2
+    stats = client.batch_stats()
+    assert (stats.batches, stats.lookups, stats.misses) == (2, 5, 0)
+
+
+@pytest.mark.asyncio
+async def test_window_misses_and_errors(api_server, make_client):
+    """A window batches sequential calls; unlisted servers and errors are handled."""
+    client = make_client(
+        api_server, batch_server_lookups=ServerBatchConfig(window=0.05)
+    )
+
+    async def later(delay, name):
+        await asyncio.sleep(delay)
+        return await client.async_get_server_version(name)
+
+    await asyncio.gather(later(0, "s1"), later(0.02, "s2"))
+    assert api_server.state["list"] == 1
+
+    with pytest.raises(ServerNotFoundError):
+        await client.async_get_server_running_status("ghost")
+    assert api_server.state["single"] == 1
+    assert client.batch_stats().misses == 1
+
+    api_server.state["fail"] = True
+    results = await asyncio.gather(
+        client.async_get_server_version("s1"),
+        client.async_get_server_version("s2"),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, APIServerSideError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_batching_disabled_by_default(api_server, make_client):
+    """Without the option every lookup sends its own request."""
+    client = make_client(api_server)
+    await asyncio.gather(
+        client.async_get_server_running_status("s1"),
+        client.async_get_server_running_status("s2"),
+    )
+    assert api_server.state["single"] == 2
+    assert api_server.state["list"] == 0
+    assert client.batch_stats() is None
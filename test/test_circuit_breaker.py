@@ -0,0 +1,104 @@
+import pytest
+import pytest_asyncio
+from unittest.mock import patch
+from aiohttp import web
+from bsm_api_client.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitState,
+)
+from bsm_api_client.exceptions import (
+    APIServerSideError,
+    CannotConnectError,
+    CircuitOpenError,
+    ServerNotFoundError,
+)
+
+
+@pytest_asyncio.fixture
+async def api_server(local_api):
+    """Starts a local aiohttp server whose /servers route can be made to fail."""
+    state = {"status": 503, "hits": 0}
+
+    async def servers(request):
+        state["hits"] += 1
+        if state["status"] != 200:
+            return web.json_response({"detail": "down"}, status=state["status"])
+        return web.json_response({"status": "success", "servers": []})
+
+    async def missing(request):
+        return web.json_response({"detail": "no such server"}, status=404)
+
+    app = web.Application()
+    app.router.add_get("/api/servers", servers)
+    app.router.add_get("/api/server/{name}/status", missing)
+    return await local_api(app, state=state)
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_and_fails_fast(api_server, make_client):
+    """After the threshold, requests fail without reaching the host."""
+    client = make_client(
+        api_server,
+        circuit_breaker=CircuitBreakerConfig(failure_threshold=2, recovery_timeout=60),
+    )
+    for _ in range(2):
+        with pytest.raises(APIServerSideError):
+            await client.async_get_servers()
+    with pytest.raises(CircuitOpenError) as exc_info:
+        await client.async_get_servers()
+    assert isinstance(exc_info.value, CannotConnectError)
+    assert exc_info.value.retry_after > 0
+    assert api_server.state["hits"] == 2
+
+    stats = client.circuit_stats()
+    assert stats.state is CircuitState.OPEN
+    assert stats.rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_half_open_trial_closes_circuit(api_server, make_client):
+    """A successful trial request after the cooldown closes the circuit."""
+    client = make_client(
+        api_server,
+        circuit_breaker=CircuitBreakerConfig(failure_threshold=1, recovery_timeout=0),
+    )
+    with pytest.raises(APIServerSideError):
+        await client.async_get_servers()
+    assert client.circuit_stats().state is CircuitState.HALF_OPEN
+
+    api_server.state["status"] = 200
+    await client.async_get_servers()
+    assert client.circuit_stats().state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_client_errors_count_as_host_success(api_server, make_client):
+    """A 404 proves the host is reachable and resets the failure count."""
+    client = make_client(
+        api_server,
+        circuit_breaker=CircuitBreakerConfig(failure_threshold=2),
+    )
+    with pytest.raises(APIServerSideError):
+        await client.async_get_servers()
+    with pytest.raises(ServerNotFoundError):
+        await client.async_get_server_running_status("ghost")
+    assert client.circuit_stats().consecutive_failures == 0
+
+
+def test_half_open_failure_reopens_and_limits_trials():
+    """Only one trial runs while half-open; its failure reopens the circuit."""
+    breaker = CircuitBreaker(
+        "host", CircuitBreakerConfig(failure_threshold=1, recovery_timeout=10)
+    )
+    with patch("bsm_api_client.circuit_breaker.time.monotonic", return_value=100.0):
+        breaker.record(CannotConnectError("refused"))
+        assert breaker.state is CircuitState.OPEN
+    with patch("bsm_api_client.circuit_breaker.time.monotonic", return_value=111.0):
+        breaker.before_call()
+        assert breaker.state is CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record(CannotConnectError("refused"))
+        assert breaker.state is CircuitState.OPEN
+    assert breaker.stats().times_opened == 2
@@ -0,0 +1,83 @@
+import asyncio
+from contextlib import asynccontextmanager
+import aiohttp
+import click
+from click.testing import CliRunner
+from unittest.mock import patch
+from bsm_api_client.api_client import BedrockServerManagerApi
+from bsm_api_client.cli import exporter as exporter_module
+from bsm_api_client.cli.decorators import AsyncGroup
+from bsm_api_client.exporter import MetricsExporter
+
+
+def _cli(base_url=None):
+    """Builds a group holding only `exporter`, logged in to `base_url` if given."""
+
+    @click.group(cls=AsyncGroup)
+    def cli():
+        pass
+
+    @cli.context
+    @asynccontextmanager
+    async def context(ctx):
+        if base_url is not None:
+            ctx.obj["client"] = BedrockServerManagerApi(base_url, jwt_token="token")
+        try:
+            yield
+        finally:
+            if ctx.obj.get("client"):
+                await ctx.obj["client"].close()
+
+    cli.add_command(exporter_module.exporter)
+    return cli
+
+
+def test_exporter_command_serves_metrics_until_stopped():
+    """The command serves /metrics with the given options until cancelled."""
+    started = []
+
+    class ScrapeOnce(MetricsExporter):
+        async def __aenter__(self):
+            server = await super().__aenter__()
+            started.append(self)
+            command = asyncio.current_task()
+
+            async def scrape_then_stop():
+                url = f"http://127.0.0.1:{server.port}/metrics"
+                async with aiohttp.ClientSession() as session:
+                    async with session.get(url) as response:
+                        started.append(await response.text())
+                command.cancel()
+
+            self._scrape = asyncio.create_task(scrape_then_stop())
+            return server
+
+    with patch.object(exporter_module, "MetricsExporter", ScrapeOnce):
+        result = CliRunner().invoke(
+            _cli("http://127.0.0.1:1"),
+            [
+                "exporter",
+                "--port",
+                "0",
+                "--interval",
+                "60",
+                "--concurrency",
+                "2",
+                "--no-process-info",
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert "Serving metrics on http://127.0.0.1:" in result.output
+    assert "Exporter stopped." in result.output
+    exporter, text = started
+    assert exporter.config.interval == 60
+    assert exporter.config.max_concurrency == 2
+    assert not exporter.config.process_info
+    assert "bsm_up 0" in text.splitlines()
+
+
+def test_exporter_command_requires_login():
+    result = CliRunner().invoke(_cli(), ["exporter"])
+    assert result.exit_code == 0
+    assert "You are not logged in." in result.output
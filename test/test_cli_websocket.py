@@ -2,7 +2,7 @@ import pytest
 import asyncio
 from unittest.mock import MagicMock, AsyncMock, patch
 import click
-from bsm_api_client.cli.server import list_servers
+from bsm_api_client.cli.server import _StatusBoard, list_servers
 from bsm_api_client.websocket_client import WebSocketClient
 from bsm_api_client.cli.decorators import monitor_task
 
@@ -138,3 +138,98 @@ async def test_monitor_task_fallback(mock_client):
         fg="yellow",
     )
     mock_secho.assert_any_call("Success: Done via poll", fg="green")
+
+
+async def _run_list_loop(mock_client, mock_ws_client, messages):
+    """Runs `server list --loop` over `messages` until it falls back to polling."""
+    mock_client.websocket_connect.return_value = mock_ws_client
+
+    async def listen_mock():
+        for msg in messages:
+            yield msg
+
+    mock_ws_client.listen.side_effect = listen_mock
+    ctx = click.Context(list_servers, obj={"client": mock_client})
+
+    async def side_effect_sleep(seconds):
+        raise KeyboardInterrupt("Break loop")
+
+    with patch("click.clear") as mock_clear, patch("click.secho"), patch(
+        "click.echo"
+    ) as mock_echo, patch("asyncio.sleep", side_effect=side_effect_sleep):
+        with ctx.scope():
+            await list_servers.callback(loop=True, server_name=None)
+    return mock_clear, mock_echo
+
+
+@pytest.mark.asyncio
+async def test_list_servers_coalesces_event_burst(mock_client, mock_ws_client):
+    """A burst of events without state results in a single refetch."""
+    messages = [{"topic": "event:after_server_start", "data": {}}] * 20
+    await _run_list_loop(mock_client, mock_ws_client, messages)
+
+    # The initial display plus one refresh for the whole burst.
+    assert mock_client.async_get_servers.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_list_servers_applies_event_payloads(mock_client, mock_ws_client):
+    """Events carrying server state are applied without fetching."""
+    messages = [
+        {
+            "topic": "event:after_server_statuses_updated",
+            "data": {
+                "servers": [
+                    {"name": "server1", "status": "STOPPED", "version": "1.0"},
+                    {"name": "server2", "status": "RUNNING", "version": "1.1"},
+                ]
+            },
+        },
+        {
+            "topic": "event:after_server_statuses_updated",
+            "data": {"server_name": "server2", "status": "STOPPING"},
+        },
+    ]
+    mock_clear, mock_echo = await _run_list_loop(
+        mock_client, mock_ws_client, messages
+    )
+
+    assert mock_client.async_get_servers.call_count == 1
+    # Drawn once initially and once for the batch.
+    assert mock_clear.call_count == 2
+    output = "".join(str(c.args[0]) for c in mock_echo.call_args_list if c.args)
+    assert "server2" in output and "STOPPING" in output
+
+
+def test_status_board_redraws_changed_rows_only(mock_client):
+    servers = [
+        {"name": "server1", "status": "RUNNING", "version": "1.0"},
+        {"name": "server2", "status": "RUNNING", "version": "1.0"},
+    ]
+    board = _StatusBoard(mock_client)
+    terminal = MagicMock()
+    terminal.isatty.return_value = True
+
+    with patch("click.clear") as mock_clear, patch("click.secho"), patch(
+        "click.echo"
+    ) as mock_echo, patch("click.get_text_stream", return_value=terminal):
+        board.replace(servers)
+        board.render()
+        mock_echo.reset_mock()
+
+        board.merge([{"name": "server2", "status": "STOPPED"}])
+        board.render()
+        # Only the second row (screen line 5) is rewritten.
+        assert mock_clear.call_count == 1
+        first, park = [c.args[0] for c in mock_echo.call_args_list]
+        assert first.startswith("\x1b[5;1H\x1b[2K") and "STOPPED" in first
+        assert park == "\x1b[7;1H"
+
+        mock_echo.reset_mock()
+        board.render()
+        mock_echo.assert_not_called()
+
+        # A new server changes the layout and redraws the table.
+        board.merge([{"name": "server3", "status": "RUNNING"}])
+        board.render()
+        assert mock_clear.call_count == 2
@@ -0,0 +1,131 @@
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from bsm_api_client.conditional import ValidatorCache
+from bsm_api_client.exceptions import APIError
+from bsm_api_client.models import GeneralApiResponse
+
+ETAG = '"v1"'
+LAST_MODIFIED = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+@pytest_asyncio.fixture
+async def api_server(local_api):
+    """Starts a local aiohttp server whose routes honour conditional headers."""
+    seen = {"servers": [], "icon": [], "panorama": []}
+    # Called just before a 304 is sent, e.g. to evict the client's entry.
+    hooks = {"not_modified": lambda: None}
+
+    async def servers(request):
+        seen["servers"].append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == ETAG:
+            hooks["not_modified"]()
+            return web.Response(status=304, headers={"ETag": ETAG})
+        return web.json_response(
+            {"status": "success", "servers": [{"name": "s1"}]},
+            headers={"ETag": ETAG},
+        )
+
+    async def icon(request):
+        seen["icon"].append(request.headers.get("If-Modified-Since"))
+        if request.headers.get("If-Modified-Since") == LAST_MODIFIED:
+            hooks["not_modified"]()
+            return web.Response(status=304)
+        return web.Response(
+            body=b"\xff\xd8icon",
+            content_type="image/jpeg",
+            headers={"Last-Modified": LAST_MODIFIED},
+        )
+
+    async def panorama(request):
+        seen["panorama"].append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304)
+        return web.Response(
+            body=b"\xff\xd8pano", content_type="image/jpeg", headers={"ETag": ETAG}
+        )
+
+    async def no_validators(request):
+        return web.json_response({"status": "success", "data": {}})
+
+    async def always_not_modified(request):
+        return web.Response(status=304)
+
+    app = web.Application()
+    app.router.add_get("/api/servers", servers)
+    app.router.add_get("/api/server/{name}/world/icon", icon)
+    app.router.add_get("/api/panorama", panorama)
+    app.router.add_get("/api/info", no_validators)
+    app.router.add_get("/api/stale", always_not_modified)
+    return await local_api(app, seen=seen, hooks=hooks)
+
+
+@pytest.mark.asyncio
+async def test_not_modified_returns_same_validated_model(api_server, make_client):
+    """A 304 returns the previously validated model instance."""
+    client = make_client(api_server, conditional_requests=True)
+    first = await client.async_get_servers()
+    second = await client.async_get_servers()
+    assert isinstance(second, GeneralApiResponse)
+    assert second is first
+    assert api_server.seen["servers"] == [None, ETAG]
+    stats = client.conditional_stats()
+    assert stats.not_modified == 1
+    assert stats.size == 1
+
+    # Responses without validators are not remembered.
+    await client.async_get_info()
+    assert client.conditional_stats().size == 1
+
+
+@pytest.mark.asyncio
+async def test_binary_fetchers_reuse_body_on_not_modified(api_server, make_client):
+    """World icon and panorama downloads are revalidated instead of re-fetched."""
+    client = make_client(api_server, conditional_requests=True)
+    assert await client.async_get_world_icon_image("s1") == b"\xff\xd8icon"
+    assert await client.async_get_world_icon_image("s1") == b"\xff\xd8icon"
+    assert api_server.seen["icon"] == [None, LAST_MODIFIED]
+
+    assert await client.async_get_panorama_image() == b"\xff\xd8pano"
+    assert await client.async_get_panorama_image() == b"\xff\xd8pano"
+    assert api_server.seen["panorama"] == [None, ETAG]
+
+
+@pytest.mark.asyncio
+async def test_not_modified_after_eviction_fetches_again(api_server, make_client):
+    """A 304 whose entry was evicted in flight is re-requested, never faked."""
+    client = make_client(api_server, conditional_requests=True)
+    api_server.hooks["not_modified"] = client._validator_cache._entries.clear
+
+    await client.async_get_servers()
+    servers = await client.async_get_servers()
+    assert servers.servers == [{"name": "s1"}]
+    assert api_server.seen["servers"] == [None, ETAG, None]
+
+    assert await client.async_get_world_icon_image("s1") == b"\xff\xd8icon"
+    assert await client.async_get_world_icon_image("s1") == b"\xff\xd8icon"
+    assert api_server.seen["icon"] == [None, LAST_MODIFIED, None]
+    assert client.conditional_stats().not_modified == 0
+
+    # A 304 to a request that sent no validators has nothing to reuse.
+    with pytest.raises(APIError):
+        await client._request("GET", "/stale")
+
+
+@pytest.mark.asyncio
+async def test_conditional_requests_disabled_by_default(api_server, make_client):
+    """Without conditional_requests no validators are sent."""
+    client = make_client(api_server)
+    await client.async_get_servers()
+    await client.async_get_servers()
+    assert api_server.seen["servers"] == [None, None]
+    assert client.conditional_stats() is None
+
+
+def test_validator_cache_lru_bound():
+    """The oldest entry is forgotten once max_entries is exceeded."""
+    cache = ValidatorCache(max_entries=1)
+    cache.store("a", {"ETag": '"a"'}, {"v": 1})
+    cache.store("b", {"ETag": '"b"'}, {"v": 2})
+    assert cache.request_headers("a") == {}
+    assert cache.request_headers("b") == {"If-None-Match": '"b"'}
@@ -0,0 +1,69 @@
+import pytest
+import pytest_asyncio
+import aiohttp
+from aiohttp import web
+from bsm_api_client.connection_pool import ConnectionPoolConfig, PoolStats
+
+
+@pytest_asyncio.fixture
+async def api_server(local_api):
+    """Starts a local aiohttp server that answers /api/info."""
+
+    async def info(request):
+        return web.json_response({"status": "success", "data": {}})
+
+    app = web.Application()
+    app.router.add_get("/api/info", info)
+    return await local_api(app)
+
+
+def test_connector_kwargs_force_close_drops_keepalive():
+    """keepalive_timeout must not be passed together with force_close."""
+    kwargs = ConnectionPoolConfig(force_close=True).connector_kwargs()
+    assert kwargs["force_close"] is True
+    assert "keepalive_timeout" not in kwargs
+
+
+@pytest.mark.asyncio
+async def test_internal_session_uses_pool_config(make_client):
+    """The internal connector is built from the supplied pool configuration."""
+    config = ConnectionPoolConfig(limit=7, limit_per_host=3)
+    client = make_client("http://localhost", "admin", "password", pool_config=config)
+    assert client._session.connector.limit == 7
+    assert client._session.connector.limit_per_host == 3
+    stats = client.pool_stats()
+    assert stats == PoolStats(
+        open=0, idle=0, in_use=0, created=0, reused=0, limit=7, limit_per_host=3
+    )
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_counts_reuse(api_server, make_client):
+    """Sequential requests reuse the same keep-alive connection."""
+    client = make_client(api_server, "admin", "password")
+    for _ in range(3):
+        await client.async_get_info()
+    stats = client.pool_stats()
+    assert stats.created == 1
+    assert stats.reused == 2
+    assert stats.idle == 1
+    assert stats.in_use == 0
+    assert stats.reuse_ratio == pytest.approx(2 / 3)
+
+
+@pytest.mark.asyncio
+async def test_pool_config_ignored_for_external_session(make_client):
+    """An external session keeps its own connector settings."""
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=5)
+    ) as session:
+        client = make_client(
+            "http://localhost",
+            "admin",
+            "password",
+            session=session,
+            pool_config=ConnectionPoolConfig(limit=50),
+        )
+        assert client.pool_stats().limit == 5
+        await client.close()
+        assert not session.closed
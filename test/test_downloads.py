@@ -0,0 +1,105 @@
+import io
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from bsm_api_client.exceptions import (
+    APIError,
+    ResponseTooLargeError,
+    ServerNotFoundError,
+)
+
+CREDENTIALS = dict(
+    username="admin", password="pw", jwt_token="stale", token_refresh=False
+)
+ICON = b"\xff\xd8" + b"i" * 200_000
+
+
+@pytest_asyncio.fixture
+async def api_server(local_api):
+    """Starts a local server with an authenticated icon and a chunked stream."""
+    state = {"logins": 0, "icon_auth": []}
+
+    async def login(request):
+        state["logins"] += 1
+        return web.json_response({"access_token": "fresh", "token_type": "bearer"})
+
+    async def icon(request):
+        state["icon_auth"].append(request.headers.get("Authorization"))
+        if request.match_info["name"] == "ghost":
+            return web.json_response({"detail": "Server not found"}, status=404)
+        if request.headers.get("Authorization") != "Bearer fresh":
+            return web.json_response({"detail": "expired"}, status=401)
+        return web.Response(body=ICON, content_type="image/jpeg")
+
+    async def panorama(request):
+        # No Content-Length: the size limit must be enforced while streaming.
+        response = web.StreamResponse()
+        response.content_type = "image/jpeg"
+        await response.prepare(request)
+        for _ in range(10):
+            await response.write(b"p" * 10_000)
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_post("/auth/token", login)
+    app.router.add_get("/api/server/{name}/world/icon", icon)
+    app.router.add_get("/api/panorama", panorama)
+    return await local_api(app, state=state)
+
+
+@pytest.mark.asyncio
+async def test_icon_download_refreshes_token_on_401(api_server, make_client):
+    """A 401 triggers one login and a replay, as for JSON requests."""
+    client = make_client(api_server, **CREDENTIALS)
+    assert await client.async_get_world_icon_image("s1") == ICON
+    assert api_server.state["icon_auth"] == ["Bearer stale", "Bearer fresh"]
+    assert api_server.state["logins"] == 1
+
+    with pytest.raises(ServerNotFoundError):
+        await client.async_get_world_icon_image("ghost")
+
+
+@pytest.mark.asyncio
+async def test_download_to_path_and_file_object(api_server, tmp_path, make_client):
+    """Downloads stream to a file path or a file object."""
+    client = make_client(api_server, **CREDENTIALS)
+    target = tmp_path / "icon.jpg"
+    written = await client.async_get_world_icon_image("s1", destination=target)
+    assert written == len(ICON)
+    assert target.read_bytes() == ICON
+    assert not (tmp_path / "icon.jpg.part").exists()
+
+    buffer = io.BytesIO()
+    assert await client.async_get_panorama_image(destination=buffer) == 100_000
+    assert buffer.getvalue() == b"p" * 100_000
+
+
+@pytest.mark.asyncio
+async def test_size_limit_aborts_download(api_server, tmp_path, make_client):
+    """max_bytes is enforced from Content-Length or while streaming."""
+    client = make_client(api_server, **CREDENTIALS)
+    with pytest.raises(ResponseTooLargeError) as exc_info:
+        await client.async_get_world_icon_image("s1", max_bytes=1000)
+    assert isinstance(exc_info.value, APIError)
+    assert exc_info.value.max_bytes == 1000
+
+    target = tmp_path / "pano.jpg"
+    with pytest.raises(ResponseTooLargeError):
+        await client.async_get_panorama_image(destination=target, max_bytes=50_000)
+    assert not target.exists()
+    assert not (tmp_path / "pano.jpg.part").exists()
+
+
+@pytest.mark.asyncio
+async def test_iter_download_yields_chunks(api_server, make_client):
+    """The streaming primitive yields the body in bounded chunks."""
+    client = make_client(api_server, **CREDENTIALS)
+    chunks = [
+        chunk
+        async for chunk in client._iter_download(
+            "/panorama", chunk_size=4096, authenticated=False
+        )
+    ]
+    assert b"".join(chunks) == b"p" * 100_000
+    assert max(len(chunk) for chunk in chunks) <= 4096
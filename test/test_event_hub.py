@@ -0,0 +1,143 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from bsm_api_client.event_hub import EventHubConfig, OverflowPolicy
+
+
+@pytest_asyncio.fixture
+async def ws_server(local_api):
+    """Starts a WebSocket endpoint that records actions and can push messages.
+
+    Like the manager, it only delivers topics the connection subscribed to,
+    except `task:` updates, which are sent unsolicited.
+    """
+    state = {"connections": 0, "actions": [], "sockets": []}
+
+    async def ws_handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        ws.topics = set()
+        state["connections"] += 1
+        state["sockets"].append(ws)
+        async for msg in ws:
+            data = msg.json()
+            state["actions"].append((data["action"], data["topic"]))
+            if data["action"] == "subscribe":
+                ws.topics.add(data["topic"])
+            else:
+                ws.topics.discard(data["topic"])
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/ws", ws_handler)
+
+    async def push(*topics):
+        ws = state["sockets"][-1]
+        for topic in topics:
+            if topic in ws.topics or topic.startswith("task:"):
+                await ws.send_json({"topic": topic, "data": {}})
+
+    return await local_api(app, state=state, push=push)
+
+
+async def _drain(sub, count):
+    return [(await asyncio.wait_for(sub.get(), 1))["topic"] for _ in range(count)]
+
+
+async def _settle(state, count):
+    for _ in range(100):
+        if len(state["actions"]) >= count:
+            return
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_subscribers_share_one_connection(ws_server, make_client):
+    """Subscribers share a socket and ref-count topics; patterns stay local."""
+    client = make_client(ws_server)
+    state = ws_server.state
+    start = "event:after_server_start"
+    stop = "event:after_server_stop"
+    servers_a = await client.events.subscribe(start)
+    servers_b = await client.events.subscribe(start, stop)
+    tasks = await client.events.subscribe(patterns=["task:*"])
+    everything = await client.events.subscribe(patterns=["event:*"])
+
+    await _settle(state, 2)
+    await ws_server.push(start, stop, "event:after_server_updated", "task:2")
+    assert await _drain(servers_a, 1) == [start]
+    assert await _drain(servers_b, 2) == [start, stop]
+    assert await _drain(tasks, 1) == ["task:2"]
+    # Patterns see what the connection receives, not unsubscribed topics.
+    assert await _drain(everything, 2) == [start, stop]
+
+    assert state["connections"] == 1
+    assert client.events.stats().topics == {start: 2, stop: 1}
+
+    await servers_a.close()
+    assert client.events.stats().topics == {start: 1, stop: 1}
+    await servers_b.close()
+    await _settle(state, 4)
+    # Only exact topics were ever sent to the manager.
+    assert state["actions"] == [
+        ("subscribe", start),
+        ("subscribe", stop),
+        ("unsubscribe", start),
+        ("unsubscribe", stop),
+    ]
+    await everything.close()
+    stats = client.events.stats()
+    assert stats.subscribers == 1 and stats.connected
+    assert stats.delivered == 6
+
+    await client.close()
+    # Closing the client closes the hub and ends open subscriptions.
+    with pytest.raises(StopAsyncIteration):
+        await tasks.get()
+
+
+@pytest.mark.asyncio
+async def test_overflow_policies(ws_server, make_client):
+    """Full queues drop the oldest or newest message, or apply backpressure."""
+    client = make_client(ws_server, event_hub=EventHubConfig(queue_size=2))
+    oldest = await client.events.subscribe("e:1", "e:2", "e:3", "e:4")
+    newest = await client.events.subscribe(patterns=["e:*"], overflow="drop_newest")
+    blocking = await client.events.subscribe(
+        "b:1", "b:2", "b:3", queue_size=1, overflow=OverflowPolicy.BLOCK
+    )
+
+    await _settle(ws_server.state, 7)
+    await ws_server.push("e:1", "e:2", "e:3", "e:4", "b:1", "b:2", "b:3")
+    assert await _drain(blocking, 3) == ["b:1", "b:2", "b:3"]
+    assert blocking.dropped == 0
+    assert await _drain(oldest, 2) == ["e:3", "e:4"]
+    assert await _drain(newest, 2) == ["e:1", "e:2"]
+    assert oldest.dropped == newest.dropped == 2
+    assert client.events.stats().dropped == 4
+
+    async with blocking:
+        pass
+    assert blocking.closed
+    with pytest.raises(StopAsyncIteration):
+        await blocking.get()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_rejects_wildcard_topics(ws_server, make_client):
+    """Wildcards must be passed as local patterns, not manager topics."""
+    client = make_client(ws_server)
+    with pytest.raises(ValueError):
+        await client.events.subscribe("event:after_server_*")
+    with pytest.raises(ValueError):
+        await client.events.subscribe()
+    assert ws_server.state["connections"] == 0
+
+
+def test_event_hub_config_validation():
+    """Invalid queue sizes and overflow policies are rejected."""
+    with pytest.raises(ValueError):
+        EventHubConfig(queue_size=0)
+    with pytest.raises(ValueError):
+        EventHubConfig(overflow="spill")
+    assert EventHubConfig(overflow="block").overflow is OverflowPolicy.BLOCK
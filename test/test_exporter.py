@@ -0,0 +1,130 @@
+import asyncio
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from bsm_api_client.exporter import (
+    OPENMETRICS_CONTENT_TYPE,
+    ExporterConfig,
+    MetricsExporter,
+)
+
+SERVERS = [
+    {"name": f"s{i}", "status": "RUNNING", "version": "1.21.0"} for i in range(6)
+] + [{"name": 'odd"name', "status": "STOPPED", "version": "1.20.0"}]
+
+
+@pytest_asyncio.fixture
+async def api_server(local_api):
+    """Starts a fake manager that tracks calls and process_info concurrency."""
+    state = {"calls": 0, "active": 0, "max_active": 0}
+
+    async def servers(request):
+        state["calls"] += 1
+        return web.json_response({"status": "success", "servers": SERVERS})
+
+    async def players(request):
+        state["calls"] += 1
+        return web.json_response(
+            {"status": "success", "players": [{"name": "a"}, {"name": "b"}]}
+        )
+
+    async def process_info(request):
+        state["calls"] += 1
+        state["active"] += 1
+        state["max_active"] = max(state["max_active"], state["active"])
+        await asyncio.sleep(0.02)
+        state["active"] -= 1
+        if request.match_info["name"] == "s5":
+            return web.json_response({"detail": "boom"}, status=500)
+        return web.json_response(
+            {
+                "status": "success",
+                "data": {"process_info": {"cpu_percent": 12.5, "memory_mb": 2.0}},
+            }
+        )
+
+    app = web.Application()
+    app.router.add_get("/api/servers", servers)
+    app.router.add_get("/api/players/get", players)
+    app.router.add_get("/api/server/{name}/process_info", process_info)
+    return await local_api(app, state=state)
+
+
+async def _scrape(port, accept=None):
+    headers = {"Accept": accept} if accept else {}
+    async with aiohttp.ClientSession() as session:
+        async with session.get(
+            f"http://127.0.0.1:{port}/metrics", headers=headers
+        ) as response:
+            return response.headers["Content-Type"], await response.text()
+
+
+@pytest.mark.asyncio
+async def test_exporter_serves_cached_fleet_and_client_metrics(api_server, make_client):
+    """Scrapes render the cached collection without calling the manager."""
+    client = make_client(api_server)
+    config = ExporterConfig(interval=60, max_concurrency=2)
+    async with MetricsExporter(client, config, port=0) as exporter:
+        calls = api_server.state["calls"]
+        # servers + players + one process_info per running server
+        assert calls == 2 + 6
+        assert api_server.state["max_active"] <= 2
+
+        content_type, text = await _scrape(exporter.port)
+        await _scrape(exporter.port)
+        assert api_server.state["calls"] == calls
+
+    assert content_type.startswith("text/plain; version=0.0.4")
+    lines = text.splitlines()
+    assert "bsm_up 1" in lines
+    assert 'bsm_server_info{server="s0",version="1.21.0"} 1' in lines
+    assert 'bsm_server_running{server="odd\\"name"} 0' in lines
+    assert 'bsm_server_status{server="s1",status="RUNNING"} 1' in lines
+    assert 'bsm_server_cpu_percent{server="s0"} 12.5' in lines
+    assert 'bsm_server_memory_bytes{server="s0"} 2097152' in lines
+    assert not any(
+        line.startswith('bsm_server_cpu_percent{server="s5"}') for line in lines
+    )
+    assert "bsm_known_players 2" in lines
+    assert 'bsm_exporter_collection_errors_total{stage="process_info"} 1' in lines
+    assert "# TYPE bsm_client_requests_total counter" in lines
+    assert (
+        'bsm_client_requests_total{method="GET",endpoint="/server/{name}/process_info"} 6'
+        in lines
+    )
+    assert (
+        'bsm_client_request_errors_total{method="GET",endpoint="/server/{name}/process_info",'
+        'error="APIServerSideError"} 1' in lines
+    )
+    assert (
+        'bsm_client_request_duration_seconds_bucket{method="GET",endpoint="/servers",'
+        'le="+Inf"} 1' in lines
+    )
+
+
+@pytest.mark.asyncio
+async def test_exporter_openmetrics_and_unreachable_manager(make_client):
+    """OpenMetrics is negotiated via Accept; a failed collection reports down."""
+    client = make_client("http://127.0.0.1:1")
+    exporter = MetricsExporter(client, ExporterConfig(interval=60), port=0)
+    async with exporter:
+        content_type, text = await _scrape(
+            exporter.port, accept="application/openmetrics-text; version=1.0.0"
+        )
+
+    assert content_type == OPENMETRICS_CONTENT_TYPE
+    lines = text.splitlines()
+    assert lines[-1] == "# EOF"
+    assert "bsm_up 0" in lines
+    assert "# TYPE bsm_client_requests counter" in lines
+    assert 'bsm_exporter_collection_errors_total{stage="servers"} 1' in lines
+    assert not any(line.startswith("bsm_server_info{") for line in lines)
+
+
+def test_exporter_config_validation():
+    """Invalid intervals and concurrency limits are rejected."""
+    with pytest.raises(ValueError):
+        ExporterConfig(interval=0)
+    with pytest.raises(ValueError):
+        ExporterConfig(max_concurrency=0)
@@ -0,0 +1,129 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from bsm_api_client.exceptions import APIServerSideError
+from bsm_api_client.fleet import FleetClient, HostResult
+
+
+@pytest_asyncio.fixture
+async def managers(local_api):
+    """Starts three fake managers: fast, slow and failing."""
+    state = {"active": {}, "max_active": {}, "cancelled": 0}
+    servers = {}
+
+    def make_app(host, delay, fail=False):
+        async def list_servers(request):
+            active = state["active"]
+            active[host] = active.get(host, 0) + 1
+            total = sum(active.values())
+            state["max_active"][host] = max(
+                state["max_active"].get(host, 0), active[host]
+            )
+            state["max_active"]["*"] = max(state["max_active"].get("*", 0), total)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                state["cancelled"] += 1
+                raise
+            finally:
+                active[host] -= 1
+            if fail:
+                return web.json_response({"detail": "boom"}, status=500)
+            return web.json_response(
+                {"status": "success", "servers": [{"name": f"{host}-1"}]}
+            )
+
+        app = web.Application()
+        app.router.add_get("/api/servers", list_servers)
+        return app
+
+    hosts = (("fast", 0.01, False), ("slow", 0.2, False), ("broken", 0.01, True))
+    for host, delay, fail in hosts:
+        servers[host] = await local_api(make_app(host, delay, fail))
+    return servers, state
+
+
+def _fleet(servers, **kwargs):
+    return FleetClient(
+        {host: str(server.make_url("/")) for host, server in servers.items()},
+        jwt_token="token",
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_in_completion_order(managers):
+    """Results arrive as hosts finish, and errors do not fail the fan-out."""
+    servers, _ = managers
+    async with _fleet(servers) as fleet:
+        sessions = {id(client._session) for client in fleet.clients.values()}
+        assert sessions == {id(fleet._session)}
+
+        results = [res async for res in fleet.stream("async_get_servers")]
+        assert [res.host for res in results][-1] == "slow"
+        by_host = {res.host: res for res in results}
+        assert by_host["fast"].ok
+        assert by_host["fast"].unwrap().servers == [{"name": "fast-1"}]
+        assert isinstance(by_host["broken"].error, APIServerSideError)
+        with pytest.raises(APIServerSideError):
+            by_host["broken"].unwrap()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limits(managers):
+    """Global and per-host limits bound the calls in flight."""
+    servers, state = managers
+    async with _fleet(servers, max_concurrency=2, per_host_concurrency=1) as fleet:
+        calls = [fleet.gather("async_get_servers") for _ in range(3)]
+        results = await asyncio.gather(*calls)
+
+    assert all(len(r) == 3 for r in results)
+    assert state["max_active"]["*"] <= 2
+    assert all(state["max_active"][host] == 1 for host in servers)
+
+
+@pytest.mark.asyncio
+async def test_subset_timeout_and_callables(managers):
+    """Host subsets, per-host timeouts and callables are supported."""
+    servers, _ = managers
+    async with _fleet(servers) as fleet:
+        results = await fleet.gather(
+            lambda client: client.async_get_servers(), hosts=["fast", "slow"]
+        )
+        assert set(results) == {"fast", "slow"}
+
+        results = await fleet.gather("async_get_servers", timeout=0.1)
+        assert isinstance(results["slow"].error, asyncio.TimeoutError)
+        assert results["fast"].ok
+
+        with pytest.raises(KeyError):
+            await fleet.gather("async_get_servers", hosts=["nope"])
+        with pytest.raises(ValueError):
+            await fleet.gather("metrics")
+        with pytest.raises(ValueError):
+            await fleet.gather("_request")
+
+
+@pytest.mark.asyncio
+async def test_leaving_stream_cancels_pending(managers):
+    """Breaking out of stream() cancels the calls still running."""
+    servers, state = managers
+    async with _fleet(servers) as fleet:
+        async for res in fleet.stream("async_get_servers", hosts=["fast", "slow"]):
+            assert isinstance(res, HostResult)
+            break
+        await asyncio.sleep(0.05)
+    assert res.host == "fast"
+    assert state["active"]["slow"] == 0
+    assert state["cancelled"] == 1
+
+
+def test_fleet_validation():
+    """Empty fleets, bad limits and managed arguments are rejected."""
+    with pytest.raises(ValueError):
+        FleetClient({})
+    with pytest.raises(ValueError):
+        FleetClient({"a": "http://a"}, max_concurrency=0)
+    with pytest.raises(ValueError):
+        FleetClient({"a": "http://a"}, session=object())
@@ -0,0 +1,167 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from bsm_api_client.fleet_state import (
+    FleetState,
+    FleetStateConfig,
+    ServerStateUpdate,
+    server_state_from_event,
+)
+
+
+@pytest_asyncio.fixture
+async def manager(local_api):
+    """Starts a manager with a mutable server list and a WebSocket to push on."""
+    state = {
+        "servers": [
+            {"name": "s1", "status": "RUNNING", "version": "1.0"},
+            {"name": "s2", "status": "STOPPED", "version": "1.0"},
+        ],
+        "fetches": 0,
+        "delay": 0,
+        "sockets": [],
+    }
+
+    async def servers(request):
+        state["fetches"] += 1
+        snapshot = [dict(s) for s in state["servers"]]
+        await asyncio.sleep(state["delay"])
+        return web.json_response({"status": "success", "servers": snapshot})
+
+    async def ws_handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        ws.topics = set()
+        state["sockets"].append(ws)
+        async for msg in ws:
+            ws.topics.add(msg.json()["topic"])
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/api/servers", servers)
+    app.router.add_get("/ws", ws_handler)
+
+    async def push(topic, **data):
+        ws = state["sockets"][-1]
+        # Like the manager, only deliver subscribed topics.
+        for _ in range(100):
+            if topic in ws.topics:
+                break
+            await asyncio.sleep(0.01)
+        else:
+            raise AssertionError(f"{topic} was not subscribed")
+        await ws.send_json({"topic": topic, "data": data})
+
+    return await local_api(app, state=state, push=push)
+
+
+def _recorder(fleet):
+    changes = asyncio.Queue()
+    fleet.add_listener(changes.put_nowait)
+
+    async def next_change():
+        return await asyncio.wait_for(changes.get(), 2)
+
+    return next_change
+
+
+@pytest.mark.asyncio
+async def test_fleet_state_follows_events(manager, make_client):
+    """Events are applied without fetching; stateless ones trigger one fetch."""
+    client = make_client(manager)
+    config = FleetStateConfig(reconcile_interval=None, refresh_delay=0.05)
+    async with FleetState(client, config) as fleet:
+        next_change = _recorder(fleet)
+        assert fleet.status("s1") == "RUNNING" and len(fleet) == 2
+        assert sorted(fleet) == ["s1", "s2"]
+
+        await manager.push(
+            "event:after_server_stop",
+            server_name="s1",
+            result={"status": "success"},
+        )
+        change = await next_change()
+        assert (change.name, change.source) == ("s1", "event")
+        assert change.previous["status"] == "RUNNING"
+        assert fleet["s1"] == {"name": "s1", "status": "STOPPED", "version": "1.0"}
+
+        await manager.push("event:after_delete_server_data", server_name="s2")
+        change = await next_change()
+        assert change.removed and "s2" not in fleet
+        assert manager.state["fetches"] == 1
+
+        # after_server_updated carries no version: a burst costs one fetch.
+        manager.state["servers"] = [
+            {"name": "s1", "status": "STOPPED", "version": "2.0"}
+        ]
+        for _ in range(5):
+            await manager.push("event:after_server_updated", server_name="s1")
+        change = await next_change()
+        assert (change.source, change.current["version"]) == ("fetch", "2.0")
+        await asyncio.sleep(0.1)
+        assert manager.state["fetches"] == 2
+
+        stats = fleet.stats()
+        assert stats.live and stats.servers == 1
+        assert stats.events == 7 and stats.corrections == 0
+    assert not fleet.stats().live
+    assert fleet.get("s1")["version"] == "2.0"
+
+
+@pytest.mark.asyncio
+async def test_fleet_state_reconciles_drift(manager, make_client):
+    """Changes the events missed are found by periodic reconciliation."""
+    client = make_client(manager)
+    config = FleetStateConfig(reconcile_interval=0.05)
+    async with FleetState(client, config) as fleet:
+        next_change = _recorder(fleet)
+        manager.state["servers"].append({"name": "s3", "status": "STOPPED"})
+        change = await next_change()
+        assert change.added and change.source == "fetch"
+        assert fleet.status("s3") == "STOPPED"
+        assert fleet.stats().corrections == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_does_not_undo_newer_events(manager, make_client):
+    """A fetch that was in flight when an event arrived keeps the event's state."""
+    client = make_client(manager)
+    config = FleetStateConfig(reconcile_interval=None)
+    async with FleetState(client, config) as fleet:
+        next_change = _recorder(fleet)
+        manager.state["delay"] = 0.2
+        manager.state["servers"][1]["version"] = "1.1"
+        reconcile = asyncio.create_task(fleet.reconcile())
+        await asyncio.sleep(0.05)
+        await manager.push("event:after_server_start", server_name="s2")
+        assert (await next_change()).current["status"] == "RUNNING"
+
+        changes = await reconcile
+        assert changes == []
+        assert fleet["s2"] == {"name": "s2", "status": "RUNNING", "version": "1.0"}
+
+
+def test_server_state_from_event():
+    servers = [{"name": "s1", "status": "RUNNING"}]
+    assert server_state_from_event(
+        {"topic": "event:after_server_statuses_updated", "data": {"servers": servers}}
+    ) == ServerStateUpdate(servers=tuple(servers), complete=True)
+    assert server_state_from_event(
+        {"topic": "event:x", "data": {"server_name": "s1", "status": "STARTING"}}
+    ) == ServerStateUpdate(servers=({"name": "s1", "status": "STARTING"},))
+    # Failed actions and events without state require a fetch.
+    assert (
+        server_state_from_event(
+            {
+                "topic": "event:after_server_start",
+                "data": {"server_name": "s1", "result": {"status": "error"}},
+            }
+        )
+        is None
+    )
+    assert server_state_from_event({"topic": "event:after_server_start"}) is None
+    with pytest.raises(ValueError):
+        FleetStateConfig(reconcile_interval=0)
+    with pytest.raises(ValueError):
+        FleetStateConfig(topics=())
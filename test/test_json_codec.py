@@ -0,0 +1,95 @@
+import json
+import pytest
+import pytest_asyncio
+from unittest.mock import MagicMock, AsyncMock
+import aiohttp
+from aiohttp import web
+from bsm_api_client.exceptions import InvalidInputError
+from bsm_api_client.json_codec import (
+    JsonCodec,
+    STDLIB_CODEC,
+    ORJSON_CODEC,
+    resolve_json_codec,
+)
+from bsm_api_client.websocket_client import WebSocketClient
+
+
+@pytest_asyncio.fixture
+async def api_server(local_api):
+    """Starts a local aiohttp server with a JSON, an error and an echo route."""
+
+    async def servers(request):
+        return web.json_response({"status": "success", "servers": [{"name": "s1"}]})
+
+    async def bad_request(request):
+        return web.json_response({"detail": "bad things"}, status=400)
+
+    async def echo(request):
+        return web.Response(body=await request.read(), content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/api/servers", servers)
+    app.router.add_get("/api/bad", bad_request)
+    app.router.add_post("/api/echo", echo)
+    return await local_api(app)
+
+
+def test_resolve_json_codec():
+    """Codec names, instances and callables resolve as documented."""
+    assert resolve_json_codec("json") is STDLIB_CODEC
+    assert resolve_json_codec("auto") is (ORJSON_CODEC or STDLIB_CODEC)
+    custom = JsonCodec(name="mine", loads=json.loads)
+    assert resolve_json_codec(custom) is custom
+    assert resolve_json_codec(json.loads).loads is json.loads
+    with pytest.raises(ValueError):
+        resolve_json_codec("yaml")
+
+
+@pytest.mark.asyncio
+async def test_custom_codec_decodes_each_body_once(api_server, make_client):
+    """Successful and error responses are decoded exactly once from bytes."""
+    calls = []
+
+    def loads(raw):
+        calls.append(raw)
+        return json.loads(raw)
+
+    client = make_client(api_server, json_codec=loads)
+    result = await client._request("GET", "/servers")
+    assert result["servers"] == [{"name": "s1"}]
+    assert len(calls) == 1 and isinstance(calls[0], bytes)
+
+    with pytest.raises(InvalidInputError, match="bad things"):
+        await client._request("GET", "/bad")
+    assert len(calls) == 2
+
+    echoed = await client._request("POST", "/echo", json_data={"a": 1})
+    assert echoed == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_websocket_listen_uses_codec_and_skips_invalid():
+    """WebSocket frames are decoded by the codec and invalid frames skipped."""
+    ws = AsyncMock(spec=aiohttp.ClientWebSocketResponse)
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    session.ws_connect = AsyncMock(return_value=ws)
+
+    bad = MagicMock(type=aiohttp.WSMsgType.TEXT, data="not json")
+    good = MagicMock(type=aiohttp.WSMsgType.BINARY, data=b'{"event": "ok"}')
+    closed = MagicMock(type=aiohttp.WSMsgType.CLOSED)
+
+    async def msg_iter():
+        for msg in (bad, good, closed):
+            yield msg
+
+    ws.__aiter__.side_effect = msg_iter
+    loads = MagicMock(side_effect=json.loads)
+
+    client = WebSocketClient(
+        session, "ws://url", json_codec=JsonCodec(name="spy", loads=loads)
+    )
+    await client.connect()
+    received = [msg async for msg in client.listen()]
+
+    assert received == [{"event": "ok"}]
+    assert loads.call_count == 2
@@ -0,0 +1,103 @@
+import json
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from bsm_api_client.exceptions import ServerNotFoundError
+from bsm_api_client.metrics import ClientMetrics, MetricsConfig
+from bsm_api_client.models import CommandPayload
+
+STATUS = {"status": "success", "data": {"running": True}}
+
+
+@pytest_asyncio.fixture
+async def api_server(local_api):
+    """Starts a local server with status, command and panorama endpoints."""
+
+    async def status(request):
+        if request.match_info["name"] == "ghost":
+            return web.json_response({"detail": "Server not found"}, status=404)
+        return web.json_response(STATUS)
+
+    async def command(request):
+        await request.read()
+        return web.json_response({"status": "success", "message": "sent"})
+
+    async def panorama(request):
+        return web.Response(body=b"p" * 50_000, content_type="image/jpeg")
+
+    app = web.Application()
+    app.router.add_get("/api/server/{name}/status", status)
+    app.router.add_post("/api/server/{name}/send_command", command)
+    app.router.add_get("/api/panorama", panorama)
+    return await local_api(app)
+
+
+@pytest.mark.asyncio
+async def test_metrics_grouped_by_endpoint_template(api_server, make_client):
+    """Requests are grouped by template with counts, errors and latency."""
+    client = make_client(api_server)
+    await client.async_get_server_running_status("s1")
+    await client.async_get_server_running_status("s2")
+    with pytest.raises(ServerNotFoundError):
+        await client.async_get_server_running_status("ghost")
+
+    snapshot = client.metrics.snapshot()
+    status = snapshot.get("GET", "/server/{name}/status")
+    assert status.count == 3
+    assert status.errors == {"ServerNotFoundError": 1}
+    assert status.error_count == 1
+    assert status.latency_buckets[-1] == (float("inf"), 3)
+    assert status.latency_sum > 0
+    assert 0 < status.average_latency <= status.latency_quantile(1.0)
+    assert status.bytes_received >= 2 * len(json.dumps(STATUS))
+    # Only the first request had to open a connection.
+    assert status.connection_wait > 0
+    assert list(snapshot.endpoints) == [("GET", "/server/{name}/status")]
+
+
+@pytest.mark.asyncio
+async def test_metrics_bytes_in_and_out(api_server, make_client):
+    """Request bodies and streamed downloads are counted."""
+    client = make_client(api_server)
+    await client.async_send_server_command("s1", CommandPayload(command="list"))
+    await client.async_get_panorama_image()
+
+    snapshot = client.metrics.snapshot()
+    command = snapshot.get("POST", "/server/{name}/send_command")
+    assert command.bytes_sent == len(client._json_codec.dumps({"command": "list"}))
+    assert command.errors == {}
+    panorama = snapshot.get("GET", "/panorama")
+    assert panorama.bytes_received == 50_000
+    slowest = snapshot.slowest()
+    assert len(slowest) == 2
+    assert slowest[0].latency_sum >= slowest[1].latency_sum
+
+    client.metrics.reset()
+    assert client.metrics.snapshot().endpoints == {}
+
+
+@pytest.mark.asyncio
+async def test_metrics_disabled(api_server, make_client):
+    """metrics=False records nothing and installs no trace hooks."""
+    client = make_client(api_server, metrics=False)
+    await client.async_get_server_running_status("s1")
+    assert client.metrics.snapshot().endpoints == {}
+    assert len(client._session.trace_configs) == 1
+
+
+def test_endpoint_templates():
+    """Path parameters are replaced while fixed segments are kept."""
+    metrics = ClientMetrics()
+    assert metrics.endpoint_for("/server/my%20srv/world/icon") == (
+        "/server/{name}/world/icon"
+    )
+    assert metrics.endpoint_for("/server/install") == "/server/install"
+    assert metrics.endpoint_for("/server/s1/backup/list/world") == (
+        "/server/{name}/backup/list/{backup_type}"
+    )
+    assert metrics.endpoint_for("/plugins/reload") == "/plugins/reload"
+    assert metrics.endpoint_for("/plugins/my_plugin") == "/plugins/{plugin_name}"
+    assert metrics.endpoint_for("/tasks/status/abc?x=1") == "/tasks/status/{task_id}"
+    assert metrics.endpoint_for("/servers") == "/servers"
+    with pytest.raises(ValueError):
+        MetricsConfig(latency_buckets=(1.0, 0.5))
@@ -0,0 +1,97 @@
+import asyncio
+import time
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from bsm_api_client.rate_limit import RequestLimiter
+
+
+@pytest_asyncio.fixture
+async def api_server(local_api):
+    """Starts a local aiohttp server that records its peak concurrency."""
+    state = {"active": 0, "peak": 0, "hits": 0}
+
+    async def servers(request):
+        state["hits"] += 1
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            state["active"] -= 1
+        return web.json_response({"status": "success", "servers": []})
+
+    app = web.Application()
+    app.router.add_get("/api/servers", servers)
+    return await local_api(app, state=state)
+
+
+@pytest.mark.asyncio
+async def test_max_in_flight_queues_excess_requests(api_server, make_client):
+    """No more than max_in_flight requests reach the server at once."""
+    client = make_client(api_server, max_in_flight=2)
+    await asyncio.gather(*(client.async_get_servers() for _ in range(6)))
+    assert api_server.state["hits"] == 6
+    assert api_server.state["peak"] == 2
+
+    stats = client.limiter_stats()
+    assert stats.acquired == 6
+    assert stats.delayed == 4
+    assert stats.max_wait >= 0.04
+    assert (stats.in_flight, stats.waiting) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_limits_adjustable_at_runtime(api_server, make_client):
+    """Raising the limit admits queued requests without waiting for a release."""
+    client = make_client(api_server, max_in_flight=1)
+    tasks = [asyncio.create_task(client.async_get_servers()) for _ in range(4)]
+    await asyncio.sleep(0.01)
+    assert client.limiter_stats().waiting == 3
+
+    client.set_request_limits(max_in_flight=None)
+    await asyncio.sleep(0.01)
+    assert client.limiter_stats().waiting == 0
+    await asyncio.gather(*tasks)
+    assert api_server.state["peak"] == 4
+
+    with pytest.raises(ValueError):
+        client.set_request_limits(requests_per_second=0)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_requests():
+    """After the burst is spent, acquisitions are spaced by 1 / rate."""
+    limiter = RequestLimiter(requests_per_second=50, burst=2)
+    started = time.monotonic()
+    for _ in range(5):
+        async with limiter.slot():
+            pass
+    elapsed = time.monotonic() - started
+    # 2 immediate + 3 paced at 20ms each.
+    assert elapsed >= 0.05
+    assert limiter.stats().delayed >= 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_releases_its_place():
+    """Cancelling a queued request does not leak a slot."""
+    limiter = RequestLimiter(max_in_flight=1)
+    release = asyncio.Event()
+
+    async def hold():
+        async with limiter.slot():
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    assert limiter.stats().waiting == 1
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    release.set()
+    await holder
+    stats = limiter.stats()
+    assert (stats.in_flight, stats.waiting) == (0, 0)
@@ -0,0 +1,136 @@
+import pytest
+import pytest_asyncio
+from unittest.mock import patch
+from aiohttp import web
+from bsm_api_client.models import PropertiesPayload
+from bsm_api_client.response_cache import ResponseCache, ResponseCacheConfig
+
+
+@pytest_asyncio.fixture
+async def api_server(local_api):
+    """Starts a local aiohttp server exposing server list and properties routes."""
+    state = {"hits": {}, "level-name": "world", "worlds": []}
+
+    def count(name):
+        state["hits"][name] = state["hits"].get(name, 0) + 1
+
+    async def servers(request):
+        count("servers")
+        return web.json_response({"status": "success", "servers": []})
+
+    async def get_properties(request):
+        count("properties")
+        return web.json_response(
+            {"status": "success", "data": {"level-name": state["level-name"]}}
+        )
+
+    async def set_properties(request):
+        body = await request.json()
+        state["level-name"] = body["properties"]["level-name"]
+        return web.json_response({"status": "success", "message": "ok"})
+
+    async def status(request):
+        count("status")
+        return web.json_response({"status": "success", "data": {"running": True}})
+
+    async def worlds(request):
+        count("worlds")
+        return web.json_response({"status": "success", "files": state["worlds"]})
+
+    async def export_world(request):
+        state["worlds"].append(f"{request.match_info['name']}.mcworld")
+        return web.json_response({"status": "success", "message": "ok"})
+
+    app = web.Application()
+    app.router.add_get("/api/servers", servers)
+    app.router.add_get("/api/server/{name}/properties/get", get_properties)
+    app.router.add_post("/api/server/{name}/properties/set", set_properties)
+    app.router.add_get("/api/server/{name}/status", status)
+    app.router.add_get("/api/content/worlds", worlds)
+    app.router.add_post("/api/server/{name}/world/export", export_world)
+    return await local_api(app, state=state)
+
+
+@pytest.mark.asyncio
+async def test_cached_endpoints_hit_api_once(api_server, make_client):
+    """Configured read endpoints are served from cache within their TTL."""
+    client = make_client(api_server, response_cache=True)
+    for _ in range(3):
+        await client.async_get_servers()
+        await client.async_get_server_running_status("s1")
+    assert api_server.state["hits"]["servers"] == 1
+    # /server/{name}/status is not a cached endpoint.
+    assert api_server.state["hits"]["status"] == 3
+    stats = client.cache_stats()
+    assert stats.hits == 2
+    assert stats.size == 1
+
+
+@pytest.mark.asyncio
+async def test_update_properties_evicts_server_entry(api_server, make_client):
+    """A properties update evicts that server's cached properties."""
+    client = make_client(api_server, response_cache=True)
+    first = await client.async_get_server_properties("s1")
+    await client.async_get_server_properties("s2")
+    assert first.data["level-name"] == "world"
+
+    await client.async_update_server_properties(
+        "s1", PropertiesPayload(properties={"level-name": "new"})
+    )
+    second = await client.async_get_server_properties("s1")
+    await client.async_get_server_properties("s2")
+
+    assert second.data["level-name"] == "new"
+    assert api_server.state["hits"]["properties"] == 3
+
+
+@pytest.mark.asyncio
+async def test_world_export_evicts_content_lists(api_server, make_client):
+    """A world export shows up in the next world listing."""
+    client = make_client(api_server, response_cache=True)
+    assert (await client.async_get_content_worlds()).files == []
+    await client.async_export_server_world("s1")
+    assert (await client.async_get_content_worlds()).files == ["s1.mcworld"]
+    assert api_server.state["hits"]["worlds"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_by_default(api_server, make_client):
+    """Without response_cache every call reaches the API."""
+    client = make_client(api_server)
+    await client.async_get_servers()
+    await client.async_get_servers()
+    assert api_server.state["hits"]["servers"] == 2
+    assert client.cache_stats() is None
+    assert client.invalidate_cache() == 0
+
+
+def test_ttl_expiry_and_lru_bound():
+    """Entries expire after their TTL and the LRU bound is enforced."""
+    cache = ResponseCache(
+        ResponseCacheConfig(
+            endpoint_ttls={"/server/{name}/properties/get": 10}, max_entries=2
+        )
+    )
+    assert cache.ttl_for("/server/my%20server/properties/get") == 10
+    assert cache.ttl_for("/servers") is None
+
+    keys = [ResponseCache.make_key(f"/server/s{i}/properties/get") for i in range(3)]
+    with patch("bsm_api_client.response_cache.time.monotonic", return_value=100.0):
+        for i, key in enumerate(keys):
+            cache.set(key, i, 10, cache.generation)
+        assert cache.get(keys[0]) == (False, None)
+        assert cache.get(keys[2]) == (True, 2)
+    with patch("bsm_api_client.response_cache.time.monotonic", return_value=111.0):
+        assert cache.get(keys[2]) == (False, None)
+    assert cache.stats().evictions == 1
+
+
+def test_response_fetched_before_mutation_is_not_stored():
+    """A GET that raced a mutation does not repopulate the cache."""
+    cache = ResponseCache()
+    key = ResponseCache.make_key("/servers")
+    generation = cache.generation
+    cache.invalidate_for_mutation("/server/s1/start")
+    cache.set(key, {"servers": []}, 5, generation)
+    assert cache.get(key) == (False, None)
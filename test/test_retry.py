@@ -0,0 +1,169 @@
+import asyncio
+import time
+import pytest
+import pytest_asyncio
+from unittest.mock import patch
+import aiohttp
+from aiohttp import web
+from bsm_api_client.exceptions import (
+    APIServerSideError,
+    CannotConnectError,
+    InvalidInputError,
+)
+from bsm_api_client.retry import RetryPolicy
+from bsm_api_client.timeouts import FAST_READ, TimeoutConfig, TimeoutProfile
+
+FAST_POLICY = RetryPolicy(max_attempts=3, backoff_base=0.001, backoff_max=0.001)
+
+
+@pytest_asyncio.fixture
+async def api_server(local_api):
+    """Starts a local aiohttp server that fails with 503 a configurable number of times."""
+    state = {"failures": 2, "hits": 0}
+
+    async def flaky(request):
+        state["hits"] += 1
+        if state["failures"] > 0:
+            state["failures"] -= 1
+            return web.json_response({"detail": "unavailable"}, status=503)
+        return web.json_response({"status": "success", "message": "ok"})
+
+    async def stalled(request):
+        state["hits"] += 1
+        await asyncio.sleep(5)
+        return web.json_response({"status": "success", "data": {"running": True}})
+
+    async def export(request):
+        state["hits"] += 1
+        await asyncio.sleep(0.5)
+        return web.json_response({"status": "success", "message": "exported"})
+
+    async def bad_request(request):
+        state["hits"] += 1
+        return web.json_response({"detail": "nope"}, status=400)
+
+    app = web.Application()
+    app.router.add_get("/api/servers", flaky)
+    app.router.add_post("/api/server/{name}/start", flaky)
+    app.router.add_get("/api/bad", bad_request)
+    app.router.add_get("/api/server/{name}/status", stalled)
+    app.router.add_post("/api/server/{name}/world/export", export)
+    return await local_api(app, state=state)
+
+
+@pytest.mark.asyncio
+async def test_get_is_retried_until_success(api_server, make_client):
+    """Idempotent GETs are retried on 503 until they succeed."""
+    client = make_client(api_server, retry_policy=FAST_POLICY)
+    result = await client.async_get_servers()
+    assert result.status == "success"
+    assert api_server.state["hits"] == 3
+    stats = client.retry_stats()
+    assert (stats.retries, stats.recovered, stats.exhausted) == (2, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_post_requires_opt_in(api_server, make_client):
+    """POST actions are only retried inside retry_actions()."""
+    client = make_client(api_server, retry_policy=FAST_POLICY)
+    with pytest.raises(APIServerSideError):
+        await client.async_start_server("s1")
+    assert api_server.state["hits"] == 1
+
+    with client.retry_actions():
+        result = await client.async_start_server("s1")
+    assert result.status == "success"
+    assert api_server.state["hits"] == 3
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_errors_and_exhaustion(api_server, make_client):
+    """Client errors are not retried and retries stop at max_attempts."""
+    api_server.state["failures"] = 10
+    client = make_client(api_server, retry_policy=FAST_POLICY)
+    with pytest.raises(InvalidInputError):
+        await client._request("GET", "/bad")
+    assert api_server.state["hits"] == 1
+
+    with pytest.raises(APIServerSideError):
+        await client.async_get_servers()
+    assert api_server.state["hits"] == 4
+    assert client.retry_stats().exhausted == 1
+
+
+@pytest.mark.asyncio
+async def test_connection_errors_respect_deadline(make_client):
+    """Connection failures are retried but give up once the deadline is reached."""
+    policy = RetryPolicy(max_attempts=10, backoff_base=5, total_deadline=1)
+    client = make_client(
+        "http://127.0.0.1:9",
+        retry_policy=policy,
+        timeouts=TimeoutConfig(profiles={FAST_READ: TimeoutProfile(total=1)}),
+    )
+    started = time.monotonic()
+    with patch("bsm_api_client.retry.random.uniform", return_value=0.6):
+        with patch(
+            "bsm_api_client.retry.asyncio.sleep", wraps=asyncio.sleep
+        ) as mock_sleep:
+            with pytest.raises(CannotConnectError):
+                await client.async_get_servers()
+    assert time.monotonic() - started < 1.0
+    # One retry fits in the 1s deadline, the second would exceed it.
+    assert mock_sleep.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_bounds_a_stalled_attempt(api_server, make_client):
+    """A retry still running at the deadline is cancelled."""
+    policy = RetryPolicy(backoff_base=0.001, total_deadline=0.3)
+    client = make_client(
+        api_server,
+        retry_policy=policy,
+        timeouts=TimeoutConfig(profiles={FAST_READ: TimeoutProfile(total=0.2)}),
+    )
+    started = time.monotonic()
+    with pytest.raises(CannotConnectError) as exc_info:
+        await client.async_get_server_running_status("s1")
+    assert time.monotonic() - started < 1.0
+    assert isinstance(exc_info.value.original_exception, TimeoutError)
+    assert api_server.state["hits"] == 2
+    assert client.retry_stats().exhausted == 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_spares_long_running_and_queued_requests(
+    api_server, make_client
+):
+    """The deadline covers at least the request's profile, and not limiter waits."""
+    api_server.state["failures"] = 0
+    client = make_client(
+        api_server,
+        retry_policy=RetryPolicy(total_deadline=0.2),
+        max_in_flight=1,
+        timeouts=TimeoutConfig(profiles={FAST_READ: TimeoutProfile(total=0.2)}),
+    )
+    with client.retry_actions():
+        # A LONG_RUNNING export outlives the deadline and holds the only slot.
+        export = asyncio.create_task(client.async_export_server_world("s1"))
+        await asyncio.sleep(0.05)
+        servers = await client.async_get_servers()
+        result = await export
+    assert result.status == "success"
+    assert servers.status == "success"
+    assert client.retry_stats().exhausted == 0
+
+
+def test_policy_classification():
+    """Timeouts, connection errors and retryable statuses are recognised."""
+    policy = RetryPolicy(retry_on_timeout=False)
+    timeout = CannotConnectError("timeout", original_exception=asyncio.TimeoutError())
+    refused = CannotConnectError(
+        "refused", original_exception=aiohttp.ClientConnectionError()
+    )
+    assert not policy.is_retryable(timeout)
+    assert policy.is_retryable(refused)
+    assert policy.is_retryable(APIServerSideError("bad gateway", status_code=502))
+    assert not policy.is_retryable(APIServerSideError("boom", status_code=500))
+    assert 0 <= policy.backoff(10) <= policy.backoff_max
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
@@ -1,4 +1,5 @@
 # tests/test_server_info_methods.py
+import asyncio
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, patch
@@ -157,3 +158,83 @@ async def test_get_server_allowlist(client):
             "GET", "/server/test-server/allowlist/get", authenticated=True
         )
         assert result.players == []
+
+
+def _fake_request(state, delays=None, fail=None):
+    """Builds a `_request` stand-in that tracks concurrency and can fail."""
+
+    async def request(method, path, **kwargs):
+        _, _, name, endpoint = path.split("/")
+        state["active"] += 1
+        state["max_active"] = max(state["max_active"], state["active"])
+        try:
+            await asyncio.sleep((delays or {}).get(name, 0.01))
+        finally:
+            state["active"] -= 1
+        if fail and (name, endpoint) in fail:
+            raise ServerNotFoundError(f"{name} not found")
+        return {"status": "success", "data": {endpoint: name}}
+
+    return request
+
+
+@pytest.mark.asyncio
+async def test_get_servers_overview(client):
+    """Test async_get_servers_overview fetches every field with a concurrency cap."""
+    state = {"active": 0, "max_active": 0}
+    names = [f"s{i}" for i in range(10)]
+    request = _fake_request(state, fail={("s3", "process_info")})
+    with patch.object(client, "_request", side_effect=request) as mock_request:
+        result = await client.async_get_servers_overview(names, max_concurrency=5)
+
+    assert list(result) == names
+    assert mock_request.call_count == 40
+    assert state["max_active"] == 5
+    assert result["s1"].ok
+    assert result["s1"].status.data == {"status": "s1"}
+    assert result["s1"].config_status.data == {"config_status": "s1"}
+    assert result["s1"].version.data == {"version": "s1"}
+    assert result["s1"].process_info.data == {"process_info": "s1"}
+    assert not result["s3"].ok
+    assert result["s3"].process_info is None
+    assert isinstance(result["s3"].errors["process_info"], ServerNotFoundError)
+    assert result["s3"].version is not None
+
+
+@pytest.mark.asyncio
+async def test_iter_servers_overview(client):
+    """Test async_iter_servers_overview yields in completion order for selected fields."""
+    state = {"active": 0, "max_active": 0}
+    request = _fake_request(state, delays={"slow": 0.1})
+    with (
+        patch.object(client, "_request", side_effect=request) as mock_request,
+        patch.object(
+            client, "async_get_server_names", new_callable=AsyncMock
+        ) as mock_names,
+    ):
+        mock_names.return_value = ["slow", "fast"]
+        results = [
+            overview
+            async for overview in client.async_iter_servers_overview(
+                include=["status", "version"]
+            )
+        ]
+
+    assert [o.name for o in results] == ["fast", "slow"]
+    assert mock_request.call_count == 4
+    assert results[0].process_info is None and results[0].ok
+
+    # Collected overviews keep the manager's order, not completion order.
+    with (
+        patch.object(client, "_request", side_effect=request),
+        patch.object(
+            client, "async_get_server_names", new_callable=AsyncMock
+        ) as mock_names,
+    ):
+        mock_names.return_value = ["slow", "fast", "alpha"]
+        result = await client.async_get_servers_overview(include=["status"])
+    assert list(result) == ["slow", "fast", "alpha"]
+    mock_names.assert_awaited_once()
+
+    with pytest.raises(ValueError):
+        await client.async_get_servers_overview(["s1"], include=["players"])
@@ -0,0 +1,90 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from bsm_api_client.exceptions import APIServerSideError
+from bsm_api_client.single_flight import SingleFlight
+
+
+@pytest_asyncio.fixture
+async def api_server(local_api):
+    """Starts a local aiohttp server with slow GET routes that count hits."""
+    hits = {"servers": 0, "broken": 0}
+
+    async def servers(request):
+        hits["servers"] += 1
+        await asyncio.sleep(0.05)
+        return web.json_response({"status": "success", "servers": []})
+
+    async def broken(request):
+        hits["broken"] += 1
+        await asyncio.sleep(0.05)
+        return web.json_response({"detail": "boom"}, status=500)
+
+    app = web.Application()
+    app.router.add_get("/api/servers", servers)
+    app.router.add_get("/api/broken", broken)
+    return await local_api(app, hits=hits)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_are_coalesced(api_server, make_client):
+    """Identical concurrent GETs send one HTTP request."""
+    client = make_client(api_server, coalesce_requests=True)
+    results = await asyncio.gather(*(client.async_get_servers() for _ in range(5)))
+    assert all(r.status == "success" for r in results)
+    assert api_server.hits["servers"] == 1
+    stats = client.coalesce_stats()
+    assert stats.executed == 1
+    assert stats.deduplicated == 4
+    assert stats.in_flight == 0
+
+    # Sequential calls are not coalesced.
+    await client.async_get_servers()
+    assert api_server.hits["servers"] == 2
+
+
+@pytest.mark.asyncio
+async def test_coalescing_is_opt_in(api_server, make_client):
+    """Without coalesce_requests every call sends its own request."""
+    client = make_client(api_server)
+    await asyncio.gather(*(client.async_get_servers() for _ in range(3)))
+    assert api_server.hits["servers"] == 3
+    assert client.coalesce_stats().deduplicated == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_by_all_callers(api_server, make_client):
+    """Every joined caller receives the leader's exception."""
+    client = make_client(api_server, coalesce_requests=True)
+    results = await asyncio.gather(
+        *(client._request("GET", "/broken") for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, APIServerSideError) for r in results)
+    assert api_server.hits["broken"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_caller_does_not_cancel_others():
+    """A cancelled follower or leader leaves the shared call running."""
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        return "done"
+
+    key = SingleFlight.make_key("GET", "/servers", {"b": 2, "a": 1})
+    assert key == SingleFlight.make_key("get", "/servers", {"a": 1, "b": 2})
+
+    leader = asyncio.create_task(flight.do(key, work))
+    follower = asyncio.create_task(flight.do(key, work))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await follower == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
@@ -0,0 +1,99 @@
+import asyncio
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from aiohttp import web
+from bsm_api_client.api_client import BedrockServerManagerApi
+from bsm_api_client.exceptions import ServerNotFoundError
+from bsm_api_client.sync_client import SyncBedrockServerManagerApi
+
+
+@pytest.fixture
+def api_server():
+    """Runs a fake manager on its own event loop in a background thread."""
+    state = {"logins": 0, "requests": 0, "peers": set()}
+
+    async def login(request):
+        state["logins"] += 1
+        return web.json_response({"access_token": "token", "token_type": "bearer"})
+
+    async def servers(request):
+        state["requests"] += 1
+        state["peers"].add(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(0.01)
+        return web.json_response(
+            {"status": "success", "servers": [{"name": "s1", "status": "RUNNING"}]}
+        )
+
+    async def status(request):
+        if request.match_info["name"] == "ghost":
+            return web.json_response({"detail": "Server not found"}, status=404)
+        return web.json_response({"status": "success", "data": {"running": True}})
+
+    app = web.Application()
+    app.router.add_post("/auth/token", login)
+    app.router.add_get("/api/servers", servers)
+    app.router.add_get("/api/server/{name}/status", status)
+
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    loop.run_until_complete(site.start())
+    port = site._server.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{port}", state
+    asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def test_blocking_methods_generated_for_every_async_method():
+    """Each async_* client method has a blocking counterpart."""
+    for name, func in inspect.getmembers(BedrockServerManagerApi):
+        if name.startswith("async_") and inspect.iscoroutinefunction(func):
+            method = getattr(SyncBedrockServerManagerApi, name[len("async_") :])
+            assert method.__doc__.startswith(f"Blocking version of `{name}`.")
+    assert inspect.signature(SyncBedrockServerManagerApi.get_server_version) == (
+        inspect.signature(BedrockServerManagerApi.async_get_server_version)
+    )
+
+
+def test_session_and_token_reused_across_threads(api_server):
+    """Concurrent calls from many threads share one login and connection pool."""
+    url, state = api_server
+    with SyncBedrockServerManagerApi(url, "admin", "pw") as client:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: client.get_servers(), range(32)))
+        assert all(r.servers == [{"name": "s1", "status": "RUNNING"}] for r in results)
+        assert client.get_server_running_status("s1").data == {"running": True}
+        with pytest.raises(ServerNotFoundError):
+            client.get_server_running_status("ghost")
+        overviews = list(client.iter_servers_overview(["s1"], include=["status"]))
+        assert [o.name for o in overviews] == ["s1"]
+
+        pooled = len(state["peers"])
+        client.get_servers()
+        assert len(state["peers"]) == pooled
+
+    assert state["logins"] == 1
+    assert state["requests"] == 33
+    # At most one connection per worker thread's concurrent request.
+    assert pooled <= 8
+    assert client.closed
+    with pytest.raises(RuntimeError):
+        client.get_servers()
+    client.close()
+
+
+def test_invalid_arguments_stop_the_loop():
+    """Constructor errors propagate and do not leak the loop thread."""
+    threads = threading.active_count()
+    with pytest.raises(ValueError):
+        SyncBedrockServerManagerApi("not a url", "admin", "pw")
+    with pytest.raises(ValueError):
+        SyncBedrockServerManagerApi("http://localhost", "admin", "pw", session=object())
+    assert threading.active_count() == threads
@@ -0,0 +1,100 @@
+import asyncio
+import time
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from bsm_api_client.exceptions import CannotConnectError
+from bsm_api_client.timeouts import (
+    ACTION,
+    FAST_READ,
+    LONG_RUNNING,
+    TimeoutConfig,
+    TimeoutProfile,
+)
+
+QUICK = TimeoutConfig(
+    profiles={
+        FAST_READ: TimeoutProfile(connect=1, sock_read=0.1, total=5),
+        ACTION: TimeoutProfile(connect=1, sock_read=0.1, total=5),
+    }
+)
+
+
+@pytest_asyncio.fixture
+async def api_server(local_api):
+    """Starts a local aiohttp server whose handlers stall for 0.3s."""
+
+    async def slow(request):
+        await asyncio.sleep(0.3)
+        return web.json_response({"status": "success", "message": "ok"})
+
+    app = web.Application()
+    app.router.add_get("/api/server/{name}/status", slow)
+    app.router.add_post("/api/server/{name}/world/export", slow)
+    return await local_api(app)
+
+
+@pytest.mark.asyncio
+async def test_fast_read_fails_quickly_and_long_running_is_unaffected(
+    api_server, make_client
+):
+    """A stalled status read times out; a slow export uses its longer budget."""
+    client = make_client(api_server, timeouts=QUICK)
+    started = time.monotonic()
+    with pytest.raises(CannotConnectError) as exc_info:
+        await client.async_get_server_running_status("s1")
+    assert isinstance(exc_info.value.original_exception, asyncio.TimeoutError)
+    assert time.monotonic() - started < 0.3
+
+    result = await client.async_export_server_world("s1")
+    assert result.status == "success"
+
+
+@pytest.mark.asyncio
+async def test_timeout_override(api_server, make_client):
+    """timeout_override() replaces the endpoint profile for the block only."""
+    client = make_client(api_server, timeouts=QUICK)
+    with client.timeout_override(LONG_RUNNING):
+        result = await client.async_get_server_running_status("s1")
+    assert result.status == "success"
+
+    with client.timeout_override(TimeoutProfile(sock_read=0.05)):
+        with pytest.raises(CannotConnectError):
+            await client.async_export_server_world("s1")
+
+    with pytest.raises(ValueError):
+        with client.timeout_override("glacial"):
+            pass
+
+
+def test_endpoint_profile_table():
+    """Endpoints map to sensible default profiles and the table is validated."""
+    config = TimeoutConfig()
+    assert config.profile_name_for("GET", "/server/s1/status") == FAST_READ
+    assert config.profile_name_for("post", "/server/s1/start") == ACTION
+    assert config.profile_name_for("POST", "/server/s1/world/export") == LONG_RUNNING
+    assert config.profile_name_for("POST", "/server/install") == LONG_RUNNING
+    assert config.profile_name_for("DELETE", "/server/s1/delete") == LONG_RUNNING
+    assert config.profiles[FAST_READ].client_timeout().sock_connect == 5.0
+    with pytest.raises(ValueError):
+        TimeoutConfig(endpoint_profiles=(("GET", "*", "glacial"),))
+
+
+@pytest.mark.asyncio
+async def test_explicit_request_timeout_applies_to_ordinary_requests(
+    api_server, make_client
+):
+    """An explicit request_timeout still bounds ordinary reads and actions."""
+    client = make_client(api_server, request_timeout=0.1)
+    with pytest.raises(CannotConnectError):
+        await client.async_get_server_running_status("s1")
+
+    client = make_client(api_server, request_timeout=300)
+    read = client._timeout_for("GET", "/servers")
+    assert (read.total, read.sock_read) == (300, None)
+    assert client._timeout_for("POST", "/server/s1/start").total == 300
+    assert client._timeout_for("POST", "/server/s1/world/export").total == 1800
+
+    # Profiles customised in `timeouts` win over request_timeout.
+    client = make_client(api_server, request_timeout=300, timeouts=QUICK)
+    assert client._timeout_for("GET", "/servers").total == 5
@@ -0,0 +1,142 @@
+import asyncio
+import base64
+import json
+import time
+import pytest
+import pytest_asyncio
+from unittest.mock import patch
+from aiohttp import web
+from bsm_api_client.token_refresh import (
+    TokenRefreshConfig,
+    decode_jwt_claims,
+    refresh_delay,
+    token_expires_at,
+)
+
+
+def _b64(data):
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+
+def make_jwt(**claims):
+    return f"{_b64({'alg': 'HS256', 'typ': 'JWT'})}.{_b64(claims)}.signature"
+
+
+@pytest_asyncio.fixture
+async def api_server(local_api):
+    """Starts a local server that issues short-lived JWTs and checks them."""
+    state = {"logins": 0, "lifetime": 0.2, "fail_login": False, "seen": []}
+    valid = {}
+
+    async def login(request):
+        if state["fail_login"]:
+            return web.json_response({"detail": "down"}, status=503)
+        state["logins"] += 1
+        now = time.time()
+        token = make_jwt(
+            sub="admin", n=state["logins"], iat=now, exp=now + state["lifetime"]
+        )
+        valid[token] = now + state["lifetime"]
+        return web.json_response({"access_token": token, "token_type": "bearer"})
+
+    async def servers(request):
+        token = request.headers.get("Authorization", "")[len("Bearer ") :]
+        state["seen"].append(token)
+        if valid.get(token, 0) < time.time():
+            return web.json_response({"detail": "expired"}, status=401)
+        return web.json_response({"status": "success", "servers": []})
+
+    app = web.Application()
+    app.router.add_post("/auth/token", login)
+    app.router.add_get("/api/servers", servers)
+    return await local_api(app, state=state)
+
+
+@pytest.mark.asyncio
+async def test_token_refreshed_in_background_before_expiry(api_server, make_client):
+    """The token is replaced before it expires without any 401 round trip."""
+    client = make_client(api_server, "admin", "pw")
+    await client.authenticate()
+    first = client._jwt_token
+    await asyncio.sleep(0.15)
+    assert api_server.state["logins"] == 2
+    assert client._jwt_token != first
+
+    await client.async_get_servers()
+    assert api_server.state["seen"] == [client._jwt_token]
+    await client.close()
+    assert client._token_refresh_task is None
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_current_token(api_server, make_client):
+    """A failed background refresh leaves the still-valid token in place."""
+    api_server.state["lifetime"] = 0.6
+    client = make_client(
+        api_server, "admin", "pw", token_refresh=TokenRefreshConfig(retry_interval=0.05)
+    )
+    await client.authenticate()
+    token = client._jwt_token
+    api_server.state["fail_login"] = True
+    # The first refresh attempt is due after half of the lifetime.
+    await asyncio.sleep(0.4)
+    assert client._jwt_token == token
+    await client.async_get_servers()
+
+    api_server.state["fail_login"] = False
+    await asyncio.sleep(0.1)
+    assert client._jwt_token != token
+
+
+@pytest.mark.asyncio
+async def test_401_logs_in_again_when_refresh_disabled(api_server, make_client):
+    """Without proactive refresh, an expired token is replaced after a 401."""
+    api_server.state["lifetime"] = 0.05
+    client = make_client(api_server, "admin", "pw", token_refresh=False)
+    await client.authenticate()
+    await asyncio.sleep(0.1)
+    result = await client.async_get_servers()
+    assert result.status == "success"
+    assert api_server.state["logins"] == 2
+    assert len(api_server.state["seen"]) == 2
+
+
+def test_expiry_uses_iat_for_fresh_tokens_and_skew_otherwise():
+    """Fresh tokens use exp - iat; other tokens use the wall clock minus skew."""
+    config = TokenRefreshConfig(refresh_margin=60, clock_skew=30)
+    # The local clock is far ahead of the server that issued the token.
+    token = make_jwt(iat=1000, exp=1900)
+    with patch("bsm_api_client.token_refresh.time.time", return_value=5000.0):
+        with patch("bsm_api_client.token_refresh.time.monotonic", return_value=10.0):
+            assert token_expires_at(token, config, issued_now=True) == 910.0
+            assert token_expires_at(token, config) < 10.0
+        with patch("bsm_api_client.token_refresh.time.monotonic", return_value=10.0):
+            assert refresh_delay(910.0, config) == 840.0
+            assert refresh_delay(50.0, config) == 20.0
+
+    assert token_expires_at("not-a-jwt", config) is None
+    assert token_expires_at(make_jwt(sub="x"), config) is None
+    assert decode_jwt_claims(make_jwt(exp=1))["exp"] == 1
+    with pytest.raises(ValueError):
+        decode_jwt_claims("a.!!!.c")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_login(api_server, make_client):
+    """500 concurrent requests without a token trigger a single login."""
+    api_server.state["lifetime"] = 60
+    client = make_client(api_server, "admin", "pw")
+    await asyncio.gather(*(client.async_get_servers() for _ in range(500)))
+    assert api_server.state["logins"] == 1
+    assert client._login_future is None
+
+
+@pytest.mark.asyncio
+async def test_valid_token_read_without_auth_lock(api_server, make_client):
+    """Requests with a valid token are not blocked while the lock is held."""
+    api_server.state["lifetime"] = 60
+    client = make_client(api_server, "admin", "pw")
+    await client.authenticate()
+    async with client._auth_lock:
+        result = await asyncio.wait_for(client.async_get_servers(), timeout=1)
+    assert result.status == "success"
@@ -0,0 +1,91 @@
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+import pytest
+import pytest_asyncio
+import aiohttp
+from aiohttp import web
+from bsm_api_client.api_client import BedrockServerManagerApi
+from bsm_api_client.exceptions import CannotConnectError
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Unix domain sockets are not available"
+)
+
+
+@pytest_asyncio.fixture
+async def unix_server():
+    """Serves a minimal manager API and WebSocket on a Unix domain socket."""
+    state = {"hosts": []}
+
+    async def login(request):
+        return web.json_response({"access_token": "token", "token_type": "bearer"})
+
+    async def servers(request):
+        state["hosts"].append(request.host)
+        return web.json_response(
+            {"status": "success", "servers": [{"name": "s1", "status": "RUNNING"}]}
+        )
+
+    async def ws_handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for msg in ws:
+            await ws.send_json({"echo": msg.json(), "token": request.query["token"]})
+        return ws
+
+    app = web.Application()
+    app.router.add_post("/auth/token", login)
+    app.router.add_get("/api/servers", servers)
+    app.router.add_get("/ws", ws_handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    # Keep the path short: socket paths are limited to ~100 bytes.
+    with tempfile.TemporaryDirectory(prefix="bsm") as tmp:
+        path = os.path.join(tmp, "manager.sock")
+        await web.UnixSite(runner, path).start()
+        yield SimpleNamespace(path=path, state=state)
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_unix_base_url(unix_server, make_client):
+    """A unix:// base URL sends requests and the WebSocket over the socket."""
+    client = make_client(f"unix://{unix_server.path}", username="admin", password="pw")
+    assert isinstance(client._session.connector, aiohttp.UnixConnector)
+    response = await client.async_get_servers()
+    assert [s["name"] for s in response.servers] == ["s1"]
+    assert unix_server.state["hosts"] == ["localhost"]
+
+    async with await client.websocket_connect() as ws:
+        await ws.subscribe("event:after_server_start")
+        message = await anext(ws.listen())
+    assert message["echo"]["topic"] == "event:after_server_start"
+    assert message["token"] == "token"
+
+
+@pytest.mark.asyncio
+async def test_unix_socket_option_keeps_host(unix_server, make_client):
+    """unix_socket= connects over the socket but keeps base_url's Host header."""
+    client = make_client("http://bsm.local:8080", unix_socket=unix_server.path)
+    await client.async_get_servers()
+    assert unix_server.state["hosts"] == ["bsm.local:8080"]
+    assert client.pool_stats().created == 1
+
+
+@pytest.mark.asyncio
+async def test_unix_socket_errors(tmp_path, make_client):
+    """Missing sockets raise CannotConnectError; conflicting options are rejected."""
+    missing = str(tmp_path / "missing.sock")
+    client = make_client(f"unix://{missing}")
+    with pytest.raises(CannotConnectError) as exc_info:
+        await client.async_get_servers()
+    assert missing in str(exc_info.value)
+
+    with pytest.raises(ValueError):
+        BedrockServerManagerApi("unix://", jwt_token="token")
+    with pytest.raises(ValueError):
+        BedrockServerManagerApi(
+            "unix:///run/a.sock", jwt_token="token", unix_socket="/run/b.sock"
+        )
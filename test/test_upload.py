@@ -0,0 +1,122 @@
+import time
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from bsm_api_client import upload
+from bsm_api_client.exceptions import InvalidInputError
+
+PAYLOAD = bytes(range(256)) * 1200  # 300 KiB
+
+
+@pytest_asyncio.fixture
+async def api_server(local_api):
+    """Starts a local server with an authenticated multipart upload endpoint."""
+    state = {"logins": 0, "uploads": [], "auth": []}
+
+    async def login(request):
+        state["logins"] += 1
+        return web.json_response({"access_token": "fresh", "token_type": "bearer"})
+
+    async def upload_handler(request):
+        reader = await request.multipart()
+        part = await reader.next()
+        body = await part.read()
+        state["auth"].append(request.headers.get("Authorization"))
+        if request.headers.get("Authorization") != "Bearer fresh":
+            return web.json_response({"detail": "expired"}, status=401)
+        if part.filename.endswith(".txt"):
+            return web.json_response({"detail": "Invalid file type"}, status=400)
+        state["uploads"].append((part.name, part.filename, body))
+        return web.json_response({"status": "success", "filename": part.filename})
+
+    app = web.Application(client_max_size=10 * 1024 * 1024)
+    app.router.add_post("/auth/token", login)
+    app.router.add_post("/api/content/upload", upload_handler)
+    return await local_api(app, state=state)
+
+
+@pytest.fixture
+def world_file(tmp_path):
+    path = tmp_path / "my_world.mcworld"
+    path.write_bytes(PAYLOAD)
+    return path
+
+
+@pytest.mark.asyncio
+async def test_upload_streams_file_and_reports_progress(
+    api_server, world_file, make_client
+):
+    """The file arrives intact and progress is reported per chunk."""
+    reports = []
+    client = make_client(api_server, jwt_token="fresh")
+    result = await client.async_upload_content(
+        str(world_file), progress=reports.append, chunk_size=64 * 1024
+    )
+    assert result == {"status": "success", "filename": "my_world.mcworld"}
+    assert api_server.state["uploads"] == [("file", "my_world.mcworld", PAYLOAD)]
+    assert [r.bytes_sent for r in reports] == [
+        min(n * 64 * 1024, len(PAYLOAD)) for n in range(1, 6)
+    ]
+    assert all(r.total_bytes == len(PAYLOAD) for r in reports)
+    assert reports[-1].done and reports[-1].fraction == 1.0
+    assert not reports[0].done
+
+
+@pytest.mark.asyncio
+async def test_upload_bandwidth_cap(api_server, world_file, make_client):
+    """max_bytes_per_second paces the upload; async callbacks are awaited."""
+    reports = []
+
+    async def on_progress(report):
+        reports.append(report)
+
+    client = make_client(api_server, jwt_token="fresh")
+    started = time.monotonic()
+    await client.async_upload_content(
+        str(world_file),
+        progress=on_progress,
+        max_bytes_per_second=len(PAYLOAD),
+        chunk_size=len(PAYLOAD) // 4,
+    )
+    # Three of the four chunks wait for budget: ~0.75s at the capped rate.
+    assert time.monotonic() - started >= 0.7
+    assert len(reports) == 4
+    assert reports[-1].rate <= len(PAYLOAD) * 1.4
+
+
+@pytest.mark.asyncio
+async def test_upload_refreshes_token_on_401(api_server, world_file, make_client):
+    """A 401 logs in once and streams the file again from the start."""
+    client = make_client(
+        api_server,
+        username="admin",
+        password="pw",
+        jwt_token="stale",
+        token_refresh=False,
+    )
+    await client.async_upload_content(str(world_file))
+    assert api_server.state["auth"] == ["Bearer stale", "Bearer fresh"]
+    assert api_server.state["logins"] == 1
+    assert api_server.state["uploads"][0][2] == PAYLOAD
+
+
+@pytest.mark.asyncio
+async def test_upload_closes_file(api_server, tmp_path, monkeypatch, make_client):
+    """The file handle is closed when the server rejects the upload."""
+    opened = []
+
+    def tracking_open(*args, **kwargs):
+        file = open(*args, **kwargs)
+        opened.append(file)
+        return file
+
+    monkeypatch.setattr(upload, "open", tracking_open, raising=False)
+    notes = tmp_path / "notes.txt"
+    notes.write_bytes(b"not a world")
+    client = make_client(api_server, jwt_token="fresh")
+    with pytest.raises(InvalidInputError):
+        await client.async_upload_content(str(notes))
+    with pytest.raises(FileNotFoundError):
+        await client.async_upload_content(str(tmp_path / "missing.mcworld"))
+    assert len(opened) == 1
+    assert all(file.closed for file in opened)
@@ -1,9 +1,15 @@
 import pytest
+import pytest_asyncio
 import asyncio
 from unittest.mock import MagicMock, AsyncMock
-from bsm_api_client.websocket_client import WebSocketClient
+from bsm_api_client.websocket_client import (
+    HeartbeatConfig,
+    ReconnectPolicy,
+    WebSocketClient,
+)
 from bsm_api_client.exceptions import APIError, AuthError
 import aiohttp
+from aiohttp import web
 
 
 @pytest.fixture
@@ -85,7 +91,7 @@ async def test_websocket_listen(mock_session, mock_ws_response):
     # Mocking iteration over messages
     msg1 = MagicMock()
     msg1.type = aiohttp.WSMsgType.TEXT
-    msg1.json.return_value = {"event": "test"}
+    msg1.data = '{"event": "test"}'
 
     msg2 = MagicMock()
     msg2.type = aiohttp.WSMsgType.CLOSED
@@ -114,3 +120,177 @@ async def test_context_manager(mock_session, mock_ws_response):
         assert client._ws == mock_ws_response
 
     mock_ws_response.close.assert_called_once()
+
+
+@pytest_asyncio.fixture
+async def ws_server(local_api):
+    """Starts a manager whose WebSocket drops the first connection."""
+    state = {"connections": [], "logins": 0, "accepted": {"t1"}, "down": False}
+
+    async def login(request):
+        state["logins"] += 1
+        state["accepted"] = {"t2"}
+        return web.json_response({"access_token": "t2", "token_type": "bearer"})
+
+    async def ws_handler(request):
+        if state["down"]:
+            raise web.HTTPServiceUnavailable()
+        if request.query.get("token") not in state["accepted"]:
+            raise web.HTTPUnauthorized()
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        topics = []
+        state["connections"].append(topics)
+        async for msg in ws:
+            data = msg.json()
+            topics.append(data["topic"])
+            await ws.send_json({"connection": len(state["connections"])})
+            if len(state["connections"]) == 1:
+                # Drop the first connection; later ones reject the old token.
+                state["accepted"] = set()
+                await ws.close()
+        return ws
+
+    app = web.Application()
+    app.router.add_post("/auth/token", login)
+    app.router.add_get("/ws", ws_handler)
+    return await local_api(app, state=state)
+
+
+@pytest.mark.asyncio
+async def test_websocket_reconnects_and_resubscribes(ws_server, make_client):
+    api = make_client(ws_server, "admin", "pw", jwt_token="t1")
+    policy = ReconnectPolicy(backoff_base=0.01)
+    async with await api.websocket_connect(reconnect=policy) as ws:
+        await ws.subscribe("event:after_server_start")
+        received = []
+        async for msg in ws.listen():
+            received.append(msg)
+            if len(received) == 2:
+                break
+        stats = ws.stats()
+
+    assert received == [{"connection": 1}, {"connection": 2}]
+    assert ws_server.state["connections"] == [
+        ["event:after_server_start"],
+        ["event:after_server_start"],
+    ]
+    # The old token was rejected once, then a fresh login was used.
+    assert ws_server.state["logins"] == 1
+    assert stats.reconnects == 1
+    assert stats.failed_attempts == 1
+    assert stats.connected
+    assert stats.last_gap > 0 and stats.max_gap == stats.total_gap == stats.last_gap
+    assert stats.subscriptions == ("event:after_server_start",)
+
+
+@pytest.mark.asyncio
+async def test_websocket_reconnect_gives_up(ws_server, make_client):
+    api = make_client(ws_server, jwt_token="t1")
+    policy = ReconnectPolicy(max_attempts=2, backoff_base=0.01)
+    ws = await api.websocket_connect(reconnect=policy)
+    async with ws:
+        await ws.subscribe("event:after_server_stop")
+        ws_server.state["down"] = True
+        with pytest.raises(APIError):
+            async for _ in ws.listen():
+                pass
+    assert ws.stats().failed_attempts == 2
+    assert ws.stats().reconnects == 0
+
+
+@pytest_asyncio.fixture
+async def heartbeat_server(local_api):
+    """Starts a manager whose connections are either healthy or silently dead.
+
+    A dead connection neither answers pings nor sends anything; a healthy
+    one answers pings and replies to each subscribe after a short delay.
+    """
+    state = {"modes": [], "connections": 0}
+
+    async def ws_handler(request):
+        mode = state["modes"].pop(0) if state["modes"] else "ok"
+        ws = web.WebSocketResponse(autoping=mode == "ok")
+        await ws.prepare(request)
+        state["connections"] += 1
+        connection = state["connections"]
+
+        async def reply():
+            await asyncio.sleep(0.1)
+            await ws.send_json({"connection": connection})
+
+        replies = []
+        async for msg in ws:
+            if mode == "ok" and msg.type == aiohttp.WSMsgType.TEXT:
+                # Keep reading meanwhile, which is when pings are answered.
+                replies.append(asyncio.create_task(reply()))
+        await asyncio.gather(*replies, return_exceptions=True)
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/ws", ws_handler)
+    return await local_api(app, state=state)
+
+
+async def _first_message(api, heartbeat, reconnect=None):
+    async with await api.websocket_connect(
+        reconnect=reconnect, heartbeat=heartbeat
+    ) as ws:
+        await ws.subscribe("event:after_server_start")
+        async for msg in ws.listen():
+            return msg, ws.stats()
+
+
+@pytest.mark.asyncio
+async def test_websocket_heartbeat_measures_rtt(heartbeat_server, make_client):
+    api = make_client(heartbeat_server, jwt_token="t")
+    heartbeat = HeartbeatConfig(interval=0.02, pong_timeout=1.0)
+    msg, stats = await _first_message(api, heartbeat)
+    pings = api.metrics.snapshot().get("PING", "/ws")
+
+    assert msg == {"connection": 1}
+    assert 0 < stats.rtt <= stats.rtt_max < 1.0
+    assert stats.missed_pongs == stats.idle_timeouts == 0
+    assert pings.count >= 1 and pings.error_count == 0
+
+
+@pytest.mark.asyncio
+async def test_websocket_missed_pong_reconnects(heartbeat_server, make_client):
+    heartbeat_server.state["modes"] = ["dead"]
+    api = make_client(heartbeat_server, jwt_token="t")
+    heartbeat = HeartbeatConfig(interval=0.02, pong_timeout=0.05, idle_timeout=None)
+    policy = ReconnectPolicy(backoff_base=0.01)
+    msg, stats = await _first_message(api, heartbeat, reconnect=policy)
+    pings = api.metrics.snapshot().get("PING", "/ws")
+
+    assert msg == {"connection": 2}
+    assert stats.missed_pongs == 1
+    assert stats.reconnects == 1
+    assert stats.subscriptions == ("event:after_server_start",)
+    # The missed pong is not a round-trip sample; later pings are.
+    assert pings.errors == {}
+    assert pings.latency_sum < pings.count * heartbeat.pong_timeout
+
+
+@pytest.mark.asyncio
+async def test_websocket_idle_timeout_reconnects(heartbeat_server, make_client):
+    heartbeat_server.state["modes"] = ["dead"]
+    api = make_client(heartbeat_server, jwt_token="t")
+    heartbeat = HeartbeatConfig(interval=10.0, idle_timeout=0.2)
+    policy = ReconnectPolicy(backoff_base=0.01)
+    msg, stats = await _first_message(api, heartbeat, reconnect=policy)
+
+    assert msg == {"connection": 2}
+    assert stats.idle_timeouts == 1
+    assert stats.missed_pongs == 0
+    assert stats.reconnects == 1
+
+
+def test_heartbeat_config_validation():
+    with pytest.raises(ValueError):
+        HeartbeatConfig(interval=0)
+    with pytest.raises(ValueError):
+        HeartbeatConfig(pong_timeout=-1)
+    with pytest.raises(ValueError):
+        HeartbeatConfig(idle_timeout=0)
+    assert HeartbeatConfig(idle_timeout=None).idle_timeout is None